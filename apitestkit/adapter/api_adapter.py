@@ -17,7 +17,6 @@ from apitestkit.core.config import config_manager
 from apitestkit.core.exceptions import ApiTestKitError
 from apitestkit.core.data_storage import data_storage_manager
 from apitestkit.performance import performance as create_performance_runner
-from apitestkit.performance.performance_runner import PerformanceRunner
 
 
 class ApiAdapter:
@@ -9,10 +9,294 @@ import json
 import re
 import time
 import asyncio
+import codecs
+from collections import Counter, deque
+from functools import lru_cache
 from typing import Any, Dict, List, Union, Callable, Optional, Pattern
 from dataclasses import dataclass
 from apitestkit.core.logger import logger_manager, create_user_logger
 
+# 尝试导入orjson（可选，用于加速JSON签名计算）
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# 尝试导入fastjsonschema（可选，用于加速JSON Schema验证）
+try:
+    import fastjsonschema
+    FASTJSONSCHEMA_AVAILABLE = True
+except ImportError:
+    FASTJSONSCHEMA_AVAILABLE = False
+
+
+# 需要先将实际值转换为字符串再比较的比较器
+_STRING_COMPARATORS = frozenset(('contains', 'not_contains', 'matches', 'not_matches'))
+
+# 深度比较中视为可互相比较的数值类型
+_NUMERIC_TYPES = frozenset((int, float))
+# 深度比较中按值直接比较的基本类型
+_SCALAR_TYPES = frozenset((str, int, float, bool, type(None)))
+
+
+def _json_signature(value):
+    """
+    计算JSON值的规范化签名（字典键排序），用于忽略顺序的多重集比较
+
+    Args:
+        value: JSON值
+
+    Returns:
+        bytes或str: 规范化签名
+
+    Raises:
+        TypeError: 值无法序列化时抛出
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(value, option=orjson.OPT_SORT_KEYS)
+    return json.dumps(value, sort_keys=True)
+
+
+def _preview(text, limit=100):
+    """
+    截取文本预览，超出长度时追加省略号
+
+    Args:
+        text: 原始文本
+        limit: 最大保留长度，默认为100
+
+    Returns:
+        str: 预览文本
+    """
+    return text[:limit] + '...' if text[limit:limit + 1] else text
+
+
+def _build_schema_validator(schema):
+    """
+    编译JSON Schema校验函数
+
+    优先使用fastjsonschema生成的校验函数，未安装时回退到jsonschema。
+
+    Args:
+        schema: JSON schema定义
+
+    Returns:
+        Callable: 校验函数，校验通过返回None，失败返回(错误信息, 错误路径)
+
+    Raises:
+        ImportError: 未安装任何JSON Schema库时抛出
+    """
+    if FASTJSONSCHEMA_AVAILABLE:
+        compiled = fastjsonschema.compile(schema)
+
+        def validate(instance):
+            try:
+                compiled(instance)
+            except fastjsonschema.JsonSchemaValueException as e:
+                # fastjsonschema的路径以根节点名'data'开头
+                return str(e), list(e.path or [])[1:]
+            return None
+
+        return validate
+
+    import jsonschema
+    from jsonschema.exceptions import best_match
+
+    validator_cls = jsonschema.validators.validator_for(schema)
+    validator_cls.check_schema(schema)
+    validator = validator_cls(schema)
+
+    def validate(instance):
+        error = best_match(validator.iter_errors(instance))
+        if error is None:
+            return None
+        return str(error), list(error.path)
+
+    return validate
+
+
+@lru_cache(maxsize=128)
+def _cached_schema_validator(schema_key):
+    """
+    按规范化的schema文本缓存编译后的校验函数
+
+    Args:
+        schema_key: 键排序后的schema JSON文本
+
+    Returns:
+        Callable: 校验函数
+    """
+    return _build_schema_validator(json.loads(schema_key))
+
+
+def _get_schema_validator(schema):
+    """
+    获取JSON Schema校验函数，相同的schema只编译一次
+
+    Args:
+        schema: JSON schema定义
+
+    Returns:
+        Callable: 校验函数
+    """
+    try:
+        schema_key = json.dumps(schema, sort_keys=True)
+    except (TypeError, ValueError):
+        # 无法序列化的schema不做缓存
+        return _build_schema_validator(schema)
+    return _cached_schema_validator(schema_key)
+
+
+def _as_float(value):
+    """
+    将值转换为浮点数，已经是浮点数时直接返回
+
+    Args:
+        value: 数值
+
+    Returns:
+        float: 浮点数
+    """
+    return value if type(value) is float else float(value)
+
+
+def _response_time(response):
+    """
+    获取响应对象的响应时间（秒），没有response_time属性时返回0.0
+
+    Args:
+        response: 响应对象
+
+    Returns:
+        float: 响应时间
+    """
+    try:
+        return _as_float(response.response_time)
+    except AttributeError:
+        return 0.0
+
+
+def _null_log(*args, **kwargs):
+    """
+    空日志函数，用于日志器缺少对应方法时占位
+    """
+
+
+def _format_path(path):
+    """
+    将路径片段列表拼接为JSON路径字符串
+
+    Args:
+        path: 路径片段列表，如 ['.data', '[0]']
+
+    Returns:
+        str: JSON路径字符串，如 '$.data[0]'
+    """
+    return "$" + "".join(path)
+
+
+def _deep_compare(actual, expected, ignore_order=False, path=None):
+    """
+    深度比较实际数据与期望数据
+
+    字典只要求期望中的键在实际数据中存在且值匹配，允许实际数据包含额外的键。
+
+    Args:
+        actual: 实际数据
+        expected: 期望数据
+        ignore_order: 是否忽略数组顺序
+        path: 当前比较位置的路径片段列表，只在生成错误信息时才拼接为字符串
+
+    Returns:
+        tuple: (是否匹配, 不匹配时的错误信息)
+    """
+    if path is None:
+        # 快速路径：整体相等且签名一致时直接返回，避免逐节点递归。
+        # ==会把True与1视为相等，签名比较保证布尔值与数值的规则与逐节点比较一致
+        if not ignore_order and actual == expected:
+            try:
+                if _json_signature(actual) == _json_signature(expected):
+                    return True, ""
+            except (TypeError, ValueError):
+                # 无法序列化的数据，回退到逐节点比较
+                pass
+        path = []
+
+    # 检查类型（int与float视为兼容的数值类型）
+    actual_type = type(actual)
+    expected_type = type(expected)
+    if actual_type is not expected_type and not (
+            actual_type in _NUMERIC_TYPES and expected_type in _NUMERIC_TYPES):
+        return False, f"{_format_path(path)}: 类型不匹配: 期望 {expected_type.__name__}, 实际 {actual_type.__name__}"
+    
+    # 比较基本类型
+    if expected_type in _SCALAR_TYPES or isinstance(expected, (str, int, float)):
+        if actual != expected:
+            return False, f"{_format_path(path)}: 值不匹配: 期望 {expected}, 实际 {actual}"
+        return True, ""
+    
+    # 比较字典
+    elif isinstance(expected, dict):
+        # 检查键是否存在
+        for key in expected:
+            if key not in actual:
+                return False, f"{_format_path(path)}.{key}: 键不存在"
+        
+        # 深度比较每个值
+        for key in expected:
+            path.append(f".{key}")
+            success, message = _deep_compare(actual[key], expected[key], ignore_order, path)
+            path.pop()
+            if not success:
+                return False, message
+        return True, ""
+    
+    # 比较列表
+    elif isinstance(expected, list):
+        if len(actual) != len(expected) and not ignore_order:
+            return False, f"{_format_path(path)}: 长度不匹配: 期望 {len(expected)}, 实际 {len(actual)}"
+        
+        if ignore_order:
+            # 忽略顺序比较，使用集合思想
+            # 这里简化处理，实际可能需要更复杂的比较逻辑
+            if len(actual) != len(expected):
+                return False, f"{_format_path(path)}: 长度不匹配: 期望 {len(expected)}, 实际 {len(actual)}"
+            
+            # 快速路径：比较元素签名的多重集，O(n)完成完全相等的情况
+            try:
+                if Counter(map(_json_signature, actual)) == Counter(map(_json_signature, expected)):
+                    return True, ""
+            except (TypeError, ValueError):
+                # 无法序列化的元素，回退到逐个匹配
+                pass
+            
+            # 签名不一致时仍需逐个匹配（字典允许实际值包含额外的键）
+            matched = set()
+            for i, exp_item in enumerate(expected):
+                found = False
+                for j, act_item in enumerate(actual):
+                    if j not in matched:
+                        success, _ = _deep_compare(act_item, exp_item, ignore_order)
+                        if success:
+                            matched.add(j)
+                            found = True
+                            break
+                if not found:
+                    return False, f"{_format_path(path)}[{i}]: 找不到匹配的元素 {exp_item}"
+            return True, ""
+        else:
+            # 按顺序比较
+            for i, (act_item, exp_item) in enumerate(zip(actual, expected)):
+                path.append(f"[{i}]")
+                success, message = _deep_compare(act_item, exp_item, ignore_order, path)
+                path.pop()
+                if not success:
+                    return False, message
+            return True, ""
+    
+    return False, f"{_format_path(path)}: 不支持的类型 {type(expected).__name__}"
+
 
 @dataclass
 class AssertionResult:
@@ -89,15 +373,62 @@ class ResponseAssertion:
         'all': '所有元素等于'
     }
     
-    def __init__(self, user_logger=None):
+    # 默认保留的失败断言记录上限
+    DEFAULT_MAX_FAILURES = 10000
+    
+    def __init__(self, user_logger=None, max_failures=None):
         """
         初始化断言器
         
         Args:
             user_logger: 用户日志记录器，如果为None则使用默认日志器
+            max_failures: 保留的失败断言记录上限，超出后丢弃最早的记录，默认为DEFAULT_MAX_FAILURES
         """
         self.user_logger = user_logger or create_user_logger("assertion_logger")
-        self.failed_assertions = []
+        self.max_failures = max_failures or self.DEFAULT_MAX_FAILURES
+        self.failed_assertions = deque(maxlen=self.max_failures)
+        # 预先解析所有比较器的(函数, 描述)，避免每次断言重复查找
+        self._resolved_comparators = {
+            name: (func, self._get_comparator_description(name))
+            for name, func in self.COMPARATORS.items()
+        }
+    
+    @property
+    def user_logger(self):
+        """
+        用户日志记录器
+        """
+        return self._user_logger
+    
+    @user_logger.setter
+    def user_logger(self, logger):
+        """
+        设置用户日志记录器，并预先绑定其info/error方法
+        
+        Args:
+            logger: 用户日志记录器
+        """
+        self._user_logger = logger
+        self._log_info = getattr(logger, 'info', None) or _null_log
+        self._log_error = getattr(logger, 'error', None) or _null_log
+        
+    def _resolve_comparator(self, comparator):
+        """
+        获取比较器函数及其描述
+        
+        Args:
+            comparator: 比较器名称
+            
+        Returns:
+            tuple: (比较器函数, 比较器描述)
+            
+        Raises:
+            ValueError: 当比较器不存在时抛出
+        """
+        try:
+            return self._resolved_comparators[comparator]
+        except KeyError:
+            return self._get_comparator(comparator), self._get_comparator_description(comparator)
         
     def _get_comparator(self, comparator):
         """
@@ -142,15 +473,12 @@ class ResponseAssertion:
             AssertionError: 断言失败时抛出
         """
         actual_status = response.status_code
-        comparator_func = self._get_comparator(comparator)
-        comparator_desc = self._get_comparator_description(comparator)
+        comparator_func, comparator_desc = self._resolve_comparator(comparator)
         
         try:
             assert comparator_func(actual_status, expected_status), \
                 f"状态码断言失败：期望 {comparator_desc} {expected_status}，实际 {actual_status}"
-            # 确保日志器正常工作
-            if hasattr(self.user_logger, 'info'):
-                self.user_logger.info(f"状态码断言成功：{actual_status} {comparator_desc} {expected_status}")
+            self._log_info("状态码断言成功：%s %s %s", actual_status, comparator_desc, expected_status)
             return True
         except AssertionError as e:
             error_message = str(e)
@@ -161,9 +489,7 @@ class ResponseAssertion:
                 'comparator': comparator,
                 'message': error_message
             })
-            # 确保日志器正常工作
-            if hasattr(self.user_logger, 'error'):
-                self.user_logger.error(error_message)
+            self._log_error(error_message)
             raise AssertionError(error_message)
     
     def assert_status_code_in(self, response, expected_statuses):
@@ -182,7 +508,7 @@ class ResponseAssertion:
         try:
             assert actual_status in expected_statuses, \
                 f"状态码断言失败：期望在 {expected_statuses} 中，实际 {actual_status}"
-            self.user_logger.info(f"状态码断言成功：{actual_status} 在 {expected_statuses} 中")
+            self._log_info("状态码断言成功：%s 在 %s 中", actual_status, expected_statuses)
             return True
         except AssertionError as e:
             self.failed_assertions.append({
@@ -191,7 +517,7 @@ class ResponseAssertion:
                 'actual': actual_status,
                 'message': str(e)
             })
-            self.user_logger.error(str(e))
+            self._log_error(str(e))
             raise
     
     def assert_status_code_not_in(self, response, unexpected_statuses):
@@ -210,9 +536,7 @@ class ResponseAssertion:
         try:
             assert actual_status not in unexpected_statuses, \
                 f"状态码断言失败：期望不在 {unexpected_statuses} 中，实际 {actual_status}"
-            # 确保日志器正常工作
-            if hasattr(self.user_logger, 'info'):
-                self.user_logger.info(f"状态码断言成功：{actual_status} 不在 {unexpected_statuses} 中")
+            self._log_info("状态码断言成功：%s 不在 %s 中", actual_status, unexpected_statuses)
             return True
         except AssertionError as e:
             error_message = str(e)
@@ -222,9 +546,7 @@ class ResponseAssertion:
                 'actual': actual_status,
                 'message': error_message
             })
-            # 确保日志器正常工作
-            if hasattr(self.user_logger, 'error'):
-                self.user_logger.error(error_message)
+            self._log_error(error_message)
             raise AssertionError(error_message)
     
     def _extract_json_path(self, json_data, json_path):
@@ -384,8 +706,7 @@ class ResponseAssertion:
             json_data = response.json()
             actual_value = self._extract_json_path(json_data, json_path)
             
-            compare_func = self._get_comparator(comparator)
-            comparator_desc = self._get_comparator_description(comparator)
+            compare_func, comparator_desc = self._resolve_comparator(comparator)
             
             # 执行比较
             comparison_result = False
@@ -410,15 +731,11 @@ class ResponseAssertion:
                     'message': error_message
                 })
                 
-                # 安全地记录错误
-                if hasattr(self.user_logger, 'error'):
-                    self.user_logger.error(error_message)
+                self._log_error(error_message)
                     
                 raise AssertionError(error_message)
             
-            # 安全地记录成功日志
-            if hasattr(self.user_logger, 'info'):
-                self.user_logger.info(f"JSON路径断言成功：路径 '{json_path}' 值 {comparator_desc} {expected_value}")
+            self._log_info("JSON路径断言成功：路径 '%s' 值 %s %s", json_path, comparator_desc, expected_value)
                 
             return True
         except AssertionError:
@@ -427,17 +744,14 @@ class ResponseAssertion:
         except (ValueError, TypeError) as e:
             error_message = f"JSON解析失败: {str(e)}"
             
-            # 安全地记录错误
-            if hasattr(self.user_logger, 'error'):
-                self.user_logger.error(error_message)
+            self._log_error(error_message)
                 
             raise AssertionError(error_message)
         except Exception as e:
             # 处理其他异常
             error_message = f"JSON路径断言出错：{str(e)}"
             
-            if hasattr(self.user_logger, 'error'):
-                self.user_logger.error(error_message)
+            self._log_error(error_message)
                 
             raise AssertionError(error_message)
     
@@ -467,22 +781,17 @@ class ResponseAssertion:
                         'message': error_message
                     })
                 
-                if hasattr(self, 'user_logger') and hasattr(self.user_logger, 'error'):
-                    self.user_logger.error(error_message)
+                self._log_error(error_message)
                     
                 raise AssertionError(error_message)
             
-            # 安全地记录成功日志
-            if hasattr(self, 'user_logger') and hasattr(self.user_logger, 'info'):
-                self.user_logger.info(f"JSON路径存在断言成功：路径 '{json_path}' 存在")
+            self._log_info("JSON路径存在断言成功：路径 '%s' 存在", json_path)
                 
             return True
         except (ValueError, TypeError) as e:
             error_message = f"JSON解析失败: {str(e)}"
             
-            # 安全地记录错误
-            if hasattr(self, 'user_logger') and hasattr(self.user_logger, 'error'):
-                self.user_logger.error(error_message)
+            self._log_error(error_message)
                 
             raise AssertionError(error_message)
         except AssertionError:
@@ -492,8 +801,7 @@ class ResponseAssertion:
             # 处理其他未预期的异常
             error_message = f"JSON路径断言错误：路径 '{json_path}' 出现错误: {str(e)}"
             
-            if hasattr(self, 'user_logger') and hasattr(self.user_logger, 'error'):
-                self.user_logger.error(error_message)
+            self._log_error(error_message)
                 
             raise AssertionError(error_message)
     
@@ -527,24 +835,19 @@ class ResponseAssertion:
                         'message': error_message
                     })
                 
-                # 安全地记录错误
-                if hasattr(self, 'user_logger') and hasattr(self.user_logger, 'error'):
-                    self.user_logger.error(error_message)
+                self._log_error(error_message)
                 
                 # 抛出断言失败错误
                 raise AssertionError(error_message)
             else:
                 # 路径不存在，断言成功
-                if hasattr(self, 'user_logger') and hasattr(self.user_logger, 'info'):
-                    self.user_logger.info(f"JSON路径不存在断言成功：路径 '{json_path}' 不存在")
+                self._log_info("JSON路径不存在断言成功：路径 '%s' 不存在", json_path)
                 return True
                 
         except (ValueError, TypeError) as e:
             error_message = f"JSON解析失败: {str(e)}"
             
-            # 安全地记录错误
-            if hasattr(self, 'user_logger') and hasattr(self.user_logger, 'error'):
-                self.user_logger.error(error_message)
+            self._log_error(error_message)
                 
             raise AssertionError(error_message)
     
@@ -580,15 +883,11 @@ class ResponseAssertion:
                     'message': error_message
                 })
                 
-                # 安全地记录错误
-                if hasattr(self.user_logger, 'error'):
-                    self.user_logger.error(error_message)
+                self._log_error(error_message)
                     
                 raise AssertionError(error_message)
             
-            # 安全地记录成功日志
-            if hasattr(self.user_logger, 'info'):
-                self.user_logger.info(f"JSON路径包含断言成功：路径 '{json_path}' 的值包含 '{expected_substring}'")
+            self._log_info("JSON路径包含断言成功：路径 '%s' 的值包含 '%s'", json_path, expected_substring)
                 
             return True
         except AssertionError:
@@ -597,17 +896,14 @@ class ResponseAssertion:
         except (ValueError, TypeError) as e:
             error_message = f"JSON解析失败: {str(e)}"
             
-            # 安全地记录错误
-            if hasattr(self.user_logger, 'error'):
-                self.user_logger.error(error_message)
+            self._log_error(error_message)
                 
             raise AssertionError(error_message)
         except Exception as e:
             # 处理其他异常
             error_message = f"JSON路径包含断言出错：{str(e)}"
             
-            if hasattr(self.user_logger, 'error'):
-                self.user_logger.error(error_message)
+            self._log_error(error_message)
                 
             raise AssertionError(error_message)
     
@@ -633,12 +929,10 @@ class ResponseAssertion:
                 actual_length = len(actual_value)
             except (TypeError, AttributeError):
                 error_message = f"无法获取路径 '{json_path}' 值的长度"
-                if hasattr(self.user_logger, 'error'):
-                    self.user_logger.error(error_message)
+                self._log_error(error_message)
                 raise AssertionError(error_message)
             
-            compare_func = self._get_comparator(comparator)
-            comparator_desc = self._get_comparator_description(comparator)
+            compare_func, comparator_desc = self._resolve_comparator(comparator)
             
             # 执行比较
             if not compare_func(actual_length, expected_length):
@@ -654,15 +948,11 @@ class ResponseAssertion:
                     'message': error_message
                 })
                 
-                # 安全地记录错误
-                if hasattr(self.user_logger, 'error'):
-                    self.user_logger.error(error_message)
+                self._log_error(error_message)
                     
                 raise AssertionError(error_message)
             
-            # 安全地记录成功日志
-            if hasattr(self.user_logger, 'info'):
-                self.user_logger.info(f"JSON路径长度断言成功：路径 '{json_path}' 长度 {comparator_desc} {expected_length}")
+            self._log_info("JSON路径长度断言成功：路径 '%s' 长度 %s %s", json_path, comparator_desc, expected_length)
                 
             return True
         except AssertionError:
@@ -671,17 +961,14 @@ class ResponseAssertion:
         except (ValueError, TypeError) as e:
             error_message = f"JSON解析失败: {str(e)}"
             
-            # 安全地记录错误
-            if hasattr(self.user_logger, 'error'):
-                self.user_logger.error(error_message)
+            self._log_error(error_message)
                 
             raise AssertionError(error_message)
         except Exception as e:
             # 处理其他异常
             error_message = f"JSON路径长度断言出错：{str(e)}"
             
-            if hasattr(self.user_logger, 'error'):
-                self.user_logger.error(error_message)
+            self._log_error(error_message)
                 
             raise AssertionError(error_message)
     
@@ -734,29 +1021,24 @@ class ResponseAssertion:
                         'message': error_message
                     })
                 
-                if hasattr(self, 'user_logger') and hasattr(self.user_logger, 'error'):
-                    self.user_logger.error(error_message)
+                self._log_error(error_message)
                 
                 raise AssertionError(error_message)
             
-            # 安全地记录成功日志
-            if hasattr(self, 'user_logger') and hasattr(self.user_logger, 'info'):
-                self.user_logger.info(f"JSON路径类型断言成功：路径 '{json_path}' 类型为 {expected_type}")
+            self._log_info("JSON路径类型断言成功：路径 '%s' 类型为 %s", json_path, expected_type)
             
             return True
         except (ValueError, TypeError) as e:
             error_msg = f"JSON解析失败: {str(e)}"
             
-            if hasattr(self, 'user_logger') and hasattr(self.user_logger, 'error'):
-                self.user_logger.error(error_msg)
+            self._log_error(error_msg)
             
             raise AssertionError(error_msg)
         except Exception as e:
             # 处理其他异常
             error_message = f"JSON路径类型断言出错：{str(e)}"
             
-            if hasattr(self, 'user_logger') and hasattr(self.user_logger, 'error'):
-                self.user_logger.error(error_message)
+            self._log_error(error_message)
             
             raise AssertionError(error_message)
     
@@ -779,11 +1061,11 @@ class ResponseAssertion:
             assert actual_value in expected_values, \
                 f"JSON路径包含于断言失败：路径 '{json_path}' 的值 {actual_value} 不在 {expected_values} 中"
             
-            self.user_logger.info(f"JSON路径包含于断言成功：路径 '{json_path}' 的值 {actual_value} 在 {expected_values} 中")
+            self._log_info("JSON路径包含于断言成功：路径 '%s' 的值 %s 在 %s 中", json_path, actual_value, expected_values)
             return True
         except (ValueError, TypeError) as e:
             error_msg = f"JSON解析失败: {str(e)}"
-            self.user_logger.error(error_msg)
+            self._log_error(error_msg)
             raise AssertionError(error_msg)
     
     def assert_json_path_not_in(self, response, json_path, unexpected_values):
@@ -805,11 +1087,11 @@ class ResponseAssertion:
             assert actual_value not in unexpected_values, \
                 f"JSON路径不包含于断言失败：路径 '{json_path}' 的值 {actual_value} 在 {unexpected_values} 中"
             
-            self.user_logger.info(f"JSON路径不包含于断言成功：路径 '{json_path}' 的值 {actual_value} 不在 {unexpected_values} 中")
+            self._log_info("JSON路径不包含于断言成功：路径 '%s' 的值 %s 不在 %s 中", json_path, actual_value, unexpected_values)
             return True
         except (ValueError, TypeError) as e:
             error_msg = f"JSON解析失败: {str(e)}"
-            self.user_logger.error(error_msg)
+            self._log_error(error_msg)
             raise AssertionError(error_msg)
     
     def assert_json_path_regex(self, response, json_path, regex_pattern):
@@ -834,11 +1116,11 @@ class ResponseAssertion:
             assert match is not None, \
                 f"JSON路径正则匹配失败：路径 '{json_path}' 的值 '{actual_value}' 不匹配模式 '{regex_pattern}'"
             
-            self.user_logger.info(f"JSON路径正则匹配成功：路径 '{json_path}' 的值匹配模式 '{regex_pattern}'")
+            self._log_info("JSON路径正则匹配成功：路径 '%s' 的值匹配模式 '%s'", json_path, regex_pattern)
             return True
         except (ValueError, TypeError) as e:
             error_msg = f"JSON解析失败: {str(e)}"
-            self.user_logger.error(error_msg)
+            self._log_error(error_msg)
             raise AssertionError(error_msg)
     
     def assert_json_deep_equal(self, response, expected_data, ignore_order=False):
@@ -853,78 +1135,17 @@ class ResponseAssertion:
         Raises:
             AssertionError: 断言失败时抛出
         """
-        def _deep_compare(actual, expected, path="$"):
-            """深度比较函数"""
-            # 检查类型
-            if type(actual) != type(expected):
-                return False, f"{path}: 类型不匹配: 期望 {type(expected).__name__}, 实际 {type(actual).__name__}"
-            
-            # 比较基本类型
-            if isinstance(expected, (str, int, float, bool, type(None))):
-                if actual != expected:
-                    return False, f"{path}: 值不匹配: 期望 {expected}, 实际 {actual}"
-                return True, ""
-            
-            # 比较字典
-            elif isinstance(expected, dict):
-                # 检查键是否存在
-                for key in expected:
-                    if key not in actual:
-                        return False, f"{path}.{key}: 键不存在"
-                
-                # 深度比较每个值
-                for key in expected:
-                    success, message = _deep_compare(actual[key], expected[key], f"{path}.{key}")
-                    if not success:
-                        return False, message
-                return True, ""
-            
-            # 比较列表
-            elif isinstance(expected, list):
-                if len(actual) != len(expected) and not ignore_order:
-                    return False, f"{path}: 长度不匹配: 期望 {len(expected)}, 实际 {len(actual)}"
-                
-                if ignore_order:
-                    # 忽略顺序比较，使用集合思想
-                    # 这里简化处理，实际可能需要更复杂的比较逻辑
-                    if len(actual) != len(expected):
-                        return False, f"{path}: 长度不匹配: 期望 {len(expected)}, 实际 {len(actual)}"
-                    
-                    # 尝试匹配每个元素
-                    matched = set()
-                    for i, exp_item in enumerate(expected):
-                        found = False
-                        for j, act_item in enumerate(actual):
-                            if j not in matched:
-                                success, _ = _deep_compare(act_item, exp_item)
-                                if success:
-                                    matched.add(j)
-                                    found = True
-                                    break
-                        if not found:
-                            return False, f"{path}[{i}]: 找不到匹配的元素 {exp_item}"
-                    return True, ""
-                else:
-                    # 按顺序比较
-                    for i, (act_item, exp_item) in enumerate(zip(actual, expected)):
-                        success, message = _deep_compare(act_item, exp_item, f"{path}[{i}]")
-                        if not success:
-                            return False, message
-                    return True, ""
-            
-            return False, f"{path}: 不支持的类型 {type(expected).__name__}"
-        
         try:
             actual_data = response.json()
-            success, message = _deep_compare(actual_data, expected_data)
+            success, message = _deep_compare(actual_data, expected_data, ignore_order)
             
             assert success, f"JSON深度比较失败: {message}"
             
-            self.user_logger.info(f"JSON深度比较成功")
+            self._log_info("JSON深度比较成功")
             return True
         except (ValueError, TypeError) as e:
             error_msg = f"JSON解析失败: {str(e)}"
-            self.user_logger.error(error_msg)
+            self._log_error(error_msg)
             raise AssertionError(error_msg)
     
     def assert_response_time(self, response, expected_time, comparator='lte'):
@@ -939,16 +1160,12 @@ class ResponseAssertion:
         Raises:
             AssertionError: 断言失败时抛出
         """
-        comparator_func = self._get_comparator(comparator)
-        comparator_desc = self._get_comparator_description(comparator)
+        comparator_func, comparator_desc = self._resolve_comparator(comparator)
         
         try:
-            # 从响应对象获取响应时间
-            actual_time = getattr(response, 'response_time', 0)
-            
-            # 确保值都是数字类型
-            actual_time = float(actual_time)
-            expected_time = float(expected_time)
+            # 从响应对象获取响应时间，并确保值都是浮点数
+            actual_time = _response_time(response)
+            expected_time = _as_float(expected_time)
             
             # 执行比较
             comparison_result = comparator_func(actual_time, expected_time)
@@ -965,15 +1182,11 @@ class ResponseAssertion:
                     'message': error_message
                 })
                 
-                # 安全地记录错误
-                if hasattr(self.user_logger, 'error'):
-                    self.user_logger.error(error_message)
+                self._log_error(error_message)
                     
                 raise AssertionError(error_message)
             
-            # 安全地记录成功日志
-            if hasattr(self.user_logger, 'info'):
-                self.user_logger.info(f"响应时间断言成功：{actual_time:.2f}秒 {comparator_desc} {expected_time}秒")
+            self._log_info("响应时间断言成功：%.2f秒 %s %s秒", actual_time, comparator_desc, expected_time)
                 
             return True
         except AssertionError:
@@ -983,8 +1196,7 @@ class ResponseAssertion:
             # 处理其他异常
             error_message = f"响应时间断言出错：{str(e)}"
             
-            if hasattr(self.user_logger, 'error'):
-                self.user_logger.error(error_message)
+            self._log_error(error_message)
                 
             raise AssertionError(error_message)
     
@@ -1001,13 +1213,10 @@ class ResponseAssertion:
             AssertionError: 断言失败时抛出
         """
         try:
-            # 从响应对象获取响应时间
-            actual_time = getattr(response, 'response_time', 0)
-            
-            # 确保所有值都是数字类型
-            actual_time = float(actual_time)
-            min_time = float(min_time)
-            max_time = float(max_time)
+            # 从响应对象获取响应时间，并确保所有值都是浮点数
+            actual_time = _response_time(response)
+            min_time = _as_float(min_time)
+            max_time = _as_float(max_time)
             
             # 执行范围检查
             in_range = min_time <= actual_time <= max_time
@@ -1023,15 +1232,11 @@ class ResponseAssertion:
                     'message': error_message
                 })
                 
-                # 安全地记录错误
-                if hasattr(self.user_logger, 'error'):
-                    self.user_logger.error(error_message)
+                self._log_error(error_message)
                     
                 raise AssertionError(error_message)
             
-            # 安全地记录成功日志
-            if hasattr(self.user_logger, 'info'):
-                self.user_logger.info(f"响应时间范围断言成功：{actual_time:.2f}秒 在 [{min_time}, {max_time}]秒 之间")
+            self._log_info("响应时间范围断言成功：%.2f秒 在 [%s, %s]秒 之间", actual_time, min_time, max_time)
                 
             return True
         except AssertionError:
@@ -1041,8 +1246,7 @@ class ResponseAssertion:
             # 处理其他异常
             error_message = f"响应时间范围断言出错：{str(e)}"
             
-            if hasattr(self.user_logger, 'error'):
-                self.user_logger.error(error_message)
+            self._log_error(error_message)
                 
             raise AssertionError(error_message)
     
@@ -1060,7 +1264,7 @@ class ResponseAssertion:
         try:
             assert header_name in response.headers, \
                 f"响应头断言失败：未找到头信息 '{header_name}'"
-            self.user_logger.info(f"响应头断言成功：找到头信息 '{header_name}'")
+            self._log_info("响应头断言成功：找到头信息 '%s'", header_name)
             return True
         except AssertionError as e:
             self.failed_assertions.append({
@@ -1069,7 +1273,7 @@ class ResponseAssertion:
                 'actual': None,
                 'message': str(e)
             })
-            self.user_logger.error(str(e))
+            self._log_error(str(e))
             raise
     
     def assert_header_not_exists(self, response, header_name):
@@ -1086,7 +1290,7 @@ class ResponseAssertion:
         try:
             assert header_name not in response.headers, \
                 f"响应头断言失败：找到不期望的头信息 '{header_name}'"
-            self.user_logger.info(f"响应头不存在断言成功：未找到头信息 '{header_name}'")
+            self._log_info("响应头不存在断言成功：未找到头信息 '%s'", header_name)
             return True
         except AssertionError as e:
             self.failed_assertions.append({
@@ -1095,7 +1299,7 @@ class ResponseAssertion:
                 'actual': header_name,
                 'message': str(e)
             })
-            self.user_logger.error(str(e))
+            self._log_error(str(e))
             raise
     
     def assert_header_value(self, response, header_name, expected_value, comparator='eq'):
@@ -1111,32 +1315,33 @@ class ResponseAssertion:
         Raises:
             AssertionError: 断言失败时抛出
         """
+        # 只查找一次响应头（requests的头字典每次查找都要做大小写转换）
+        actual_value = response.headers.get(header_name)
         try:
-            assert header_name in response.headers, \
+            assert actual_value is not None, \
                 f"响应头断言失败：未找到头信息 '{header_name}'"
             
-            actual_value = response.headers[header_name]
-            compare_func = self._get_comparator(comparator)
+            compare_func, comparator_desc = self._resolve_comparator(comparator)
             
             # 对于某些比较器（如contains, matches），确保两边都是可比较的类型
-            if comparator in ['contains', 'not_contains', 'matches', 'not_matches']:
+            if comparator in _STRING_COMPARATORS:
                 assert compare_func(str(actual_value), expected_value), \
-                    f"响应头值断言失败：头 '{header_name}' 期望 {self._get_comparator_description(comparator)} '{expected_value}'，实际 '{actual_value}'"
+                    f"响应头值断言失败：头 '{header_name}' 期望 {comparator_desc} '{expected_value}'，实际 '{actual_value}'"
             else:
                 assert compare_func(actual_value, expected_value), \
-                    f"响应头值断言失败：头 '{header_name}' 期望 {self._get_comparator_description(comparator)} '{expected_value}'，实际 '{actual_value}'"
+                    f"响应头值断言失败：头 '{header_name}' 期望 {comparator_desc} '{expected_value}'，实际 '{actual_value}'"
             
-            self.user_logger.info(f"响应头值断言成功：头 '{header_name}' 值 {self._get_comparator_description(comparator)} '{expected_value}'")
+            self._log_info("响应头值断言成功：头 '%s' 值 %s '%s'", header_name, comparator_desc, expected_value)
             return True
         except AssertionError as e:
             self.failed_assertions.append({
                 'type': 'header_value',
                 'expected': expected_value,
-                'actual': response.headers.get(header_name),
+                'actual': actual_value,
                 'comparator': comparator,
                 'message': str(e)
             })
-            self.user_logger.error(str(e))
+            self._log_error(str(e))
             raise
     
     def assert_header_contains(self, response, header_name, expected_substring):
@@ -1151,26 +1356,51 @@ class ResponseAssertion:
         Raises:
             AssertionError: 断言失败时抛出
         """
+        actual_value = response.headers.get(header_name)
         try:
-            assert header_name in response.headers, \
+            assert actual_value is not None, \
                 f"响应头断言失败：未找到头信息 '{header_name}'"
             
-            actual_value = response.headers[header_name]
             assert expected_substring in actual_value, \
                 f"响应头包含断言失败：头 '{header_name}' 的值 '{actual_value}' 不包含 '{expected_substring}'"
             
-            self.user_logger.info(f"响应头包含断言成功：头 '{header_name}' 的值包含 '{expected_substring}'")
+            self._log_info("响应头包含断言成功：头 '%s' 的值包含 '%s'", header_name, expected_substring)
             return True
         except AssertionError as e:
             self.failed_assertions.append({
                 'type': 'header_contains',
                 'expected': expected_substring,
-                'actual': response.headers.get(header_name),
+                'actual': actual_value,
                 'message': str(e)
             })
-            self.user_logger.error(str(e))
+            self._log_error(str(e))
             raise
     
+    def _response_contains(self, response, content):
+        """
+        判断响应体是否包含指定内容
+        
+        优先在原始字节上做子串查找，避免为一次包含判断解码整个响应体；
+        无法安全按字节比较时回退到response.text。
+        
+        Args:
+            response: 响应对象
+            content: 要查找的内容
+            
+        Returns:
+            bool: 响应体包含该内容时返回True
+        """
+        body = getattr(response, 'content', None)
+        if isinstance(content, str) and isinstance(body, (bytes, bytearray)):
+            encoding = getattr(response, 'encoding', None) or 'utf-8'
+            try:
+                # UTF-16/32等多字节编码按字节查找可能错位匹配，不走快速路径
+                if not codecs.lookup(encoding).name.startswith(('utf-16', 'utf-32')):
+                    return content.encode(encoding) in body
+            except (LookupError, UnicodeEncodeError):
+                pass
+        return content in response.text
+    
     def assert_response_contains(self, response, expected_content):
         """
         断言响应内容包含指定字符串
@@ -1183,18 +1413,18 @@ class ResponseAssertion:
             AssertionError: 断言失败时抛出
         """
         try:
-            assert expected_content in response.text, \
+            assert self._response_contains(response, expected_content), \
                 f"响应内容断言失败：响应不包含 '{expected_content}'"
-            self.user_logger.info(f"响应内容断言成功：响应包含 '{expected_content}'")
+            self._log_info("响应内容断言成功：响应包含 '%s'", expected_content)
             return True
         except AssertionError as e:
             self.failed_assertions.append({
                 'type': 'response_contains',
                 'expected': expected_content,
-                'actual': response.text[:100] + '...' if len(response.text) > 100 else response.text,
+                'actual': _preview(response.text),
                 'message': str(e)
             })
-            self.user_logger.error(str(e))
+            self._log_error(str(e))
             raise
     
     def assert_response_not_contains(self, response, unexpected_content):
@@ -1209,9 +1439,9 @@ class ResponseAssertion:
             AssertionError: 断言失败时抛出
         """
         try:
-            assert unexpected_content not in response.text, \
+            assert not self._response_contains(response, unexpected_content), \
                 f"响应内容断言失败：响应包含不期望的内容 '{unexpected_content}'"
-            self.user_logger.info(f"响应内容不包含断言成功：响应不包含 '{unexpected_content}'")
+            self._log_info("响应内容不包含断言成功：响应不包含 '%s'", unexpected_content)
             return True
         except AssertionError as e:
             self.failed_assertions.append({
@@ -1220,10 +1450,38 @@ class ResponseAssertion:
                 'actual': unexpected_content,
                 'message': str(e)
             })
-            self.user_logger.error(str(e))
+            self._log_error(str(e))
             raise
     
-    def assert_response_length(self, response, expected_length, comparator='eq'):
+    def _response_length(self, response, unit):
+        """
+        获取响应内容长度
+        
+        Args:
+            response: 响应对象
+            unit: 长度单位，'chars'为解码后的字符数，'bytes'为原始字节数
+            
+        Returns:
+            int: 响应内容长度
+            
+        Raises:
+            ValueError: 当长度单位不支持时抛出
+        """
+        if unit == 'chars':
+            return len(response.text)
+        if unit == 'bytes':
+            # 未压缩的响应可直接使用Content-Length头，无需读取响应体
+            headers = getattr(response, 'headers', None) or {}
+            content_length = headers.get('Content-Length')
+            if content_length is not None and not headers.get('Content-Encoding'):
+                try:
+                    return int(content_length)
+                except (TypeError, ValueError):
+                    pass
+            return len(response.content)
+        raise ValueError(f"不支持的长度单位: {unit}. 可用的长度单位: chars, bytes")
+    
+    def assert_response_length(self, response, expected_length, comparator='eq', unit='chars'):
         """
         断言响应内容长度
         
@@ -1231,17 +1489,20 @@ class ResponseAssertion:
             response: 响应对象
             expected_length: 期望的长度
             comparator: 比较器，默认为'eq'（等于）
+            unit: 长度单位，'chars'（默认）按解码后的字符数计算，
+                'bytes'按原始字节数计算，优先使用Content-Length头
             
         Raises:
             AssertionError: 断言失败时抛出
+            ValueError: 当长度单位不支持时抛出
         """
-        actual_length = len(response.text)
-        compare_func = self._get_comparator(comparator)
+        actual_length = self._response_length(response, unit)
+        compare_func, comparator_desc = self._resolve_comparator(comparator)
         
         try:
             assert compare_func(actual_length, expected_length), \
-                f"响应长度断言失败：期望 {self._get_comparator_description(comparator)} {expected_length}，实际 {actual_length}"
-            self.user_logger.info(f"响应长度断言成功：{actual_length} {self._get_comparator_description(comparator)} {expected_length}")
+                f"响应长度断言失败：期望 {comparator_desc} {expected_length}，实际 {actual_length}"
+            self._log_info("响应长度断言成功：%s %s %s", actual_length, comparator_desc, expected_length)
             return True
         except AssertionError as e:
             self.failed_assertions.append({
@@ -1251,7 +1512,7 @@ class ResponseAssertion:
                 'comparator': comparator,
                 'message': str(e)
             })
-            self.user_logger.error(str(e))
+            self._log_error(str(e))
             raise
     
     def assert_response_matches(self, response, regex_pattern):
@@ -1272,16 +1533,16 @@ class ResponseAssertion:
             
             # 记录匹配的内容
             matched_content = match.group(0) if match else ""
-            self.user_logger.info(f"响应正则匹配断言成功：响应匹配模式 '{regex_pattern}'，匹配内容: '{matched_content}'")
+            self._log_info("响应正则匹配断言成功：响应匹配模式 '%s'，匹配内容: '%s'", regex_pattern, matched_content)
             return True
         except AssertionError as e:
             self.failed_assertions.append({
                 'type': 'response_matches',
                 'expected': regex_pattern,
-                'actual': response.text[:100] + '...' if len(response.text) > 100 else response.text,
+                'actual': _preview(response.text),
                 'message': str(e)
             })
-            self.user_logger.error(str(e))
+            self._log_error(str(e))
             raise
     
     def assert_response_not_matches(self, response, regex_pattern):
@@ -1300,7 +1561,7 @@ class ResponseAssertion:
             assert match is None, \
                 f"响应正则不匹配断言失败：响应匹配了不期望的模式 '{regex_pattern}'"
             
-            self.user_logger.info(f"响应正则不匹配断言成功：响应不匹配模式 '{regex_pattern}'")
+            self._log_info("响应正则不匹配断言成功：响应不匹配模式 '%s'", regex_pattern)
             return True
         except AssertionError as e:
             self.failed_assertions.append({
@@ -1309,13 +1570,14 @@ class ResponseAssertion:
                 'actual': regex_pattern,
                 'message': str(e)
             })
-            self.user_logger.error(str(e))
+            self._log_error(str(e))
             raise
     
     def assert_json_schema(self, response, schema):
         """
         断言JSON响应符合指定的schema
-        注意：此功能需要安装jsonschema库
+        注意：此功能需要安装jsonschema库，安装fastjsonschema后会优先使用以加速验证；
+        编译后的schema会被缓存，相同schema的重复验证无需重新编译
         
         Args:
             response: 响应对象
@@ -1325,38 +1587,36 @@ class ResponseAssertion:
             AssertionError: 断言失败时抛出
         """
         try:
-            import jsonschema
-            from jsonschema import validate, ValidationError as JsonSchemaValidationError
-            
             json_data = response.json()
-            validate(instance=json_data, schema=schema)
-            
-            self.user_logger.info("JSON Schema验证成功")
-            return True
+            failure = _get_schema_validator(schema)(json_data)
         except ImportError:
             error_msg = "JSON Schema验证需要安装jsonschema库：pip install jsonschema"
-            self.user_logger.error(error_msg)
-            raise AssertionError(error_msg)
-        except JsonSchemaValidationError as e:
-            # 美化错误消息
-            error_msg = f"JSON Schema验证失败: {str(e)}"
-            # 尝试提取更详细的路径信息
-            if hasattr(e, 'path') and e.path:
-                path_str = '.'.join(str(p) for p in e.path)
-                error_msg += f"，路径: {path_str}"
-            
-            self.failed_assertions.append({
-                'type': 'json_schema',
-                'expected': schema,
-                'actual': response.json(),
-                'message': error_msg
-            })
-            self.user_logger.error(error_msg)
+            self._log_error(error_msg)
             raise AssertionError(error_msg)
         except (ValueError, TypeError) as e:
             error_msg = f"JSON解析失败: {str(e)}"
-            self.user_logger.error(error_msg)
+            self._log_error(error_msg)
             raise AssertionError(error_msg)
+        
+        if failure is None:
+            self._log_info("JSON Schema验证成功")
+            return True
+        
+        # 美化错误消息，并附加更详细的路径信息
+        message, path = failure
+        error_msg = f"JSON Schema验证失败: {message}"
+        if path:
+            path_str = '.'.join(str(p) for p in path)
+            error_msg += f"，路径: {path_str}"
+        
+        self.failed_assertions.append({
+            'type': 'json_schema',
+            'expected': schema,
+            'actual': json_data,
+            'message': error_msg
+        })
+        self._log_error(error_msg)
+        raise AssertionError(error_msg)
     
     # 异步断言方法
     async def assert_json_path_async(self, response, json_path, expected_value, comparator='eq'):
@@ -1372,9 +1632,11 @@ class ResponseAssertion:
         Raises:
             AssertionError: 断言失败时抛出
         """
-        # 对于异步断言，我们可以在这里添加一些异步特有的逻辑
-        # 比如处理异步响应流等
-        return self.assert_json_path(response, json_path, expected_value, comparator)
+        # 在默认线程池中执行，避免JSON解析阻塞事件循环
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            None, self.assert_json_path, response, json_path, expected_value, comparator
+        )
     
     async def assert_status_code_async(self, response, expected_status, comparator='eq'):
         """
@@ -1388,40 +1650,95 @@ class ResponseAssertion:
         Raises:
             AssertionError: 断言失败时抛出
         """
-        return self.assert_status_code(response, expected_status, comparator)
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            None, self.assert_status_code, response, expected_status, comparator
+        )
     
     # 流式响应断言
+    def _stream_contains(self, stream_data, content):
+        """
+        判断流式响应数据是否包含指定内容
+        
+        字节流直接按UTF-8字节查找，无需解码整个缓冲区；
+        数据块序列逐块查找，并保留上一块末尾的len(content)-1字节以匹配跨块的内容。
+        
+        Args:
+            stream_data: 流式响应数据（字符串、字节流或数据块列表）
+            content: 要查找的内容
+            
+        Returns:
+            bool: 包含该内容时返回True
+        """
+        if isinstance(stream_data, str):
+            return content in stream_data
+        
+        needle = content.encode('utf-8') if isinstance(content, str) else content
+        if isinstance(stream_data, (bytes, bytearray)):
+            return needle in stream_data
+        
+        if isinstance(stream_data, (list, tuple)):
+            keep = len(needle) - 1
+            tail = b''
+            for chunk in stream_data:
+                if isinstance(chunk, str):
+                    chunk = chunk.encode('utf-8')
+                window = tail + chunk
+                if needle in window:
+                    return True
+                tail = window[-keep:] if keep > 0 else b''
+            return not needle
+        
+        return content in str(stream_data)
+    
+    def _stream_preview(self, stream_data):
+        """
+        生成流式响应数据的预览文本，只解码预览所需的前缀
+        
+        Args:
+            stream_data: 流式响应数据（字符串、字节流或数据块列表）
+            
+        Returns:
+            str: 预览文本
+        """
+        # UTF-8字符最长4字节，解码该长度的前缀即可得到足够的预览字符
+        prefix_size = 101 * 4
+        if isinstance(stream_data, (list, tuple)):
+            prefix = b''
+            for chunk in stream_data:
+                prefix += chunk.encode('utf-8') if isinstance(chunk, str) else bytes(chunk)
+                if len(prefix) >= prefix_size:
+                    break
+            stream_data = prefix
+        if isinstance(stream_data, (bytes, bytearray)):
+            return _preview(bytes(stream_data[:prefix_size]).decode('utf-8', errors='replace'))
+        return _preview(str(stream_data))
+    
     def assert_stream_contains(self, stream_data, expected_content):
         """
         断言流式响应包含指定内容
         
         Args:
-            stream_data: 流式响应数据（字符串或字节流）
+            stream_data: 流式响应数据（字符串、字节流或数据块列表）
             expected_content: 期望包含的内容
             
         Raises:
             AssertionError: 断言失败时抛出
         """
         try:
-            # 确保stream_data是字符串
-            if isinstance(stream_data, bytes):
-                stream_str = stream_data.decode('utf-8')
-            else:
-                stream_str = str(stream_data)
-            
-            assert expected_content in stream_str, \
+            assert self._stream_contains(stream_data, expected_content), \
                 f"流式响应断言失败：响应不包含 '{expected_content}'"
             
-            self.user_logger.info(f"流式响应断言成功：响应包含 '{expected_content}'")
+            self._log_info("流式响应断言成功：响应包含 '%s'", expected_content)
             return True
         except AssertionError as e:
             self.failed_assertions.append({
                 'type': 'stream_contains',
                 'expected': expected_content,
-                'actual': stream_str[:100] + '...' if len(stream_str) > 100 else stream_str,
+                'actual': self._stream_preview(stream_data),
                 'message': str(e)
             })
-            self.user_logger.error(str(e))
+            self._log_error(str(e))
             raise
     
     def assert_stream_matches(self, stream_data, regex_pattern):
@@ -1446,16 +1763,16 @@ class ResponseAssertion:
             assert match is not None, \
                 f"流式响应正则匹配断言失败：响应不匹配模式 '{regex_pattern}'"
             
-            self.user_logger.info(f"流式响应正则匹配断言成功：响应匹配模式 '{regex_pattern}'")
+            self._log_info("流式响应正则匹配断言成功：响应匹配模式 '%s'", regex_pattern)
             return True
         except AssertionError as e:
             self.failed_assertions.append({
                 'type': 'stream_matches',
                 'expected': regex_pattern,
-                'actual': stream_str[:100] + '...' if len(stream_str) > 100 else stream_str,
+                'actual': _preview(stream_str),
                 'message': str(e)
             })
-            self.user_logger.error(str(e))
+            self._log_error(str(e))
             raise
     
     # 自定义断言方法
@@ -1472,7 +1789,7 @@ class ResponseAssertion:
         """
         try:
             assert condition, message
-            self.user_logger.info(f"自定义断言成功: {message}")
+            self._log_info("自定义断言成功: %s", message)
             return True
         except AssertionError as e:
             self.failed_assertions.append({
@@ -1481,7 +1798,7 @@ class ResponseAssertion:
                 'actual': condition,
                 'message': str(e)
             })
-            self.user_logger.error(str(e))
+            self._log_error(str(e))
             raise
     
     def assert_with_func(self, func, *args, **kwargs):
@@ -1499,7 +1816,7 @@ class ResponseAssertion:
         try:
             result = func(*args, **kwargs)
             assert result, f"自定义函数断言失败: {func.__name__}"
-            self.user_logger.info(f"自定义函数断言成功: {func.__name__}")
+            self._log_info("自定义函数断言成功: %s", func.__name__)
             return True
         except AssertionError as e:
             self.failed_assertions.append({
@@ -1508,7 +1825,7 @@ class ResponseAssertion:
                 'actual': False,
                 'message': str(e)
             })
-            self.user_logger.error(str(e))
+            self._log_error(str(e))
             raise
     
     # 断言集合管理
@@ -1525,7 +1842,7 @@ class ResponseAssertion:
         Returns:
             List[Dict]: 失败断言列表
         """
-        return self.failed_assertions.copy()
+        return list(self.failed_assertions)
     
     def has_failed_assertions(self):
         """
@@ -1534,7 +1851,7 @@ class ResponseAssertion:
         Returns:
             bool: 如果有失败的断言返回True，否则返回False
         """
-        return len(self.failed_assertions) > 0
+        return bool(self.failed_assertions)
     
     def assert_all_passed(self):
         """
@@ -1546,10 +1863,10 @@ class ResponseAssertion:
         if self.has_failed_assertions():
             error_messages = [f"- {fail['message']}" for fail in self.failed_assertions]
             error_msg = "有断言失败:\n" + "\n".join(error_messages)
-            self.user_logger.error(error_msg)
+            self._log_error(error_msg)
             raise AssertionError(error_msg)
         
-        self.user_logger.info("所有断言通过")
+        self._log_info("所有断言通过")
         return True
 
 
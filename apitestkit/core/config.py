@@ -15,12 +15,107 @@ from pathlib import Path
 # 设置模块日志
 logger = logging.getLogger(__name__)
 
-# 尝试导入YAML支持，若未安装则提供提示
-try:
-    import yaml
-    YAML_AVAILABLE = True
-except ImportError:
-    YAML_AVAILABLE = False
+# YAML支持按需导入：只有加载/保存YAML配置文件时才导入PyYAML，纯JSON配置无需承担其导入开销
+_yaml = None
+_yaml_checked = False
+_YAML_LOADER = None
+_YAML_DUMPER = None
+
+
+def _import_yaml():
+    """
+    按需导入PyYAML，结果缓存供后续调用复用
+    
+    Returns:
+        yaml模块，未安装PyYAML时返回None
+    """
+    global _yaml, _yaml_checked, _YAML_LOADER, _YAML_DUMPER
+    if not _yaml_checked:
+        try:
+            import yaml
+        except ImportError:
+            yaml = None
+        else:
+            # 优先使用libyaml的C实现，未编译libyaml时回退到纯Python实现
+            _YAML_LOADER = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+            _YAML_DUMPER = getattr(yaml, 'CSafeDumper', yaml.SafeDumper)
+        _yaml = yaml
+        _yaml_checked = True
+    return _yaml
+
+
+def __getattr__(name: str) -> Any:
+    """
+    兼容旧代码对模块属性 YAML_AVAILABLE 的访问，访问时才检测PyYAML
+    """
+    if name == 'YAML_AVAILABLE':
+        return _import_yaml() is not None
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+# 进程启动时的工作目录，首次使用时获取并缓存
+_CWD: Optional[Path] = None
+
+
+def _get_cwd() -> Path:
+    """
+    获取并缓存当前工作目录
+    
+    Returns:
+        工作目录Path对象
+    """
+    global _CWD
+    if _CWD is None:
+        _CWD = Path.cwd()
+    return _CWD
+
+
+def _env_sub(match: re.Match) -> str:
+    """
+    环境变量替换回调：${ENV_VAR} 替换为环境变量的值，未设置时保留原文
+    
+    Args:
+        match: ENV_PATTERN 的匹配结果
+        
+    Returns:
+        替换后的字符串
+    """
+    return os.environ.get(match.group(1), match.group(0))
+
+
+# 字符串类型识别：布尔值 | 无符号整数 | 无符号小数（如 1.5、1.、.5）
+_TYPE_PATTERN = re.compile(r'(true|false)|(\d+)|(\d+\.\d*|\.\d+)', re.IGNORECASE)
+
+# get() 缓存中表示“配置项不存在”的标记
+_MISSING = object()
+
+# 有效的日志级别
+_VALID_LOG_LEVELS = frozenset(('DEBUG', 'INFO', 'WARNING', 'ERROR', 'CRITICAL'))
+
+
+def _deep_merge(target: Dict[str, Any], source: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    将source深度合并到target中（原地修改target）
+    
+    仅当两侧的值都是dict时才递归合并，其余情况直接覆盖/添加。
+    
+    Args:
+        target: 目标字典
+        source: 源字典
+        
+    Returns:
+        合并后的target
+    """
+    target_get = target.get
+    for key, value in source.items():
+        current = target_get(key)
+        if current.__class__ is dict and value.__class__ is dict:
+            # 递归合并嵌套字典
+            _deep_merge(current, value)
+        else:
+            # 对于非字典类型或新键，直接覆盖/添加
+            target[key] = value
+    return target
 
 
 class ConfigManager:
@@ -32,7 +127,17 @@ class ConfigManager:
     # 环境变量替换模式
     ENV_PATTERN = re.compile(r'\$\{([^}]+)\}')
     
+    # YAML配置文件JSON缓存的格式版本，缓存格式变化时递增以使旧缓存失效
+    CONFIG_CACHE_VERSION = 1
+    
     def __init__(self):
+        # get() 的结果缓存（点分隔键 -> 值），配置写入时清空；
+        # _cache_owner 记录缓存对应的配置字典，_config 被整体替换时缓存自动失效
+        self._get_cache: Dict[str, Any] = {}
+        self._cache_owner = None
+        # 配置版本号，缓存失效时递增，供其他模块判断基于配置的派生数据是否需要重建
+        self._version = 0
+        
         # 基础配置
         self._config = {
             'log_level': 'INFO',
@@ -71,23 +176,48 @@ class ConfigManager:
         
         # 配置验证规则
         self._validation_rules = {
-            'log_level': lambda x: x in ['DEBUG', 'INFO', 'WARNING', 'ERROR', 'CRITICAL'],
+            'log_level': lambda x: isinstance(x, str) and x in _VALID_LOG_LEVELS,
             'default_timeout': lambda x: isinstance(x, int) and x > 0,
             'verify_ssl': lambda x: isinstance(x, bool),
             'ai.temperature': lambda x: isinstance(x, (int, float)) and 0 <= x <= 2,
             'ai.max_tokens': lambda x: isinstance(x, int) and x > 0,
         }
+        # 预先拆分验证规则的点分隔键，避免每次验证时重复split
+        self._validation_paths = [
+            (key, tuple(key.split('.')), validator)
+            for key, validator in self._validation_rules.items()
+        ]
         
         # 项目路径配置
         self._setup_paths()
     
+    def _invalidate_cache(self):
+        """
+        清空 get() 的结果缓存并递增配置版本号，在配置被修改后调用
+        """
+        self._get_cache.clear()
+        self._version += 1
+    
+    @property
+    def version(self) -> int:
+        """
+        配置版本号，配置通过 set/update 等方法修改或被整体替换后递增
+        
+        Returns:
+            int: 当前配置版本号
+        """
+        if self._cache_owner is not self._config:
+            self._cache_owner = self._config
+            self._invalidate_cache()
+        return self._version
+    
     def _setup_paths(self):
         """
         设置项目相关路径
         使用Path对象确保跨平台兼容性
         """
         # 获取当前工作目录
-        working_dir = Path.cwd()
+        working_dir = _get_cwd()
         self._config['working_dir'] = str(working_dir)
         
         # 配置目录
@@ -110,12 +240,14 @@ class ConfigManager:
         agent_templates_dir = config_dir / 'agent_templates'
         self._config['agent_templates_dir'] = str(agent_templates_dir)
         
-        # 创建必要的目录
-        dirs_to_create = [config_dir, log_dir, report_dir, data_dir, agent_templates_dir]
+        self._invalidate_cache()
+        
+        # 创建必要的目录（config_dir 由 agent_templates_dir 的 parents=True 一并创建）
+        dirs_to_create = [agent_templates_dir, log_dir, report_dir, data_dir]
         for dir_path in dirs_to_create:
             try:
                 dir_path.mkdir(parents=True, exist_ok=True)
-                logger.debug(f"确保目录存在: {dir_path}")
+                logger.debug("确保目录存在: %s", dir_path)
             except Exception as e:
                 logger.error(f"创建目录失败 {dir_path}: {e}")
     
@@ -130,15 +262,19 @@ class ConfigManager:
             解析环境变量后的值
         """
         if isinstance(config, dict):
+            if not config:
+                return {}
             return {k: self._resolve_env_vars(v) for k, v in config.items()}
         elif isinstance(config, list):
+            if not config:
+                return []
             return [self._resolve_env_vars(item) for item in config]
         elif isinstance(config, str):
+            # 不含${的字符串无需正则替换，直接尝试类型转换
+            if '${' not in config:
+                return self._try_convert_type(config)
             # 替换${ENV_VAR}格式的环境变量
-            def replace_env_var(match):
-                env_var = match.group(1)
-                return os.environ.get(env_var, match.group(0))
-            result = self.ENV_PATTERN.sub(replace_env_var, config)
+            result = self.ENV_PATTERN.sub(_env_sub, config)
             # 尝试类型转换
             return self._try_convert_type(result)
         return config
@@ -153,38 +289,82 @@ class ConfigManager:
         Returns:
             转换后的值
         """
-        # 处理布尔值
-        if value.lower() == 'true':
-            return True
-        elif value.lower() == 'false':
-            return False
+        # 一次正则匹配区分布尔值/整数/浮点数
+        match = _TYPE_PATTERN.fullmatch(value)
+        if match is None:
+            # 默认返回字符串
+            return value
+        boolean, integer, number = match.groups()
+        if boolean is not None:
+            return boolean.lower() == 'true'
+        if integer is not None:
+            return int(integer)
+        return float(number)
+    
+    def _get_config_cache_path(self, config_path: Path) -> Path:
+        """
+        获取YAML配置文件对应的JSON缓存文件路径
         
-        # 处理整数
-        if value.isdigit():
-            try:
-                return int(value)
-            except ValueError:
-                pass
+        Args:
+            config_path: 配置文件路径
+            
+        Returns:
+            缓存文件路径，如 default.yaml -> default.yaml.cached.json
+        """
+        return config_path.with_name(config_path.name + '.cached.json')
+    
+    def _read_config_cache(self, config_path: Path, source_key: list) -> Optional[Any]:
+        """
+        读取YAML配置文件的JSON缓存
         
-        # 处理浮点数
-        if '.' in value:
-            try:
-                # 确保所有部分都是数字
-                parts = value.split('.')
-                if all(part.isdigit() for part in parts if part):
-                    return float(value)
-            except ValueError:
-                pass
+        Args:
+            config_path: 配置文件路径
+            source_key: 源文件的[修改时间(ns), 大小]，用于判断缓存是否过期
+            
+        Returns:
+            缓存的原始配置数据（未解析环境变量），缓存不存在或已过期返回None
+        """
+        try:
+            with self._get_config_cache_path(config_path).open('r', encoding='utf-8') as f:
+                cached = json.load(f)
+            if cached.get('version') == self.CONFIG_CACHE_VERSION and cached.get('source') == source_key:
+                return cached.get('data')
+        except (OSError, ValueError, AttributeError):
+            pass
+        return None
+    
+    def _write_config_cache(self, config_path: Path, source_key: list, config_data: Any):
+        """
+        将YAML配置文件的解析结果写入JSON缓存（先写临时文件再原子替换）
         
-        # 默认返回字符串
-        return value
+        Args:
+            config_path: 配置文件路径
+            source_key: 源文件的[修改时间(ns), 大小]
+            config_data: 原始配置数据（未解析环境变量）
+        """
+        try:
+            cache_text = json.dumps({
+                'version': self.CONFIG_CACHE_VERSION,
+                'source': source_key,
+                'data': config_data,
+            }, ensure_ascii=False)
+            # JSON无法无损表示的YAML数据（如非字符串键）不做缓存
+            if json.loads(cache_text)['data'] != config_data:
+                return
+            cache_path = self._get_config_cache_path(config_path)
+            tmp_path = cache_path.with_name(cache_path.name + '.tmp')
+            tmp_path.write_text(cache_text, encoding='utf-8')
+            os.replace(tmp_path, cache_path)
+        except (OSError, TypeError, ValueError) as e:
+            logger.debug("写入配置缓存失败 %s: %s", config_path, e)
     
-    def _load_config_file(self, config_file: str) -> Optional[Dict[str, Any]]:
+    def _load_config_file(self, config_file: str, use_cache: bool = False) -> Optional[Dict[str, Any]]:
         """
         从配置文件加载配置数据
         
         Args:
             config_file: 配置文件路径
+            use_cache: 是否为YAML配置文件使用JSON缓存，源文件未变化时跳过YAML解析
             
         Returns:
             配置字典，加载失败返回None
@@ -192,30 +372,43 @@ class ConfigManager:
         # 使用Path对象确保跨平台兼容性
         config_path = Path(config_file)
         if not config_path.exists():
-            logger.debug(f"配置文件不存在: {config_file}")
+            logger.debug("配置文件不存在: %s", config_file)
             return None
         
         try:
-            with config_path.open('r', encoding='utf-8') as f:
-                # 根据文件扩展名选择解析器
-                if config_path.suffix in ('.yaml', '.yml'):
-                    if not YAML_AVAILABLE:
-                        logger.warning("尝试加载YAML配置文件，但未安装PyYAML。请安装: pip install pyyaml")
-                        return None
-                    config_data = yaml.safe_load(f)
-                else:
-                    # 默认使用JSON格式
-                    config_data = json.load(f)
-                
-                # 解析环境变量
-                logger.debug(f"成功加载配置文件: {config_file}")
-                return self._resolve_env_vars(config_data)
+            is_yaml = config_path.suffix in ('.yaml', '.yml')
+            source_key = None
+            config_data = None
+            if use_cache and is_yaml:
+                stat = config_path.stat()
+                source_key = [stat.st_mtime_ns, stat.st_size]
+                config_data = self._read_config_cache(config_path, source_key)
+            
+            if config_data is None:
+                with config_path.open('r', encoding='utf-8') as f:
+                    # 根据文件扩展名选择解析器
+                    if is_yaml:
+                        yaml = _import_yaml()
+                        if yaml is None:
+                            logger.warning("尝试加载YAML配置文件，但未安装PyYAML。请安装: pip install pyyaml")
+                            return None
+                        try:
+                            config_data = yaml.load(f, Loader=_YAML_LOADER)
+                        except yaml.YAMLError as e:
+                            logger.error(f"YAML格式错误 {config_file}: {e}")
+                            return None
+                    else:
+                        # 默认使用JSON格式
+                        config_data = json.load(f)
+                if source_key is not None:
+                    self._write_config_cache(config_path, source_key, config_data)
+            
+            # 解析环境变量（缓存中保存的是原始数据，环境变量每次加载时重新解析）
+            logger.debug("成功加载配置文件: %s", config_file)
+            return self._resolve_env_vars(config_data)
         except json.JSONDecodeError as e:
             logger.error(f"JSON格式错误 {config_file}: {e}")
             return None
-        except yaml.YAMLError as e:
-            logger.error(f"YAML格式错误 {config_file}: {e}")
-            return None
         except UnicodeDecodeError as e:
             logger.error(f"编码错误 {config_file}: {e}")
             return None
@@ -223,18 +416,19 @@ class ConfigManager:
             logger.error(f"加载配置文件失败 {config_file}: {e}")
             return None
     
-    def load_config(self, config_file: str) -> bool:
+    def load_config(self, config_file: str, use_cache: bool = False) -> bool:
         """
         从配置文件加载配置
         支持JSON和YAML格式
         
         Args:
             config_file: 配置文件路径
+            use_cache: 是否为YAML配置文件使用JSON缓存
             
         Returns:
             是否加载成功
         """
-        config_data = self._load_config_file(config_file)
+        config_data = self._load_config_file(config_file, use_cache=use_cache)
         if config_data:
             # 使用update方法进行深度合并，而不是简单的update
             self.update(config_data)
@@ -242,19 +436,20 @@ class ConfigManager:
             return True
         return False
     
-    def load_configs(self, config_files: list) -> bool:
+    def load_configs(self, config_files: list, use_cache: bool = False) -> bool:
         """
         加载多个配置文件，后面的文件会覆盖前面的配置
         
         Args:
             config_files: 配置文件路径列表
+            use_cache: 是否为YAML配置文件使用JSON缓存
             
         Returns:
             是否至少成功加载了一个配置文件
         """
         success = False
         for config_file in config_files:
-            if self.load_config(config_file):
+            if self.load_config(config_file, use_cache=use_cache):
                 success = True
         return success
     
@@ -265,6 +460,9 @@ class ConfigManager:
         1. config/default.json (或 .yaml)
         2. config/{环境}.json (或 .yaml)
         3. config/local.json (或 .yaml)
+        
+        YAML配置文件的解析结果会缓存为同目录下的 *.cached.json，
+        源文件未修改时直接读取缓存，跳过YAML解析。
         """
         config_dir = self._config['config_dir']
         env = os.environ.get('API_TEST_ENV', 'development')
@@ -279,7 +477,7 @@ class ConfigManager:
                     config_files.append(file_path)
                     break
         
-        return self.load_configs(config_files)
+        return self.load_configs(config_files, use_cache=True)
     
     def get(self, key: str, default: Any = None) -> Any:
         """
@@ -291,17 +489,28 @@ class ConfigManager:
             
         Returns:
             配置值或默认值
-        """
-        keys = key.split('.')
-        value = self._config
-        
-        for k in keys:
-            if isinstance(value, dict) and k in value:
-                value = value[k]
-            else:
-                return default
+            
+        Note:
+            结果按键缓存，通过 set/update 等方法修改配置时缓存自动清空；
+            直接原地修改 get() 返回的嵌套字典不会使缓存失效。
+        """
+        cache = self._get_cache
+        if self._cache_owner is not self._config:
+            self._cache_owner = self._config
+            self._invalidate_cache()
+        
+        value = cache.get(key, _MISSING)
+        if value is _MISSING and key not in cache:
+            value = self._config
+            for k in key.split('.'):
+                if isinstance(value, dict) and k in value:
+                    value = value[k]
+                else:
+                    value = _MISSING
+                    break
+            cache[key] = value
         
-        return value
+        return default if value is _MISSING else value
     
     def set(self, key: str, value: Any):
         """
@@ -320,6 +529,7 @@ class ConfigManager:
             config = config[k]
         
         config[keys[-1]] = value
+        self._invalidate_cache()
     
     def update(self, config_dict: Dict[str, Any]):
         """
@@ -328,20 +538,12 @@ class ConfigManager:
         Args:
             config_dict: 配置字典
         """
-        def deep_merge(target: Dict[str, Any], source: Dict[str, Any]):
-            """深度合并两个字典"""
-            for key, value in source.items():
-                if key in target and isinstance(target[key], dict) and isinstance(value, dict):
-                    # 递归合并嵌套字典
-                    deep_merge(target[key], value)
-                else:
-                    # 对于非字典类型或新键，直接覆盖/添加
-                    target[key] = value
-            return target
-        
         try:
-            deep_merge(self._config, config_dict)
-            logger.debug(f"配置已更新，验证配置有效性")
+            try:
+                _deep_merge(self._config, config_dict)
+            finally:
+                self._invalidate_cache()
+            logger.debug("配置已更新，验证配置有效性")
             return self.validate_config()
         except Exception as e:
             logger.error(f"更新配置失败: {e}")
@@ -355,8 +557,16 @@ class ConfigManager:
             配置是否有效
         """
         is_valid = True
-        for key, validator in self._validation_rules.items():
-            value = self.get(key)
+        config = self._config
+        for key, path, validator in self._validation_paths:
+            value = config
+            for part in path:
+                if not isinstance(value, dict):
+                    value = None
+                    break
+                value = value.get(part)
+                if value is None:
+                    break
             if value is not None and not validator(value):
                 logger.warning(f"配置项 '{key}' 的值 '{value}' 无效")
                 is_valid = False
@@ -365,16 +575,18 @@ class ConfigManager:
         for path_key in ['working_dir', 'config_dir', 'log_dir', 'report_dir', 'data_dir']:
             path_value = self.get(path_key)
             if path_value:
-                path_obj = Path(path_value)
-                if not path_obj.exists():
+                # 直接尝试创建目录，已存在时由FileExistsError跳过，省去单独的exists()检查
+                try:
+                    Path(path_value).mkdir(parents=True)
+                except FileExistsError:
+                    continue
+                except Exception as e:
+                    logger.warning(f"配置路径不存在: {path_key} = {path_value}")
+                    logger.error(f"无法创建目录 {path_value}: {e}")
+                    is_valid = False
+                else:
                     logger.warning(f"配置路径不存在: {path_key} = {path_value}")
-                    # 尝试创建目录
-                    try:
-                        path_obj.mkdir(exist_ok=True, parents=True)
-                        logger.info(f"已自动创建缺失的目录: {path_value}")
-                    except Exception as e:
-                        logger.error(f"无法创建目录 {path_value}: {e}")
-                        is_valid = False
+                    logger.info(f"已自动创建缺失的目录: {path_value}")
         
         return is_valid
     
@@ -396,15 +608,16 @@ class ConfigManager:
             
             with config_path.open('w', encoding='utf-8') as f:
                 if config_path.suffix in ('.yaml', '.yml'):
-                    if not YAML_AVAILABLE:
+                    yaml = _import_yaml()
+                    if yaml is None:
                         logger.warning("尝试保存YAML配置文件，但未安装PyYAML。将保存为JSON格式。")
                         json.dump(self._config, f, indent=2, ensure_ascii=False)
                     else:
-                        yaml.dump(self._config, f, default_flow_style=False, allow_unicode=True)
+                        yaml.dump(self._config, f, Dumper=_YAML_DUMPER, default_flow_style=False, allow_unicode=True)
                 else:
                     json.dump(self._config, f, indent=2, ensure_ascii=False)
             
-            logger.debug(f"配置已保存到: {config_file}")
+            logger.debug("配置已保存到: %s", config_file)
             return True
         except Exception as e:
             logger.error(f"保存配置文件失败: {e}")
@@ -421,10 +634,12 @@ class ConfigManager:
             AI配置字典
         """
         ai_config = self.get('ai', {}).copy()
-        if model and 'models' in ai_config and model in ai_config['models']:
-            # 合并特定模型的配置
-            model_config = ai_config['models'][model]
-            ai_config.update(model_config)
+        if model:
+            models = ai_config.get('models')
+            model_config = models.get(model) if models.__class__ is dict else None
+            if model_config is not None:
+                # 合并特定模型的配置
+                ai_config.update(model_config)
         return ai_config
     
     def get_streaming_config(self) -> Dict[str, Any]:
@@ -455,7 +670,6 @@ class ConfigManager:
         try:
             # 使用Path对象确保跨平台兼容性
             output_path = Path(output_dir)
-            output_path.mkdir(parents=True, exist_ok=True)
             
             self._config['output_dir'] = str(output_path)
             
@@ -465,8 +679,9 @@ class ConfigManager:
             
             self._config['log_dir'] = str(log_dir)
             self._config['report_dir'] = str(report_dir)
+            self._invalidate_cache()
             
-            # 创建子目录
+            # 创建子目录（parents=True 会一并创建输出目录本身）
             log_dir.mkdir(parents=True, exist_ok=True)
             report_dir.mkdir(parents=True, exist_ok=True)
             
@@ -488,6 +703,7 @@ class ConfigManager:
             input_path.mkdir(parents=True, exist_ok=True)
             
             self._config['input_dir'] = str(input_path)
+            self._invalidate_cache()
             logger.info(f"输入目录已设置为: {input_dir}")
         except Exception as e:
             logger.error(f"设置输入目录失败 {input_dir}: {e}")
@@ -501,26 +717,37 @@ class ConfigManager:
             prefix: 环境变量前缀
         """
         loaded_count = 0
+        prefix_len = len(prefix)
+        debug_enabled = logger.isEnabledFor(logging.DEBUG)
+        # 先收集为嵌套字典，最后一次性合并并验证
+        pending: Dict[str, Any] = {}
         for key, value in os.environ.items():
             if key.startswith(prefix):
                 try:
-                    # 移除前缀并转换为小写
-                    config_key = key[len(prefix):].lower()
+                    # 移除前缀并转换为小写，支持下划线分隔的嵌套键
+                    path = key[prefix_len:].lower().split('_')
                     
                     # 使用统一的类型转换方法
                     converted_value = self._try_convert_type(value)
                     
-                    # 支持下划线分隔的嵌套键，转换为点号分隔
-                    config_key = config_key.replace('_', '.')
-                    self.set(config_key, converted_value)
+                    # 与set()一致：路径上的非字典值被替换为字典
+                    node = pending
+                    for part in path[:-1]:
+                        child = node.get(part)
+                        if child.__class__ is not dict:
+                            child = node[part] = {}
+                        node = child
+                    node[path[-1]] = converted_value
                     loaded_count += 1
-                    logger.debug(f"从环境变量加载配置: {key} -> {config_key} = {converted_value}")
+                    if debug_enabled:
+                        logger.debug("从环境变量加载配置: %s -> %s = %s", key, '.'.join(path), converted_value)
                 except Exception as e:
                     logger.error(f"处理环境变量 {key} 失败: {e}")
         
         if loaded_count > 0:
             logger.info(f"从环境变量成功加载 {loaded_count} 个配置项")
-            self.validate_config()
+            # update() 深度合并后执行一次配置验证
+            self.update(pending)
         return loaded_count
     
     # 向后兼容性方法
@@ -6,15 +6,71 @@
 
 import json
 import csv
+import logging
 import os
 import pickle
+import queue
+import re
 import sqlite3
+import atexit
+import itertools
+import threading
+import uuid
 from datetime import datetime
 from typing import Dict, Any, List, Optional, Union, Callable
 from pathlib import Path
 
 from apitestkit.core.logger import logger_manager
 from apitestkit.core.config import config_manager
+from apitestkit.core.json_codec import (json_dumps as _jdumps, json_dumps_indented as _jdumps_indented,
+                                        json_loads as _jloads)
+
+# 尝试导入pyahocorasick（可选，用于多关键字内容搜索）
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
+
+def _build_keyword_matcher(keywords: List[str]) -> Callable[[str], bool]:
+    """
+    构建多关键字匹配函数：文本包含任一关键字即匹配
+    
+    安装了pyahocorasick时使用Aho-Corasick自动机，对每段文本只扫描一遍；
+    否则回退到转义后的正则多选分支。
+    
+    Args:
+        keywords: 关键字列表
+        
+    Returns:
+        Callable[[str], bool]: 匹配函数
+    """
+    if not keywords:
+        # 没有关键字时不匹配任何文本
+        return lambda text: False
+    if '' in keywords:
+        # 空关键字与任意文本匹配
+        return lambda text: True
+    if AHOCORASICK_AVAILABLE:
+        automaton = ahocorasick.Automaton()
+        for keyword in keywords:
+            automaton.add_word(keyword, keyword)
+        automaton.make_automaton()
+        return lambda text: next(automaton.iter(text), None) is not None
+    pattern = re.compile('|'.join(map(re.escape, keywords)))
+    return lambda text: pattern.search(text) is not None
+
+
+# 内存中按列存储的记录字段（顺序与数据库插入语句一致）
+_RECORD_FIELDS = ('timestamp', 'request_url', 'request_method', 'status_code', 'response_time',
+                  'response_data', 'request_params', 'request_headers', 'tags', 'metadata')
+
+# 响应记录插入语句
+_INSERT_SQL = '''INSERT INTO api_responses (timestamp, request_url, request_method, status_code, 
+                        response_time, response_data, request_params, request_headers, tags, metadata,
+                        session_id, record_id)
+                        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)'''
 
 
 class DataStorageManager:
@@ -22,26 +78,58 @@ class DataStorageManager:
     数据存储管理器类
     
     负责API测试数据的存储、检索、过滤和导出，支持多种存储格式和查询方式。
+    内存数据按列存储（每个字段一个列表），过滤时逐列计算，只为返回的记录构建字典；
+    数据库写入由后台线程批量完成，store_response 只需将记录放入队列。
     """
     
+    # 后台写入线程每次事务最多写入的记录数
+    WRITE_BATCH_SIZE = 500
+    
     def __init__(self):
         """
         初始化数据存储管理器
         """
-        self._data_store = []
+        # 按列存储的内存数据：记录ID列 + 各字段列，同一下标对应同一条记录
+        self._ids: List[int] = []
+        self._cols: Dict[str, List[Any]] = {field: [] for field in _RECORD_FIELDS}
+        self._col_lists = [self._cols[field] for field in _RECORD_FIELDS]
+        self._store_lock = threading.Lock()
+        # 记录ID生成器，清空内存数据后ID继续递增
+        self._id_gen = itertools.count(1)
         self._storage_dir = Path(config_manager.get('data_dir', 'data'))
         self._storage_dir.mkdir(exist_ok=True, parents=True)
         self._db_path = self._storage_dir / 'apitestkit.db'
+        self._conn = None
+        self._conn_lock = threading.Lock()
+        self._write_q = queue.Queue()
+        self._writer_thread = None
+        # 会话ID用于区分本实例（自上次清空内存数据起）写入数据库的记录
+        self._session_id = uuid.uuid4().hex
+        # 数据库中的本会话记录是否与内存数据一致，写入失败时回退到内存过滤
+        self._db_in_sync = True
+        self._json1_available = False
         self._init_database()
+        if self._conn is not None:
+            self._writer_thread = threading.Thread(
+                target=self._writer_loop, name='apitestkit-db-writer', daemon=True
+            )
+            self._writer_thread.start()
+            # 进程退出前写完队列中剩余的记录
+            atexit.register(self.close)
         logger_manager.info(f"[框架] 数据存储管理器初始化完成，存储目录: {self._storage_dir}")
     
     def _init_database(self):
         """
-        初始化SQLite数据库
+        初始化SQLite数据库，并打开供后台写入线程长期使用的连接
         """
         try:
-            with sqlite3.connect(str(self._db_path)) as conn:
+            # isolation_level=None 由写入线程显式控制事务
+            conn = sqlite3.connect(str(self._db_path), check_same_thread=False, isolation_level=None)
+            try:
                 cursor = conn.cursor()
+                cursor.execute('PRAGMA journal_mode=WAL')
+                cursor.execute('PRAGMA synchronous=NORMAL')
+                cursor.execute('PRAGMA temp_store=MEMORY')
                 cursor.execute('''
                 CREATE TABLE IF NOT EXISTS api_responses (
                     id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -60,10 +148,92 @@ class DataStorageManager:
                 cursor.execute('CREATE INDEX IF NOT EXISTS idx_url ON api_responses(request_url)')
                 cursor.execute('CREATE INDEX IF NOT EXISTS idx_status ON api_responses(status_code)')
                 cursor.execute('CREATE INDEX IF NOT EXISTS idx_method ON api_responses(request_method)')
-                conn.commit()
+                # 兼容旧版本创建的数据库：补充会话列
+                columns = {row[1] for row in cursor.execute('PRAGMA table_info(api_responses)')}
+                if 'session_id' not in columns:
+                    cursor.execute('ALTER TABLE api_responses ADD COLUMN session_id TEXT')
+                if 'record_id' not in columns:
+                    cursor.execute('ALTER TABLE api_responses ADD COLUMN record_id INTEGER')
+                cursor.execute('CREATE INDEX IF NOT EXISTS idx_session ON api_responses(session_id, record_id)')
+                # 检测JSON1扩展，用于按标签过滤
+                try:
+                    cursor.execute("SELECT value FROM json_each('[1]')")
+                    self._json1_available = True
+                except sqlite3.OperationalError:
+                    self._json1_available = False
+            except Exception:
+                conn.close()
+                raise
+            self._conn = conn
         except Exception as e:
             logger_manager.error(f"[框架] 初始化数据库失败: {str(e)}")
     
+    def _writer_loop(self):
+        """
+        后台写入线程：阻塞等待记录，每次取出队列中已有的记录（最多WRITE_BATCH_SIZE条）
+        在单个事务中用executemany批量写入。收到None时退出。
+        """
+        write_q = self._write_q
+        conn = self._conn
+        batch_size = self.WRITE_BATCH_SIZE
+        while True:
+            row = write_q.get()
+            stop = row is None
+            batch = [] if stop else [row]
+            while not stop and len(batch) < batch_size:
+                try:
+                    row = write_q.get_nowait()
+                except queue.Empty:
+                    break
+                if row is None:
+                    stop = True
+                else:
+                    batch.append(row)
+            
+            try:
+                if batch:
+                    with self._conn_lock:
+                        try:
+                            conn.execute('BEGIN')
+                            conn.executemany(_INSERT_SQL, batch)
+                            conn.execute('COMMIT')
+                        except Exception:
+                            if conn.in_transaction:
+                                conn.execute('ROLLBACK')
+                            raise
+            except Exception as e:
+                self._db_in_sync = False
+                logger_manager.error(f"[框架] 数据库存储失败: {str(e)}")
+            finally:
+                for _ in range(len(batch) + stop):
+                    write_q.task_done()
+            
+            if stop:
+                break
+    
+    def flush(self):
+        """
+        等待后台写入线程将队列中的记录全部写入数据库
+        """
+        if self._writer_thread is not None and self._writer_thread.is_alive():
+            self._write_q.join()
+    
+    def close(self):
+        """
+        写完队列中剩余的记录后停止后台写入线程并关闭数据库连接
+        """
+        if self._writer_thread is not None:
+            if self._writer_thread.is_alive():
+                self._write_q.put(None)
+                self._writer_thread.join()
+            self._writer_thread = None
+        with self._conn_lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+        # 已关闭的实例无需在退出时再处理，同时释放atexit对实例的引用
+        atexit.unregister(self.close)
+    
     def save_response(self, response: Any, request_info: Dict[str, Any], 
                       tags: Optional[List[str]] = None, 
                       metadata: Optional[Dict[str, Any]] = None):
@@ -107,42 +277,39 @@ class DataStorageManager:
             else:
                 response_data = response
             
-            # 构建存储记录
-            record = {
-                'timestamp': datetime.now().isoformat(),
-                'request_url': request_info.get('url', ''),
-                'request_method': request_info.get('method', ''),
-                'status_code': getattr(response, 'status_code', None) or request_info.get('status_code'),
-                'response_time': request_info.get('response_time', 0),
-                'response_data': json.dumps(response_data) if isinstance(response_data, (dict, list)) else str(response_data),
-                'request_params': json.dumps(request_info.get('params', {})) if isinstance(request_info.get('params'), dict) else str(request_info.get('params', '')),
-                'request_headers': json.dumps(request_info.get('headers', {})) if isinstance(request_info.get('headers'), dict) else str(request_info.get('headers', '')),
-                'tags': json.dumps(tags) if tags else '[]',
-                'metadata': json.dumps(metadata) if metadata else '{}'
-            }
-            
-            # 内存存储
-            record_id = len(self._data_store) + 1
-            record['id'] = record_id
-            self._data_store.append(record)
-            
-            # 数据库存储
-            try:
-                with sqlite3.connect(str(self._db_path)) as conn:
-                    cursor = conn.cursor()
-                    cursor.execute(
-                        '''INSERT INTO api_responses (timestamp, request_url, request_method, status_code, 
-                        response_time, response_data, request_params, request_headers, tags, metadata)
-                        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)''',
-                        (record['timestamp'], record['request_url'], record['request_method'], record['status_code'],
-                         record['response_time'], record['response_data'], record['request_params'],
-                         record['request_headers'], record['tags'], record['metadata'])
-                    )
-                    conn.commit()
-            except Exception as e:
-                logger_manager.error(f"[框架] 数据库存储失败: {str(e)}")
+            jdumps = _jdumps
+            info_get = request_info.get
+            params = info_get('params', '')
+            headers = info_get('headers', '')
+            
+            # 构建存储记录（字段顺序与_RECORD_FIELDS一致）
+            values = (
+                datetime.now().isoformat(),
+                info_get('url', ''),
+                info_get('method', ''),
+                getattr(response, 'status_code', None) or info_get('status_code'),
+                info_get('response_time', 0),
+                jdumps(response_data) if isinstance(response_data, (dict, list)) else str(response_data),
+                jdumps(params) if isinstance(params, dict) else str(params),
+                jdumps(headers) if isinstance(headers, dict) else str(headers),
+                jdumps(tags) if tags else '[]',
+                jdumps(metadata) if metadata else '{}'
+            )
+            
+            # 内存存储：逐列追加，加锁保证各列对齐
+            with self._store_lock:
+                record_id = next(self._id_gen)
+                self._ids.append(record_id)
+                for column, value in zip(self._col_lists, values):
+                    column.append(value)
+                session_id = self._session_id
+            
+            # 数据库存储：交给后台写入线程批量写入
+            if self._writer_thread is not None:
+                self._write_q.put(values + (session_id, record_id))
             
-            logger_manager.debug(f"[框架] 响应数据存储成功，记录ID: {record_id}")
+            if logger_manager.is_enabled_for(logging.DEBUG):
+                logger_manager.debug(f"[框架] 响应数据存储成功，记录ID: {record_id}")
             return record_id
         except Exception as e:
             logger_manager.error(f"[框架] 存储响应数据失败: {str(e)}")
@@ -174,49 +341,150 @@ class DataStorageManager:
             List[Dict[str, Any]]: 过滤后的数据列表
         """
         try:
-            # 从内存中获取数据
-            filtered_data = []
-            
-            for record in self._data_store:
-                # 应用各种过滤条件
-                match = True
-                
-                if url_pattern and url_pattern not in record['request_url']:
-                    match = False
-                
-                if status_codes and record['status_code'] not in status_codes:
-                    match = False
-                
-                if methods and record['request_method'].upper() not in [m.upper() for m in methods]:
-                    match = False
-                
-                if tags:
-                    record_tags = json.loads(record['tags'])
-                    if not any(tag in record_tags for tag in tags):
-                        match = False
-                
-                if min_response_time is not None and record['response_time'] < min_response_time:
-                    match = False
-                
-                if max_response_time is not None and record['response_time'] > max_response_time:
-                    match = False
-                
-                if condition and not condition(record):
-                    match = False
-                
-                if match:
-                    filtered_data.append(record)
+            has_sql_filters = bool(url_pattern or status_codes or methods or tags
+                                   or min_response_time is not None or max_response_time is not None)
+            if has_sql_filters and (not tags or self._json1_available):
+                filtered_data = self._filter_data_sql(url_pattern, status_codes, methods, tags,
+                                                      min_response_time, max_response_time,
+                                                      None if condition else limit)
+                if filtered_data is not None:
+                    if condition:
+                        filtered_data = [record for record in filtered_data if condition(record)]
+                        if limit:
+                            filtered_data = filtered_data[:limit]
+                    if logger_manager.is_enabled_for(logging.DEBUG):
+                        logger_manager.debug(f"[框架] 数据过滤完成，返回 {len(filtered_data)} 条记录")
+                    return filtered_data
+            
+            # 从内存中获取数据：逐列过滤得到候选下标，最后才构建记录字典
+            cols = self._cols
+            indices = range(len(self._ids))
+            
+            if url_pattern:
+                column = cols['request_url']
+                indices = [i for i in indices if url_pattern in column[i]]
+            
+            if status_codes:
+                column = cols['status_code']
+                indices = [i for i in indices if column[i] in status_codes]
+            
+            if methods:
+                column = cols['request_method']
+                upper_methods = [m.upper() for m in methods]
+                indices = [i for i in indices if column[i].upper() in upper_methods]
+            
+            if tags:
+                column = cols['tags']
+                indices = [i for i in indices if any(tag in _jloads(column[i]) for tag in tags)]
+            
+            if min_response_time is not None:
+                column = cols['response_time']
+                indices = [i for i in indices if not column[i] < min_response_time]
+            
+            if max_response_time is not None:
+                column = cols['response_time']
+                indices = [i for i in indices if not column[i] > max_response_time]
+            
+            if condition:
+                filtered_data = [record for record in map(self._record_at, indices) if condition(record)]
+            else:
+                if limit:
+                    indices = indices[:limit]
+                filtered_data = [self._record_at(i) for i in indices]
             
             # 限制返回数量
             if limit:
                 filtered_data = filtered_data[:limit]
             
-            logger_manager.debug(f"[框架] 数据过滤完成，返回 {len(filtered_data)} 条记录")
+            if logger_manager.is_enabled_for(logging.DEBUG):
+                logger_manager.debug(f"[框架] 数据过滤完成，返回 {len(filtered_data)} 条记录")
             return filtered_data
         except Exception as e:
             logger_manager.error(f"[框架] 数据过滤失败: {str(e)}")
             return []
     
+    def _filter_data_sql(self, url_pattern, status_codes, methods, tags,
+                         min_response_time, max_response_time, limit) -> Optional[List[Dict[str, Any]]]:
+        """
+        使用SQLite索引过滤本会话的记录，只查询记录ID，再从内存中取出对应记录
+        
+        Args:
+            url_pattern: URL子串（区分大小写）
+            status_codes: 状态码列表
+            methods: HTTP方法列表（不区分大小写）
+            tags: 标签列表，匹配任一标签即可
+            min_response_time: 最小响应时间
+            max_response_time: 最大响应时间
+            limit: 返回记录数限制
+            
+        Returns:
+            Optional[List[Dict[str, Any]]]: 过滤后的数据列表，数据库不可用或与内存不一致时返回None
+        """
+        if self._conn is None or not self._ids:
+            return None
+        self.flush()
+        if not self._db_in_sync:
+            return None
+        
+        clauses = ['session_id = ?']
+        params: List[Any] = [self._session_id]
+        if url_pattern:
+            clauses.append('instr(request_url, ?) > 0')
+            params.append(url_pattern)
+        if status_codes:
+            clauses.append(f"status_code IN ({','.join('?' * len(status_codes))})")
+            params.extend(status_codes)
+        if methods:
+            clauses.append(f"UPPER(request_method) IN ({','.join('?' * len(methods))})")
+            params.extend(m.upper() for m in methods)
+        if tags:
+            clauses.append(f"EXISTS (SELECT 1 FROM json_each(tags) WHERE json_each.value IN ({','.join('?' * len(tags))}))")
+            params.extend(tags)
+        if min_response_time is not None:
+            clauses.append('response_time >= ?')
+            params.append(min_response_time)
+        if max_response_time is not None:
+            clauses.append('response_time <= ?')
+            params.append(max_response_time)
+        
+        sql = f"SELECT record_id FROM api_responses WHERE {' AND '.join(clauses)} ORDER BY record_id"
+        if limit:
+            sql += ' LIMIT ?'
+            params.append(limit)
+        
+        with self._conn_lock:
+            if self._conn is None:
+                return None
+            record_ids = [row[0] for row in self._conn.execute(sql, params)]
+        
+        # 本会话的记录ID连续递增，可直接换算为内存列表下标
+        first_id = self._ids[0]
+        return [self._record_at(record_id - first_id) for record_id in record_ids]
+    
+    def _record_at(self, index: int) -> Dict[str, Any]:
+        """
+        根据下标从各列构建一条记录字典
+        
+        Args:
+            index: 记录在列中的下标
+            
+        Returns:
+            Dict[str, Any]: 记录字典
+        """
+        record = {field: column[index] for field, column in zip(_RECORD_FIELDS, self._col_lists)}
+        record['id'] = self._ids[index]
+        return record
+    
+    def _iter_records(self):
+        """
+        逐条构建内存中的记录字典
+        
+        Yields:
+            Dict[str, Any]: 记录字典
+        """
+        for i in range(len(self._ids)):
+            yield self._record_at(i)
+    
     def export_to_json(self, filename: str = None, filter_condition: Optional[Callable] = None) -> str:
         """
         导出数据到JSON文件
@@ -236,12 +504,18 @@ class DataStorageManager:
             # 构建文件路径
             file_path = self._storage_dir / filename
             
-            # 获取要导出的数据
-            data_to_export = self.filter_data(condition=filter_condition) if filter_condition else self._data_store
+            # 获取要导出的数据（未过滤时逐条构建记录，避免一次性生成全部记录）
+            data_to_export = self.filter_data(condition=filter_condition) if filter_condition else self._iter_records()
             
-            # 导出到JSON文件
-            with open(file_path, 'w', encoding='utf-8') as f:
-                json.dump(data_to_export, f, ensure_ascii=False, indent=2)
+            # 逐条写入JSON数组，输出格式与 json.dump(indent=2) 相同
+            with open(file_path, 'wb') as f:
+                f.write(b'[')
+                separator = b'\n  '
+                for record in data_to_export:
+                    f.write(separator)
+                    f.write(_jdumps_indented(record).replace(b'\n', b'\n  '))
+                    separator = b',\n  '
+                f.write(b']' if separator == b'\n  ' else b'\n]')
             
             logger_manager.info(f"[框架] 数据成功导出到JSON文件: {file_path}")
             return str(file_path)
@@ -268,33 +542,39 @@ class DataStorageManager:
             # 构建文件路径
             file_path = self._storage_dir / filename
             
-            # 获取要导出的数据
-            data_to_export = self.filter_data(condition=filter_condition) if filter_condition else self._data_store
-            
-            if not data_to_export:
-                return ''
-            
             # CSV字段名
             fieldnames = ['id', 'timestamp', 'request_url', 'request_method', 'status_code', 
                          'response_time', 'response_data', 'tags', 'metadata']
             
+            # 获取要导出的数据，统一为与fieldnames顺序一致的元组
+            if filter_condition:
+                data_to_export = self.filter_data(condition=filter_condition)
+                if not data_to_export:
+                    return ''
+                rows = (tuple(record.get(field, '') for field in fieldnames) for record in data_to_export)
+            else:
+                # 未过滤时直接按列组合，无需构建记录字典
+                if not self._ids:
+                    return ''
+                cols = self._cols
+                rows = zip(self._ids, *(cols[field] for field in fieldnames[1:]))
+            
+            def format_rows():
+                dumps = json.dumps
+                for row in rows:
+                    # 简化导出数据，避免JSON字段过长
+                    response_data = row[6]
+                    if isinstance(response_data, str) and len(response_data) > 100:
+                        response_data = dumps(response_data[:100]) + '...'
+                    else:
+                        response_data = dumps(response_data)
+                    yield row[:6] + (response_data,) + row[7:]
+            
             # 导出到CSV文件
             with open(file_path, 'w', newline='', encoding='utf-8') as f:
-                writer = csv.DictWriter(f, fieldnames=fieldnames)
-                writer.writeheader()
-                for record in data_to_export:
-                    # 简化导出数据，避免JSON字段过长
-                    writer.writerow({
-                        'id': record.get('id', ''),
-                        'timestamp': record.get('timestamp', ''),
-                        'request_url': record.get('request_url', ''),
-                        'request_method': record.get('request_method', ''),
-                        'status_code': record.get('status_code', ''),
-                        'response_time': record.get('response_time', ''),
-                        'response_data': json.dumps(record.get('response_data', '')[:100]) + '...' if isinstance(record.get('response_data', ''), str) and len(record.get('response_data', '')) > 100 else json.dumps(record.get('response_data', '')),
-                        'tags': record.get('tags', '[]'),
-                        'metadata': record.get('metadata', '{}')
-                    })
+                writer = csv.writer(f)
+                writer.writerow(fieldnames)
+                writer.writerows(format_rows())
             
             logger_manager.info(f"[框架] 数据成功导出到CSV文件: {file_path}")
             return str(file_path)
@@ -304,9 +584,15 @@ class DataStorageManager:
     
     def clear_memory_data(self):
         """
-        清空内存中的数据存储
+        清空内存中的数据存储（记录ID不重置，之后的记录继续递增编号）
         """
-        self._data_store.clear()
+        with self._store_lock:
+            self._ids.clear()
+            for column in self._col_lists:
+                column.clear()
+            # 开启新会话，数据库中之前的记录不再参与过滤
+            self._session_id = uuid.uuid4().hex
+            self._db_in_sync = True
         logger_manager.info(f"[框架] 内存数据存储已清空")
     
     def get_record_count(self) -> int:
@@ -316,28 +602,41 @@ class DataStorageManager:
         Returns:
             int: 记录数量
         """
-        return len(self._data_store)
+        return len(self._ids)
     
-    def find_records_by_content(self, keyword: str) -> List[Dict[str, Any]]:
+    def find_records_by_content(self, keyword: Union[str, List[str]]) -> List[Dict[str, Any]]:
         """
         根据内容关键字查找记录
         
         Args:
-            keyword: 要查找的关键字
+            keyword: 要查找的关键字；传入关键字列表时，包含任一关键字的记录即匹配
             
         Returns:
             List[Dict[str, Any]]: 匹配的记录列表
         """
         try:
-            matching_records = []
-            for record in self._data_store:
-                # 在响应数据和请求参数中查找
-                if (keyword in str(record.get('response_data', '')) or 
-                    keyword in str(record.get('request_params', '')) or
-                    keyword in str(record.get('request_url', ''))):
-                    matching_records.append(record)
-            
-            logger_manager.debug(f"[框架] 关键字搜索完成，找到 {len(matching_records)} 条匹配记录")
+            cols = self._cols
+            # response_data 和 request_params 在存储时已转换为字符串，只有URL可能不是字符串
+            rows = enumerate(zip(cols['response_data'], cols['request_params'], cols['request_url']))
+            # 在响应数据和请求参数中查找
+            if isinstance(keyword, str):
+                matching_records = [
+                    self._record_at(i) for i, (data, params, url) in rows
+                    if (keyword in data or
+                        keyword in params or
+                        keyword in (url if url.__class__ is str else str(url)))
+                ]
+            else:
+                match = _build_keyword_matcher(list(keyword))
+                matching_records = [
+                    self._record_at(i) for i, (data, params, url) in rows
+                    if (match(data) or
+                        match(params) or
+                        match(url if url.__class__ is str else str(url)))
+                ]
+            
+            if logger_manager.is_enabled_for(logging.DEBUG):
+                logger_manager.debug(f"[框架] 关键字搜索完成，找到 {len(matching_records)} 条匹配记录")
             return matching_records
         except Exception as e:
             logger_manager.error(f"[框架] 内容搜索失败: {str(e)}")
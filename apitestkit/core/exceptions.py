@@ -2,18 +2,44 @@
 API测试工具包的异常类定义
 
 该模块包含ApiTestKit中使用的所有自定义异常类，用于提供清晰的错误信息和异常处理机制。
+构造时只保存消息和上下文属性，完整的错误信息在转换为字符串时才组装，
+被捕获后不输出的异常（如重试中的请求失败）无需格式化消息。
 """
 
 
+def _format_http_error(message: str, url: str, status_code: int, url_prefix: str) -> str:
+    """
+    组装HTTP请求/响应错误信息：可选的URL前缀和状态码后缀
+    
+    Args:
+        message: 错误信息
+        url: 请求URL
+        status_code: HTTP状态码
+        url_prefix: URL前缀模板，包含{url}占位符
+        
+    Returns:
+        str: 完整的错误信息
+    """
+    if url:
+        message = f"{url_prefix.format(url=url)}: {message}"
+    if status_code:
+        message = f"{message} (状态码: {status_code})"
+    return message
+
+
 class ApiTestKitError(Exception):
     """
     API测试工具包的基础异常类
     
     所有ApiTestKit特定的异常都应该继承自这个类，以提供一致的异常处理机制。
+    子类通过重写__str__在需要时组装带上下文的完整错误信息。
     """
     def __init__(self, message: str = "ApiTestKit基础错误"):
         self.message = message
-        super().__init__(self.message)
+        super().__init__(message)
+    
+    def __str__(self) -> str:
+        return str(self.message)
 
 
 class RequestError(ApiTestKitError):
@@ -25,11 +51,10 @@ class RequestError(ApiTestKitError):
     def __init__(self, message: str = "请求失败", url: str = None, status_code: int = None):
         self.url = url
         self.status_code = status_code
-        if url:
-            message = f"请求 '{url}' 失败: {message}"
-        if status_code:
-            message = f"{message} (状态码: {status_code})"
         super().__init__(message)
+    
+    def __str__(self) -> str:
+        return _format_http_error(self.message, self.url, self.status_code, "请求 '{url}' 失败")
 
 
 class ResponseError(ApiTestKitError):
@@ -41,11 +66,10 @@ class ResponseError(ApiTestKitError):
     def __init__(self, message: str = "响应处理失败", url: str = None, status_code: int = None):
         self.url = url
         self.status_code = status_code
-        if url:
-            message = f"响应 '{url}' 处理失败: {message}"
-        if status_code:
-            message = f"{message} (状态码: {status_code})"
         super().__init__(message)
+    
+    def __str__(self) -> str:
+        return _format_http_error(self.message, self.url, self.status_code, "响应 '{url}' 处理失败")
 
 
 class AssertionError(ApiTestKitError):
@@ -57,10 +81,13 @@ class AssertionError(ApiTestKitError):
     def __init__(self, message: str = "断言失败", expected=None, actual=None):
         self.expected = expected
         self.actual = actual
-        detail_message = f"{message}"
-        if expected is not None or actual is not None:
-            detail_message += f"\n期望: {expected}\n实际: {actual}"
-        super().__init__(detail_message)
+        super().__init__(message)
+    
+    def __str__(self) -> str:
+        detail_message = f"{self.message}"
+        if self.expected is not None or self.actual is not None:
+            detail_message += f"\n期望: {self.expected}\n实际: {self.actual}"
+        return detail_message
 
 
 class ConfigurationError(ApiTestKitError):
@@ -71,9 +98,12 @@ class ConfigurationError(ApiTestKitError):
     """
     def __init__(self, message: str = "配置错误", config_key: str = None):
         self.config_key = config_key
-        if config_key:
-            message = f"配置项 '{config_key}' 错误: {message}"
         super().__init__(message)
+    
+    def __str__(self) -> str:
+        if self.config_key:
+            return f"配置项 '{self.config_key}' 错误: {self.message}"
+        return str(self.message)
 
 
 class DataStorageError(ApiTestKitError):
@@ -84,9 +114,12 @@ class DataStorageError(ApiTestKitError):
     """
     def __init__(self, message: str = "数据存储操作失败", operation: str = None):
         self.operation = operation
-        if operation:
-            message = f"数据存储操作 '{operation}' 失败: {message}"
         super().__init__(message)
+    
+    def __str__(self) -> str:
+        if self.operation:
+            return f"数据存储操作 '{self.operation}' 失败: {self.message}"
+        return str(self.message)
 
 
 class ReportGenerationError(ApiTestKitError):
@@ -97,9 +130,12 @@ class ReportGenerationError(ApiTestKitError):
     """
     def __init__(self, message: str = "报告生成失败", report_type: str = None):
         self.report_type = report_type
-        if report_type:
-            message = f"{report_type} 报告生成失败: {message}"
         super().__init__(message)
+    
+    def __str__(self) -> str:
+        if self.report_type:
+            return f"{self.report_type} 报告生成失败: {self.message}"
+        return str(self.message)
 
 
 class ValidationError(ApiTestKitError):
@@ -110,10 +146,13 @@ class ValidationError(ApiTestKitError):
     """
     def __init__(self, message: str = "数据验证失败", validation_errors: list = None):
         self.validation_errors = validation_errors or []
-        if validation_errors:
-            error_details = "\n".join([f"- {err}" for err in validation_errors])
-            message = f"{message}:\n{error_details}"
         super().__init__(message)
+    
+    def __str__(self) -> str:
+        if self.validation_errors:
+            error_details = "\n".join([f"- {err}" for err in self.validation_errors])
+            return f"{self.message}:\n{error_details}"
+        return str(self.message)
 
 
 class TimeoutError(ApiTestKitError):
@@ -124,6 +163,9 @@ class TimeoutError(ApiTestKitError):
     """
     def __init__(self, message: str = "操作超时", timeout: float = None):
         self.timeout = timeout
-        if timeout:
-            message = f"{message} (超时时间: {timeout}秒)"
-        super().__init__(message)
\ No newline at end of file
+        super().__init__(message)
+    
+    def __str__(self) -> str:
+        if self.timeout:
+            return f"{self.message} (超时时间: {self.timeout}秒)"
+        return str(self.message)
\ No newline at end of file
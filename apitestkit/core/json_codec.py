@@ -0,0 +1,76 @@
+"""
+JSON编解码模块
+
+为日志和数据存储提供统一的JSON序列化与解析函数，保证无论是否安装orjson，
+输出的JSON格式都保持一致。
+"""
+
+import json
+from typing import Any
+
+# 尝试导入orjson（可选，用于加速JSON解析和缩进导出）
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def json_dumps(obj: Any, ensure_ascii: bool = True) -> str:
+    """
+    将对象序列化为JSON字符串，格式与json.dumps的默认分隔符(', ', ': ')一致
+
+    orjson只能输出紧凑格式，为了在是否安装orjson时输出相同，这里始终使用标准库json。
+
+    Args:
+        obj: 要序列化的对象
+        ensure_ascii: 是否转义非ASCII字符，默认为True
+
+    Returns:
+        str: JSON字符串
+    """
+    return json.dumps(obj, ensure_ascii=ensure_ascii)
+
+
+def json_dumps_indented(obj: Any) -> bytes:
+    """
+    将对象序列化为缩进2个空格、不转义非ASCII字符的UTF-8编码JSON，优先使用orjson
+
+    orjson的缩进输出与json.dumps(indent=2)的分隔符一致；
+    orjson无法处理的对象（如超出64位的整数）回退到标准库json。
+
+    Args:
+        obj: 要序列化的对象
+
+    Returns:
+        bytes: JSON字节串
+    """
+    if ORJSON_AVAILABLE:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+        except orjson.JSONEncodeError:
+            pass
+    return json.dumps(obj, ensure_ascii=False, indent=2).encode('utf-8')
+
+
+def json_loads(text: str) -> Any:
+    """
+    解析JSON文本，优先使用orjson
+
+    orjson无法解析的内容（如超出64位的整数）回退到标准库json。
+
+    Args:
+        text: JSON文本
+
+    Returns:
+        解析后的对象
+
+    Raises:
+        ValueError: 文本不是有效的JSON
+    """
+    if ORJSON_AVAILABLE:
+        try:
+            return orjson.loads(text)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(text)
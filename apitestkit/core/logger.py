@@ -6,17 +6,307 @@
 """
 
 import os
+import atexit
 import logging
+import queue
+import threading
 import time
+import weakref
 import json
 import tempfile
 import warnings
 import re
+import sys
+from dataclasses import dataclass
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, Any, Optional, Union, List
-from logging.handlers import RotatingFileHandler
+from logging.handlers import MemoryHandler, QueueHandler, QueueListener, RotatingFileHandler
 from apitestkit.core.config import config_manager
+from apitestkit.core.json_codec import json_dumps, json_loads
+
+# 默认的敏感关键字（键名包含任一关键字时掩码其值）
+_DEFAULT_SENSITIVE_KEYS = ['password', 'token', 'secret', 'key', 'auth',
+                           'credential', 'credit', 'card', 'ssn', 'social']
+
+# 默认的敏感请求头（日志中掩码其值）
+_DEFAULT_SENSITIVE_HEADERS = ['Authorization', 'Cookie', 'X-API-Key', 'Token',
+                              'Password', 'Secret', 'Key']
+
+# 文件名中的不安全字符（兼容Windows和Unix/Linux/MacOS的文件系统限制）
+_UNSAFE_FILENAME_RE = re.compile(r'[\\/*?"<>|]')
+
+# 用户日志文件名中替换为下划线的字符（空格和路径分隔符）
+_USER_LOG_NAME_TABLE = str.maketrans({' ': '_', '/': '_', '\\': '_'})
+
+# JSON文本扫描：完整的字符串、键名后的冒号、非字符串/容器值（数字、true/false/null）
+_JSON_STRING_RE = re.compile(r'"(?:[^"\\]|\\.)*"')
+_JSON_KEY_SEP_RE = re.compile(r'\s*:\s*')
+_JSON_LITERAL_RE = re.compile(r'[^,}\]\s]*')
+
+
+def _json_value_end(text: str, start: int) -> int:
+    """
+    查找从start开始的JSON值的结束位置，值在文本末尾被截断时返回文本长度
+    
+    Args:
+        text: JSON文本（可能被截断）
+        start: 值的起始位置
+        
+    Returns:
+        值结束后的位置
+    """
+    if start >= len(text):
+        return len(text)
+    char = text[start]
+    if char == '"':
+        match = _JSON_STRING_RE.match(text, start)
+        return match.end() if match else len(text)
+    if char not in '{[':
+        return _JSON_LITERAL_RE.match(text, start).end()
+    
+    depth = 0
+    i = start
+    while i < len(text):
+        char = text[i]
+        if char == '"':
+            match = _JSON_STRING_RE.match(text, i)
+            if match is None:
+                break
+            i = match.end()
+            continue
+        if char in '{[':
+            depth += 1
+        elif char in '}]':
+            depth -= 1
+            if depth == 0:
+                return i + 1
+        i += 1
+    return len(text)
+
+
+def _mask_json_prefix(text: str, is_sensitive) -> str:
+    """
+    在不解析的情况下掩码JSON文本（通常是截断后的前缀）中敏感键名对应的值
+    
+    按顺序扫描字符串，后跟冒号的字符串即为键名；敏感键名的值（包括嵌套结构）
+    整体替换为"***"，值在文本末尾被截断时掩码到末尾。
+    
+    Args:
+        text: JSON文本（可能被截断）
+        is_sensitive: 判断小写键名是否敏感的函数
+        
+    Returns:
+        掩码后的文本
+    """
+    parts = []
+    last = 0
+    i = text.find('"')
+    while i >= 0:
+        match = _JSON_STRING_RE.match(text, i)
+        if match is None:
+            # 字符串在文本末尾被截断
+            break
+        sep = _JSON_KEY_SEP_RE.match(text, match.end())
+        if sep is None:
+            # 字符串值，不是键名
+            i = text.find('"', match.end())
+            continue
+        try:
+            key = json.loads(match.group())
+        except ValueError:
+            key = match.group()[1:-1]
+        value_start = sep.end()
+        value_end = value_start
+        if is_sensitive(key.lower()):
+            value_end = _json_value_end(text, value_start)
+            parts.append(text[last:value_start])
+            parts.append('"***"')
+            last = value_end
+        i = text.find('"', value_end)
+    parts.append(text[last:])
+    return ''.join(parts)
+
+
+@lru_cache(maxsize=1024)
+def _safe_filename(name: str) -> str:
+    """
+    生成安全的文件名，测试名称通常会重复出现，结果按名称缓存
+    
+    Args:
+        name: 原始名称
+        
+    Returns:
+        安全的文件名
+    """
+    # 移除或替换不安全字符，确保跨平台兼容性
+    safe_name = _UNSAFE_FILENAME_RE.sub('_', name)
+    # 确保文件名不超过255个字符
+    return safe_name[:255]
+
+
+def _compile_sensitive_pattern(sensitive_keys) -> 're.Pattern':
+    """
+    将敏感关键字列表编译为一个子串匹配正则，一次扫描即可判断键名是否包含任一关键字
+    
+    Args:
+        sensitive_keys: 敏感关键字列表
+        
+    Returns:
+        编译后的正则表达式
+    """
+    keys = sorted({str(k).lower() for k in sensitive_keys}, key=len, reverse=True)
+    if not keys:
+        # 不匹配任何字符串
+        return re.compile(r'(?!)')
+    return re.compile('|'.join(map(re.escape, keys)))
+
+
+@lru_cache(maxsize=256)
+def _mask_headers_cached(header_items: tuple, sensitive_headers: frozenset) -> Dict[str, Any]:
+    """
+    掩码请求头中的敏感项，按(请求头, 敏感头列表)缓存结果
+    
+    测试中同一组请求头往往被反复发送，缓存后无需每次复制和掩码。
+    返回的字典在多次调用间共享，只能用于日志输出，不可修改。
+    
+    Args:
+        header_items: 请求头的(名称, 值)元组
+        sensitive_headers: 敏感头名称集合
+        
+    Returns:
+        掩码后的请求头字典
+    """
+    return {key: ('***' if key in sensitive_headers else value) for key, value in header_items}
+
+
+class _FastRotatingFileHandler(RotatingFileHandler):
+    """
+    轮转文件处理器，文件远未达到大小上限时跳过os.path.exists检查
+    
+    标准实现每条记录都会检查文件是否存在，这里先用流位置判断是否接近上限，
+    只有可能需要轮转时才交给标准实现做完整检查。
+    """
+    
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # 为True时每条记录写入后不刷新流，由批量写入方统一刷新
+        self.deferred_flush = False
+    
+    def flush(self):
+        """
+        刷新文件流，批量写入期间跳过
+        """
+        if not self.deferred_flush:
+            super().flush()
+    
+    def shouldRollover(self, record: logging.LogRecord) -> bool:
+        """
+        判断是否需要轮转日志文件
+        
+        Args:
+            record: 日志记录
+            
+        Returns:
+            是否需要轮转
+        """
+        if self.maxBytes <= 0:
+            return False
+        if self.stream is None:
+            self.stream = self._open()
+        msg = "%s\n" % self.format(record)
+        self.stream.seek(0, 2)
+        if self.stream.tell() + len(msg) < self.maxBytes:
+            return False
+        return super().shouldRollover(record)
+
+
+class _UserBufferHandler(MemoryHandler):
+    """
+    用户日志缓冲处理器
+    
+    记录先缓存在内存中，达到容量、遇到ERROR及以上级别或关闭时
+    一次性写入目标文件处理器，批量写入期间只刷新一次文件流。
+    关闭时会同时关闭目标文件处理器。
+    """
+    
+    def __init__(self, capacity: int, target: _FastRotatingFileHandler):
+        """
+        初始化缓冲处理器
+        
+        Args:
+            capacity: 缓存的记录条数上限
+            target: 目标文件处理器
+        """
+        super().__init__(capacity, flushLevel=logging.ERROR, target=target, flushOnClose=True)
+    
+    def flush(self):
+        """
+        将缓存的记录批量写入目标文件处理器
+        """
+        with self.lock:
+            target = self.target
+            if target is None or not self.buffer:
+                return
+            target.deferred_flush = True
+            try:
+                for record in self.buffer:
+                    target.handle(record)
+            finally:
+                target.deferred_flush = False
+            target.flush()
+            self.buffer.clear()
+    
+    def close(self):
+        """
+        写出剩余记录并关闭目标文件处理器
+        """
+        with self.lock:
+            target = self.target
+        super().close()
+        if target is not None:
+            target.close()
+
+
+class _UserQueueHandler(QueueHandler):
+    """
+    用户日志队列处理器
+    
+    记录放入队列后由后台QueueListener写入文件，调用线程不再执行文件写入和轮转检查。
+    ERROR及以上级别的记录会等待队列写完再返回，保证错误日志及时落盘且顺序不变；
+    在监听器线程上记录时不等待，否则监听器会等待自己处理完队列而死锁。
+    """
+    
+    def __init__(self, log_queue: queue.Queue):
+        super().__init__(log_queue)
+        # 关联的后台监听器，停止后置为None，避免等待已停止的队列
+        self.listener: Optional[QueueListener] = None
+    
+    def enqueue(self, record: logging.LogRecord):
+        """
+        将日志记录放入队列，高严重级别的记录等待写入完成
+        
+        Args:
+            record: 日志记录
+        """
+        self.queue.put_nowait(record)
+        if record.levelno >= logging.ERROR:
+            listener = self.listener
+            if listener is not None and listener._thread is not threading.current_thread():
+                self.queue.join()
+
+
+@dataclass(frozen=True)
+class _LogConfig:
+    """
+    请求/响应日志使用的配置快照，配置版本号变化时重建
+    """
+    sensitive_headers: tuple
+    sensitive_header_set: frozenset
+    sensitive_key_re: 're.Pattern'
+    max_response_log_length: int
+    enable_structured_logging: bool
 
 
 class LoggerManager:
@@ -38,8 +328,17 @@ class LoggerManager:
         self._user_loggers = {}
         # 为测试兼容，添加_loggers属性作为_framework_loggers的别名
         self._loggers = self._framework_loggers
+        # 是否已检测到测试环境（测试框架模块导入后不会卸载，检测到后不再重复检查）
+        self._is_test_env = False
         # 处理器列表
         self._handlers = []
+        # 用户日志记录器名称 -> (队列处理器, 后台写文件的QueueListener)
+        self._listeners: Dict[str, tuple] = {}
+        # 日志记录器名称 -> 有效日志级别的缓存，在创建记录器和修改级别时更新
+        self._level_cache: Dict[str, int] = {}
+        # 日志配置快照及其对应的配置版本号，配置修改后在下次使用时重建
+        self._log_config: Optional[_LogConfig] = None
+        self._log_config_version = -1
         # 日志级别映射
         self._log_level_map = {
             'DEBUG': logging.DEBUG,
@@ -49,17 +348,22 @@ class LoggerManager:
             'ERROR': logging.ERROR,
             'CRITICAL': logging.CRITICAL
         }
-        # 日志目录 - 初始化为None，在_ensure_log_directory中设置
+        # 日志目录 - 初始化为None，首次创建日志记录器时在_ensure_log_directory中设置
         self._log_dir = None
-        # 确保日志目录存在
-        self._ensure_log_directory()
-        # 初始化根日志记录器配置
-        self._configure_root_logger()
+        self._log_dir_path = None
+        # 日志目录是否已创建，目录配置未变化且仍存在时跳过mkdir
+        self._log_dir_ready = False
+        # 根日志记录器是否已配置（首次创建框架日志记录器时配置，导入模块时不访问文件系统）
+        self._root_configured = False
+        # 退出时停止后台监听器，确保队列中的用户日志写入文件
+        atexit.register(self._stop_listeners)
+        # 管理器被回收或解释器退出时关闭所有处理器（替代__del__，不影响循环垃圾回收）
+        self._finalizer = weakref.finalize(self, LoggerManager._cleanup, self._handlers)
         
     def _ensure_log_directory(self):
         """
         确保日志目录存在
-        每次都从配置中获取最新的日志目录
+        每次都从配置中获取最新的日志目录，目录未变化且已存在时直接返回
         """
         # 每次都从配置中获取最新的日志目录
         try:
@@ -68,18 +372,24 @@ class LoggerManager:
             if self._is_test_environment():
                 current_log_dir = tempfile.gettempdir()
             
+            # 目录已确认过且配置未变化时，只需确认目录仍然存在
+            if self._log_dir_ready and current_log_dir == self._log_dir and os.path.isdir(current_log_dir):
+                return
+            
             # 使用Path对象进行路径处理
             self._log_dir_path = Path(current_log_dir)
             self._log_dir = str(self._log_dir_path)
             
             # 确保目录存在
             self._log_dir_path.mkdir(parents=True, exist_ok=True)
-            logging.debug(f"日志目录已确认: {self._log_dir}")
+            self._log_dir_ready = True
+            logging.debug("日志目录已确认: %s", self._log_dir)
         except Exception as e:
             # 如果创建目录失败，回退到临时目录
             self._log_dir = tempfile.gettempdir()
             self._log_dir_path = Path(self._log_dir)
-            logging.warning(f"无法创建指定的日志目录，已回退到临时目录: {str(e)}")
+            self._log_dir_ready = False
+            logging.warning("无法创建指定的日志目录，已回退到临时目录: %s", e)
             
     def _generate_safe_filename(self, name: str) -> str:
         """
@@ -91,11 +401,7 @@ class LoggerManager:
         Returns:
             安全的文件名
         """
-        # 移除或替换不安全字符，确保跨平台兼容性
-        # 这个正则表达式可以处理Windows和Unix/Linux/MacOS的文件系统限制
-        safe_name = re.sub(r'[\\/*?"<>|]', '_', name)
-        # 确保文件名不超过255个字符
-        return safe_name[:255]
+        return _safe_filename(name)
             
     def _configure_root_logger(self):
         """
@@ -107,6 +413,7 @@ class LoggerManager:
         # 清除默认处理器
         for handler in root_logger.handlers[:]:
             root_logger.removeHandler(handler)
+        self._root_configured = True
     
     def _get_framework_logger(self, name='apitestkit'):
         """
@@ -130,23 +437,31 @@ class LoggerManager:
             bool: 是否在测试环境中
         """
         # 检查是否正在运行pytest或unittest
-        import sys
-        return 'pytest' in sys.modules or 'unittest' in sys.modules
+        if not self._is_test_env:
+            self._is_test_env = 'pytest' in sys.modules or 'unittest' in sys.modules
+        return self._is_test_env
     
-    def __del__(self):
+    @staticmethod
+    def _cleanup(handlers: list):
         """
-        析构函数，关闭所有处理器
+        关闭所有处理器
+        
+        Args:
+            handlers: 处理器列表
         """
-        try:
-            if hasattr(self, '_handlers'):
-                for handler in self._handlers[:]:  # 使用副本迭代
-                    try:
-                        handler.close()
-                    except:
-                        pass
-                self._handlers.clear()
-        except:
-            pass
+        for handler in handlers[:]:  # 使用副本迭代
+            try:
+                handler.close()
+            except Exception:
+                pass
+        handlers.clear()
+    
+    def close(self):
+        """
+        关闭日志管理器：停止用户日志的后台监听器并关闭所有处理器，多次调用无副作用
+        """
+        self._stop_listeners()
+        self._finalizer()
     
     def _setup_framework_logger(self, name):
         """
@@ -155,6 +470,10 @@ class LoggerManager:
         Args:
             name: 日志记录器名称
         """
+        # 首次创建框架日志记录器时初始化根日志记录器配置
+        if not self._root_configured:
+            self._configure_root_logger()
+        
         # 确保日志目录存在并获取最新路径
         self._ensure_log_directory()
         
@@ -197,6 +516,7 @@ class LoggerManager:
         self._handlers.append(console_handler)
         
         self._framework_loggers[name] = logger
+        self._level_cache[name] = logger.getEffectiveLevel()
         
         return logger
     
@@ -210,10 +530,11 @@ class LoggerManager:
         if level in self._log_level_map:
             config_manager.set('framework_log_level', level)
             # 更新所有已创建的框架日志记录器的级别
-            for logger in self._framework_loggers.values():
+            for name, logger in self._framework_loggers.items():
                 logger.setLevel(self._log_level_map[level])
                 for handler in logger.handlers:
                     handler.setLevel(self._log_level_map[level])
+                self._level_cache[name] = logger.getEffectiveLevel()
     
     def set_user_log_level(self, level):
         """
@@ -231,6 +552,7 @@ class LoggerManager:
                     # 用户日志只更新文件处理器级别
                     if isinstance(handler, logging.FileHandler):
                         handler.setLevel(self._log_level_map[level])
+                self._level_cache[logger.name] = logger.getEffectiveLevel()
     
     def set_level(self, level):
         """
@@ -252,6 +574,48 @@ class LoggerManager:
             logging.Logger: 日志记录器实例
         """
         return self._get_framework_logger(name)
+
+    def get_logger(self, name='apitestkit'):
+        """
+        获取框架日志记录器，供各模块以模块名创建自己的日志记录器
+
+        Args:
+            name: 日志记录器名称
+
+        Returns:
+            logging.Logger: 日志记录器实例
+        """
+        return self._get_framework_logger(name)
+
+    def is_enabled_for(self, level, name='apitestkit'):
+        """
+        检查框架日志记录器是否会处理指定级别的日志，
+        用于在构建开销较大的日志消息前提前判断
+        
+        Args:
+            level: 日志级别（如 logging.DEBUG）
+            name: 日志记录器名称
+            
+        Returns:
+            bool: 是否启用该级别
+        """
+        cached_level = self._level_cache.get(name)
+        if cached_level is None:
+            return self._get_framework_logger(name).isEnabledFor(level)
+        # 同时遵循 logging.disable() 的全局设置
+        return level >= cached_level and level > logging.root.manager.disable
+    
+    def _debug_on(self, name):
+        """
+        使用缓存的有效级别判断指定日志记录器是否启用DEBUG
+        
+        Args:
+            name: 日志记录器名称
+            
+        Returns:
+            bool: 是否启用DEBUG
+        """
+        return self.is_enabled_for(logging.DEBUG, name)
     
     def debug(self, message, name='apitestkit'):
         """
@@ -318,41 +682,36 @@ class LoggerManager:
         logger = self._get_logger(name)
         
         # 记录基本请求信息
-        logger.info(f"发送请求: {method} {url}")
+        logger.info("发送请求: %s %s", method, url)
+        
+        # 以下均为DEBUG级别的详细信息，未启用DEBUG时跳过敏感信息过滤和序列化
+        if not self._debug_on(name):
+            return
         
         # 过滤敏感信息
         if headers:
-            filtered_headers = headers.copy()
-            # 从配置获取敏感头列表
-            sensitive_headers = config_manager.get('sensitive_headers', 
-                                                 ['Authorization', 'Cookie', 'X-API-Key', 'Token', 
-                                                  'Password', 'Secret', 'Key'])
-            
-            for header in sensitive_headers:
-                if header in filtered_headers:
-                    filtered_headers[header] = '***'
-            logger.debug(f"请求头: {filtered_headers}")
+            logger.debug("请求头: %s", self._filter_headers(headers))
             
         if params:
             # 过滤URL参数中的敏感信息
             if isinstance(params, dict):
                 filtered_params = self._filter_sensitive_data(params)
-                logger.debug(f"URL参数: {filtered_params}")
+                logger.debug("URL参数: %s", filtered_params)
             else:
-                logger.debug(f"URL参数: {params}")
+                logger.debug("URL参数: %s", params)
             
         if json_data:
             # 过滤JSON中的敏感信息，支持复杂嵌套结构
             filtered_data = self._filter_sensitive_data(json_data)
             
             # 如果启用了结构化日志，使用不同格式
-            if config_manager.get('enable_structured_logging', False):
+            if self._get_log_config().enable_structured_logging:
                 try:
-                    logger.debug(f"请求数据: {json.dumps(filtered_data, ensure_ascii=False)}")
+                    logger.debug("请求数据: %s", json_dumps(filtered_data, ensure_ascii=False))
                 except Exception:
-                    logger.debug(f"请求数据: {filtered_data}")
+                    logger.debug("请求数据: %s", filtered_data)
             else:
-                logger.debug(f"请求数据: {filtered_data}")
+                logger.debug("请求数据: %s", filtered_data)
     
     def log_response(self, status_code, response_time, text=None, name='apitestkit.response'):
         """
@@ -367,25 +726,39 @@ class LoggerManager:
         logger = self._get_logger(name)
         
         # 记录基本响应信息
-        logger.info(f"收到响应: 状态码={status_code}, 响应时间={response_time:.2f}ms")
+        logger.info("收到响应: 状态码=%s, 响应时间=%.2fms", status_code, response_time)
         
         # 根据状态码增加额外日志级别
         if status_code >= 500:
-            logger.error(f"服务器错误响应: 状态码={status_code}")
+            logger.error("服务器错误响应: 状态码=%s", status_code)
         elif status_code >= 400:
-            logger.warning(f"客户端错误响应: 状态码={status_code}")
+            logger.warning("客户端错误响应: 状态码=%s", status_code)
         
-        if text and logger.level <= logging.DEBUG:
+        if text and self._debug_on(name):
+            log_config = self._get_log_config()
             # 限制响应体日志长度
-            max_length = config_manager.get('max_response_log_length', 1000)
+            max_length = log_config.max_response_log_length
             
             # 尝试解析JSON响应以过滤敏感信息
             filtered_text = text
+            # JSON中键名总在值之前：会被输出的前max_length个字符中不含敏感键名（及转义序列）时，
+            # 截断后的原文不会包含敏感值，无需解析和重新序列化
+            head = text[:max_length]
+            needs_filter = log_config.sensitive_key_re.search(head.lower()) is not None or '\\u' in head
+            is_json = needs_filter and text.lstrip().startswith(('{', '['))  # 简单检查是否为JSON
+            
+            if len(text) > max_length * 4:
+                # 大响应体只处理会被输出的前缀，不解析完整内容
+                if is_json:
+                    head = _mask_json_prefix(head, log_config.sensitive_key_re.search)
+                logger.debug("响应体: %s", head + '... (truncated)')
+                return
+            
             try:
-                if text.strip().startswith(('{', '[')):  # 简单检查是否为JSON
-                    response_data = json.loads(text)
+                if is_json:
+                    response_data = json_loads(text)
                     filtered_data = self._filter_sensitive_data(response_data)
-                    filtered_text = json.dumps(filtered_data, ensure_ascii=False)
+                    filtered_text = json_dumps(filtered_data, ensure_ascii=False)
             except Exception:
                 # 如果不是JSON或解析失败，使用原始文本
                 pass
@@ -394,8 +767,76 @@ class LoggerManager:
             if len(filtered_text) > max_length:
                 filtered_text = filtered_text[:max_length] + '... (truncated)'
             
-            logger.debug(f"响应体: {filtered_text}")
+            logger.debug("响应体: %s", filtered_text)
             
+    def reload_config(self) -> _LogConfig:
+        """
+        重新读取请求/响应日志相关配置，重新编译敏感关键字正则并清空请求头掩码缓存
+        
+        Returns:
+            新的日志配置快照
+        """
+        version = config_manager.version
+        sensitive_headers = tuple(config_manager.get('sensitive_headers', _DEFAULT_SENSITIVE_HEADERS))
+        self._log_config = _LogConfig(
+            sensitive_headers=sensitive_headers,
+            sensitive_header_set=frozenset(sensitive_headers),
+            sensitive_key_re=_compile_sensitive_pattern(
+                config_manager.get('sensitive_keys', _DEFAULT_SENSITIVE_KEYS)),
+            max_response_log_length=config_manager.get('max_response_log_length', 1000),
+            enable_structured_logging=config_manager.get('enable_structured_logging', False)
+        )
+        self._log_config_version = version
+        _mask_headers_cached.cache_clear()
+        return self._log_config
+    
+    def reload_sensitive_config(self):
+        """
+        根据配置中的 sensitive_keys 重新编译敏感关键字正则，并清空请求头掩码缓存
+        
+        Returns:
+            编译后的正则表达式
+        """
+        return self.reload_config().sensitive_key_re
+    
+    def _get_log_config(self) -> _LogConfig:
+        """
+        获取日志配置快照，配置版本号变化时自动重建
+        
+        Returns:
+            日志配置快照
+        """
+        if self._log_config_version != config_manager.version:
+            return self.reload_config()
+        return self._log_config
+    
+    def _filter_headers(self, headers) -> Any:
+        """
+        掩码请求头中的敏感项
+        
+        普通dict且值均可哈希时使用缓存结果；其他映射类型（如不区分大小写的请求头字典）
+        保持原有的复制后掩码方式，以保留其自身的键匹配规则。
+        
+        Args:
+            headers: 请求头
+            
+        Returns:
+            掩码后的请求头
+        """
+        log_config = self._get_log_config()
+        if headers.__class__ is dict:
+            try:
+                return _mask_headers_cached(tuple(headers.items()), log_config.sensitive_header_set)
+            except TypeError:
+                # 请求头值不可哈希，回退到不缓存的方式
+                pass
+        
+        filtered_headers = headers.copy()
+        for header in log_config.sensitive_headers:
+            if header in filtered_headers:
+                filtered_headers[header] = '***'
+        return filtered_headers
+    
     def _filter_sensitive_data(self, data: Any) -> Any:
         """
         过滤数据中的敏感信息，支持字典、列表和嵌套结构
@@ -406,29 +847,83 @@ class LoggerManager:
         Returns:
             过滤后的数据
         """
-        # 从配置获取敏感关键字列表
-        sensitive_keys = config_manager.get('sensitive_keys', 
-                                          ['password', 'token', 'secret', 'key', 'auth', 
-                                           'credential', 'credit', 'card', 'ssn', 'social'])
+        return self._mask_sensitive(data, self._get_log_config().sensitive_key_re.search)
+    
+    @staticmethod
+    def _contains_sensitive(data: Any, is_sensitive) -> bool:
+        """
+        检查数据中是否存在敏感键名，找到第一个即返回
         
-        if isinstance(data, dict):
-            filtered_data = data.copy()
-            for key, value in list(filtered_data.items()):  # 使用list创建副本避免迭代中修改
-                # 检查键名是否包含敏感词
-                key_lower = key.lower()
-                if any(sensitive in key_lower for sensitive in sensitive_keys):
-                    filtered_data[key] = '***'  # 掩码敏感值
-                # 递归处理嵌套结构
-                elif isinstance(value, (dict, list)):
-                    filtered_data[key] = self._filter_sensitive_data(value)
-            return filtered_data
+        Args:
+            data: 要检查的数据（字典、列表或基本类型）
+            is_sensitive: 判断小写键名是否敏感的函数
+            
+        Returns:
+            是否包含敏感键名
+        """
+        stack = [data]
+        while stack:
+            node = stack.pop()
+            if isinstance(node, dict):
+                for key, value in node.items():
+                    if is_sensitive(key.lower()):
+                        return True
+                    if isinstance(value, (dict, list)):
+                        stack.append(value)
+            elif isinstance(node, list):
+                stack.extend(item for item in node if isinstance(item, (dict, list)))
+        return False
+    
+    def _mask_sensitive(self, data: Any, is_sensitive) -> Any:
+        """
+        掩码数据中键名包含敏感关键字的值
         
-        elif isinstance(data, list):
-            # 处理列表中的每个元素
-            return [self._filter_sensitive_data(item) for item in data]
+        使用显式栈遍历嵌套结构，只复制需要修改的容器（写时复制）；
+        不含敏感键的数据原样返回，调用方不得修改返回值。
         
-        # 对于基本类型，直接返回
-        return data
+        Args:
+            data: 要过滤的数据（字典、列表或基本类型）
+            is_sensitive: 判断小写键名是否敏感的函数
+            
+        Returns:
+            过滤后的数据
+        """
+        if not isinstance(data, (dict, list)) or not self._contains_sensitive(data, is_sensitive):
+            return data
+        
+        # 栈帧: [原容器, 元素迭代器, 副本(未修改时为None), 正在处理的子元素键]
+        stack = [[data, iter(data.items() if isinstance(data, dict) else enumerate(data)), None, None]]
+        while True:
+            frame = stack[-1]
+            node = frame[0]
+            is_dict = isinstance(node, dict)
+            child = None
+            for key, value in frame[1]:
+                # 检查键名是否包含敏感词
+                if is_dict and is_sensitive(key.lower()):
+                    if frame[2] is None:
+                        frame[2] = node.copy()
+                    frame[2][key] = '***'  # 掩码敏感值
+                elif isinstance(value, (dict, list)):
+                    frame[3] = key
+                    child = value
+                    break
+            
+            if child is not None:
+                # 先处理嵌套结构，完成后回到当前容器继续
+                items = child.items() if isinstance(child, dict) else enumerate(child)
+                stack.append([child, iter(items), None, None])
+                continue
+            
+            stack.pop()
+            if not stack:
+                return node if frame[2] is None else frame[2]
+            if frame[2] is not None:
+                # 子容器被修改，父容器也需要复制后引用新的子容器
+                parent = stack[-1]
+                if parent[2] is None:
+                    parent[2] = parent[0].copy()
+                parent[2][parent[3]] = frame[2]
     
     def get_user_logger(self, name: str) -> logging.Logger:
         """
@@ -464,6 +959,9 @@ class LoggerManager:
         logger_name = f'user.{name}'
         logger = logging.getLogger(logger_name)
         
+        # 停止旧的后台监听器，写完队列中剩余的记录
+        self._stop_listener(logger_name)
+        
         # 清理现有处理器
         for handler in logger.handlers[:]:
             try:
@@ -479,21 +977,22 @@ class LoggerManager:
         )
         logger.setLevel(user_level)
         logger.propagate = True  # 允许传播到父日志记录器，确保框架日志能捕获用户日志
+        self._level_cache[logger_name] = logger.getEffectiveLevel()
         
         # 确保日志目录存在
         self._ensure_log_directory()
         
         # 生成安全的文件名
         timestamp = time.strftime('%Y%m%d_%H%M%S')
-        safe_name = name.replace(' ', '_').replace('/', '_').replace('\\', '_')
+        safe_name = name.translate(_USER_LOG_NAME_TABLE)
         log_file_path = self._log_dir_path / f'user_{safe_name}_{timestamp}.log'
         
         try:
-            # 使用RotatingFileHandler实现日志轮转
+            # 使用RotatingFileHandler实现日志轮转（未接近大小上限时跳过文件存在检查）
             max_bytes = config_manager.get('max_user_log_size_bytes', 5 * 1024 * 1024)  # 默认5MB
             backup_count = config_manager.get('user_log_backup_count', 3)
             
-            file_handler = RotatingFileHandler(
+            file_handler = _FastRotatingFileHandler(
                 log_file_path,
                 mode='a',
                 maxBytes=max_bytes,
@@ -509,8 +1008,23 @@ class LoggerManager:
                 datefmt='%Y-%m-%d %H:%M:%S'
             )
             file_handler.setFormatter(file_formatter)
-            logger.addHandler(file_handler)
-            self._handlers.append(file_handler)
+            
+            # 缓冲后批量写入文件，ERROR及以上级别立即写出
+            buffer_handler = _UserBufferHandler(
+                config_manager.get('user_log_buffer_capacity', 512),
+                file_handler
+            )
+            buffer_handler.setLevel(user_level)
+            self._handlers.append(buffer_handler)
+            
+            # 通过队列交给后台线程写文件，日志调用不阻塞在磁盘IO上
+            queue_handler = _UserQueueHandler(queue.Queue(-1))
+            queue_handler.setLevel(user_level)
+            listener = QueueListener(queue_handler.queue, buffer_handler, respect_handler_level=True)
+            listener.start()
+            queue_handler.listener = listener
+            logger.addHandler(queue_handler)
+            self._listeners[logger_name] = (queue_handler, listener)
             
         except Exception as e:
             print(f"警告: 创建用户日志文件处理器失败: {str(e)}")
@@ -548,11 +1062,46 @@ class LoggerManager:
         else:
             user_logger.info(message)
     
+    def _stop_listener(self, logger_name: str):
+        """
+        停止用户日志记录器的后台监听器，停止前会写完队列中的记录
+        
+        Args:
+            logger_name: 用户日志记录器名称
+        """
+        entry = self._listeners.pop(logger_name, None)
+        if entry is None:
+            return
+        queue_handler, listener = entry
+        queue_handler.listener = None
+        try:
+            listener.stop()
+        except Exception as e:
+            print(f"警告: 停止用户日志监听器时出错: {str(e)}")
+        # 缓冲和文件处理器由监听器持有，不在日志记录器的处理器列表中，需要单独关闭
+        for handler in listener.handlers:
+            try:
+                handler.close()
+            except Exception:
+                pass
+            if handler in self._handlers:
+                self._handlers.remove(handler)
+    
+    def _stop_listeners(self):
+        """
+        停止所有用户日志的后台监听器
+        """
+        for logger_name in list(self._listeners):
+            self._stop_listener(logger_name)
+    
     def clear_user_loggers(self):
         """
         清理所有用户日志记录器
         """
         try:
+            # 先停止后台监听器，确保队列中的日志已写入文件
+            self._stop_listeners()
+            
             # 关闭并清理所有用户日志处理器
             for name, logger in list(self._user_loggers.items()):
                 for handler in logger.handlers[:]:  # 使用副本迭代
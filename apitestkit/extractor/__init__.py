@@ -1,5 +1,5 @@
 """数据提取器模块初始化文件"""
 
-from apitestkit.extractor.data_extractor import DataExtractor, data_extractor
+from apitestkit.extractor.data_extractor import DataExtractor, ExtractionPlan, data_extractor
 
-__all__ = ['DataExtractor', 'data_extractor']
\ No newline at end of file
+__all__ = ['DataExtractor', 'ExtractionPlan', 'data_extractor']
\ No newline at end of file
@@ -3,108 +3,569 @@
 提供从响应中提取特定数据的功能，支持多种提取方式
 """
 
+import concurrent.futures
+import os
 import re
-import jsonpath_ng
-import xml.etree.ElementTree as ET
-from typing import Any, Optional, Union, List, Dict
+import threading
+from functools import lru_cache
+from operator import attrgetter, itemgetter
+from typing import Any, Optional, Union, List, Dict, TYPE_CHECKING
 import logging
 
 from apitestkit.core.logger import logger_manager
 from apitestkit.exception.exceptions import ApiTestException
 from apitestkit.response.handler import response_handler
 
+if TYPE_CHECKING:
+    import xml.etree.ElementTree as ET
+
 # 获取日志记录器
 logger = logger_manager.get_logger(__name__)
 
+# 尝试导入google-re2（可选，线性时间的正则引擎，避免回溯型表达式在大响应体上的灾难性回溯）
+try:
+    import re2
+    RE2_AVAILABLE = True
+except ImportError:
+    RE2_AVAILABLE = False
+
+# 尝试导入lxml（可选，基于libxml2的完整XPath 1.0支持，比ElementTree的路径查找更快）
+try:
+    from lxml import etree as LET
+    LXML_AVAILABLE = True
+except ImportError:
+    LXML_AVAILABLE = False
+
+# 自身支持不区分大小写查找的响应头类型（requests、httpx、aiohttp/multidict）
+_CASE_INSENSITIVE_HEADER_TYPES = frozenset({'CaseInsensitiveDict', 'Headers', 'CIMultiDict', 'CIMultiDictProxy'})
+
+# 键名取值时表示键不存在
+_MISSING = object()
+
+# 取出JSONPath匹配结果中的值
+_MATCH_VALUE = attrgetter('value')
+
+# 一次取出提取配置中的名称、类型和表达式
+_CONFIG_FIELDS = itemgetter('name', 'type', 'expr')
+
+# 提取计划中可并行的步骤（re2正则、lxml XPath）达到该数量时使用线程池执行
+_PARALLEL_MIN_STEPS = 8
+
+# 并行提取共用的线程池，首次需要时创建
+_executor: Optional[concurrent.futures.ThreadPoolExecutor] = None
+_executor_lock = threading.Lock()
+
+# 设置环境变量 APITESTKIT_REGEX=re2 且安装了google-re2时，正则提取优先使用re2
+_USE_RE2 = RE2_AVAILABLE and os.environ.get('APITESTKIT_REGEX', '').lower() == 're2'
+
+
+@lru_cache(maxsize=512)
+def _parse_jsonpath(jsonpath_expr: str):
+    """
+    编译JSONPath表达式，按表达式缓存编译结果
+    
+    jsonpath_ng的解析开销远大于查找本身，同一表达式在多个响应上重复使用时只解析一次。
+    编译结果不可变，可在线程间共享。jsonpath_ng在首次使用时才导入，
+    只使用其他提取方式时无需加载其解析器。
+    
+    Args:
+        jsonpath_expr: JSONPath表达式
+        
+    Returns:
+        编译后的JSONPath表达式对象
+    """
+    import jsonpath_ng
+    return jsonpath_ng.parse(jsonpath_expr)
+
+
+@lru_cache(maxsize=256)
+def _compile_regex(regex_pattern: str, flags: int = 0) -> 're.Pattern':
+    """
+    编译正则表达式，按(表达式, 标志)缓存编译结果
+    
+    启用re2时优先用re2编译；有标志或re2不支持的语法（如反向引用）时回退到标准库re。
+    
+    Args:
+        regex_pattern: 正则表达式
+        flags: 正则标志
+        
+    Returns:
+        编译后的正则表达式
+    """
+    if _USE_RE2 and not flags:
+        try:
+            return re2.compile(regex_pattern)
+        except re2.error:
+            pass
+    return re.compile(regex_pattern, flags)
+
+
+@lru_cache(maxsize=1024)
+def _compile_key_accessor(key: str):
+    """
+    为点分隔的键名生成取值函数，按键名缓存，避免每次调用都拆分键名
+    
+    Args:
+        key: 键名，支持嵌套键名，如 'user.name'
+        
+    Returns:
+        取值函数 access(data, default)
+    """
+    parts = tuple(key.split('.'))
+    
+    if len(parts) == 1:
+        # 单层键名：精确的dict类型直接用一次get取值
+        def access(data: Any, default: Any = None) -> Any:
+            if data.__class__ is dict:
+                return data.get(key, default)
+            if isinstance(data, dict) and key in data:
+                return data[key]
+            return default
+        
+        return access
+    
+    def access(data: Any, default: Any = None) -> Any:
+        value = data
+        for part in parts:
+            if value.__class__ is dict:
+                # 精确的dict类型只做一次哈希查找
+                value = value.get(part, _MISSING)
+                if value is _MISSING:
+                    return default
+            elif isinstance(value, dict) and part in value:
+                # dict子类仍按isinstance和in处理（保留__contains__的自定义行为）
+                value = value[part]
+            else:
+                return default
+        return value
+    
+    return access
+
+
+@lru_cache(maxsize=256)
+def _compile_xpath(xpath_expr: str):
+    """
+    编译lxml XPath表达式，按表达式缓存；不是合法XPath（如ElementTree的{ns}tag写法）时返回None
+    
+    Args:
+        xpath_expr: XPath表达式
+        
+    Returns:
+        编译后的XPath对象或None
+    """
+    try:
+        return LET.XPath(xpath_expr)
+    except LET.XPathSyntaxError:
+        return None
+
+
+def _parse_lxml(response: object) -> Any:
+    """
+    使用lxml解析响应中的XML，无法解析时返回None（由ElementTree处理并报告错误）
+    
+    不解析外部实体、不访问网络，与标准库ElementTree的行为保持一致。
+    
+    Args:
+        response: 响应对象
+        
+    Returns:
+        lxml元素或None
+    """
+    text = response_handler.get_text(response)
+    try:
+        return LET.fromstring(text, parser=LET.XMLParser(resolve_entities=False, no_network=True))
+    except (ValueError, LET.XMLSyntaxError):
+        # ValueError: 带编码声明的字符串等lxml不接受的输入
+        return None
+
+
+def _get_body(response: object, kind: str, bodies: Dict[str, Any]) -> Any:
+    """
+    获取响应体的解析结果，同一批提取中每种格式只解析一次
+    
+    缓存只在一次 extract_from_response 调用或一次 ExtractionPlan.run 内有效，
+    之后的提取会重新解析响应体，因此修改提取结果或响应内容不会影响后续提取。
+    
+    Args:
+        response: 响应对象
+        kind: 响应体格式，'json'、'text'、'xml' 或 'lxml'
+        bodies: 本批提取共享的解析结果缓存
+        
+    Returns:
+        解析后的响应体
+    """
+    if kind not in bodies:
+        if kind == 'lxml':
+            bodies[kind] = _parse_lxml(response)
+        else:
+            bodies[kind] = getattr(response_handler, f'get_{kind}')(response)
+    return bodies[kind]
+
+
+def _get_executor() -> concurrent.futures.ThreadPoolExecutor:
+    """
+    获取并行提取共用的线程池
+    
+    Returns:
+        线程池，工作线程数不超过8
+    """
+    global _executor
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                _executor = concurrent.futures.ThreadPoolExecutor(
+                    max_workers=min(8, os.cpu_count() or 1),
+                    thread_name_prefix='apitestkit-extractor'
+                )
+    return _executor
+
+
+def _jsonpath_values(expression: Any, data: Any, first_only: bool = False) -> List[Any]:
+    """
+    使用编译后的JSONPath表达式查找值
+    
+    Args:
+        expression: 编译后的JSONPath表达式
+        data: 字典或列表数据
+        first_only: 是否只返回第一个匹配的值
+        
+    Returns:
+        匹配的值列表
+    """
+    if first_only:
+        match = next(iter(expression.find(data)), None)
+        return [match.value] if match is not None else []
+    # 返回所有匹配的值，匹配结果列表不在本函数中保留引用
+    return list(map(_MATCH_VALUE, expression.find(data)))
+
+
+def _regex_values(pattern: 're.Pattern', text: str, group: Optional[Union[int, str]] = None,
+                  first_only: bool = False) -> List[Any]:
+    """
+    使用编译后的正则表达式查找值，未指定group时结果形式与findall一致
+    
+    Args:
+        pattern: 编译后的正则表达式
+        text: 文本内容
+        group: 提取的组编号或组名，与Match.group相同（0为整个匹配），如果为None则提取全部匹配
+        first_only: 是否只查找第一个匹配项
+        
+    Returns:
+        匹配的值列表
+    """
+    if group is not None:
+        # 直接从匹配对象取指定组，不构造findall的元组列表
+        if first_only:
+            match = pattern.search(text)
+            return [match.group(group)] if match is not None else []
+        return [match.group(group) for match in pattern.finditer(text)]
+    
+    if first_only:
+        # 只查找第一个匹配项，结果形式与findall保持一致
+        match = pattern.search(text)
+        if match is None:
+            matches = []
+        elif pattern.groups == 0:
+            matches = [match.group(0)]
+        elif pattern.groups == 1:
+            matches = [match.groups('')[0]]
+        else:
+            matches = [match.groups('')]
+    else:
+        # 查找所有匹配项
+        matches = pattern.findall(text)
+    
+    return matches
+
+
+def _xpath_values(xml_element: Any, xpath_expr: str, xpath: Any = None,
+                  first_only: bool = False) -> List[Any]:
+    """
+    使用XPath从XML元素中查找值
+    
+    Args:
+        xml_element: XML元素（ElementTree或lxml）
+        xpath_expr: XPath表达式
+        xpath: 编译后的lxml XPath对象，为None时使用ElementTree的路径查找
+        first_only: 是否只返回第一个匹配的元素或值
+        
+    Returns:
+        匹配的元素或值列表
+    """
+    if xpath is not None and isinstance(xml_element, LET._Element):
+        found = xpath(xml_element)
+        if not isinstance(found, list):
+            # 数值、布尔或字符串结果
+            found = [found]
+        elif first_only:
+            found = found[:1]
+        result = []
+        for item in found:
+            if isinstance(item, LET._Element):
+                result.append(item.text.strip() if item.text is not None else item)
+            elif isinstance(item, str):
+                # lxml返回的字符串会引用所在文档，转换为普通字符串
+                result.append(str(item))
+            else:
+                result.append(item)
+        return result
+    
+    if first_only:
+        # 只查找第一个匹配的元素
+        elem = xml_element.find(xpath_expr)
+        elements = [] if elem is None else [elem]
+    else:
+        # 查找所有匹配的元素
+        elements = xml_element.findall(xpath_expr)
+    # 返回元素列表或元素文本
+    result = []
+    for elem in elements:
+        if elem.text is not None:
+            result.append(elem.text.strip())
+        else:
+            result.append(elem)
+    return result
+
+
+class ExtractionPlan:
+    """
+    预编译的批量提取计划，由 DataExtractor.prepare 生成
+    
+    创建计划时按配置编译好正则、JSONPath、XPath和键名取值函数，run 可在多个响应上重复执行，
+    每次执行不再解析表达式。计划创建后不再修改，可在线程间共享。
+    """
+    
+    __slots__ = ('_steps', '_names', '_parallel')
+    
+    def __init__(self, extract_configs: List[Dict[str, Any]]):
+        """
+        初始化提取计划
+        
+        Args:
+            extract_configs: 提取配置列表，每个配置包含 'name', 'type', 'expr'，
+                正则提取可选 'group'
+        """
+        steps = []
+        for config in extract_configs:
+            # 配置在创建计划时一次性校验和规范化，执行时只做元组解包
+            if not isinstance(config, dict):
+                steps.append(('unknown', None, None, None,
+                              ApiTestException(f"提取配置必须是字典: {config!r}")))
+                continue
+            name = config.get('name', 'unknown')
+            missing = [field for field in ('name', 'type', 'expr') if field not in config]
+            if missing:
+                steps.append((name, None, None, None,
+                              ApiTestException(f"提取配置缺少字段: {', '.join(missing)}")))
+                continue
+            try:
+                _, extractor_type, extractor_expr = _CONFIG_FIELDS(config)
+                extractor_type = extractor_type.lower()
+                steps.append((name, extractor_type, self._compile(extractor_type, extractor_expr),
+                              config.get('group'), None))
+            except Exception as e:
+                # 配置错误在执行时按提取失败处理，与 extract_multiple 的行为一致
+                steps.append((name, None, None, None, e))
+        self._steps = tuple(steps)
+        self._names = tuple(step[0] for step in steps)
+        # 执行时释放GIL的步骤（re2正则、lxml XPath）足够多时才值得并行，标准库re在线程中无法并行
+        parallel = tuple(index for index, step in enumerate(steps) if self._releases_gil(step))
+        self._parallel = parallel if len(parallel) >= _PARALLEL_MIN_STEPS else ()
+    
+    @staticmethod
+    def _releases_gil(step: tuple) -> bool:
+        """
+        判断步骤的匹配引擎是否在C代码中执行且释放GIL
+        
+        Args:
+            step: 提取步骤
+            
+        Returns:
+            re2正则或lxml XPath步骤返回True
+        """
+        _, extractor_type, compiled, _, error = step
+        if error is not None:
+            return False
+        if extractor_type == 'regex':
+            return RE2_AVAILABLE and not isinstance(compiled, re.Pattern)
+        if extractor_type == 'xpath':
+            return compiled[0] is not None
+        return False
+    
+    @staticmethod
+    def _compile(extractor_type: str, extractor_expr: str) -> Any:
+        """
+        按提取器类型编译表达式
+        
+        Args:
+            extractor_type: 小写的提取器类型
+            extractor_expr: 提取表达式
+            
+        Returns:
+            编译结果；xpath类型在lxml不可用或表达式无法编译时为 (None, 表达式)
+            
+        Raises:
+            ApiTestException: 不支持的提取器类型
+        """
+        if extractor_type == 'jsonpath':
+            return _parse_jsonpath(extractor_expr)
+        if extractor_type == 'regex':
+            return _compile_regex(extractor_expr)
+        if extractor_type == 'xpath':
+            return (_compile_xpath(extractor_expr) if LXML_AVAILABLE else None, extractor_expr)
+        if extractor_type == 'key':
+            return _compile_key_accessor(extractor_expr)
+        raise ApiTestException(f"不支持的提取器类型: {extractor_type}")
+    
+    def run(self, response: object) -> Dict[str, List[Any]]:
+        """
+        在响应上执行提取计划
+        
+        Args:
+            response: 响应对象
+            
+        Returns:
+            提取结果字典，键为名称，值为提取的值列表；提取失败的名称对应空列表。
+            同一次执行中提取到的dict、list值来自同一份解析结果，可能互相引用
+        """
+        results = dict.fromkeys(self._names)
+        # 本次执行的所有步骤共享响应体的解析结果，每种格式只解析一次
+        bodies = {}
+        
+        futures = {}
+        if self._parallel:
+            # 先在当前线程解析响应体，工作线程只读取解析结果
+            for kind in ('text', 'lxml'):
+                try:
+                    _get_body(response, kind, bodies)
+                except Exception:
+                    # 解析失败由对应步骤在执行时报告
+                    pass
+            executor = _get_executor()
+            futures = {index: executor.submit(self._execute, *self._steps[index][1:4], response, bodies)
+                       for index in self._parallel}
+        
+        for index, (name, extractor_type, compiled, group, error) in enumerate(self._steps):
+            if error is not None:
+                logger.error("多数据提取失败: %s, 错误: %s", name, error)
+                results[name] = []
+                continue
+            
+            try:
+                future = futures.get(index)
+                if future is not None:
+                    results[name] = future.result()
+                else:
+                    results[name] = self._execute(extractor_type, compiled, group, response, bodies)
+                
+            except Exception as e:
+                logger.error("多数据提取失败: %s, 错误: %s", name, e)
+                results[name] = []
+        
+        return results
+    
+    @staticmethod
+    def _execute(extractor_type: str, compiled: Any, group: Optional[Union[int, str]],
+                 response: object, bodies: Dict[str, Any]) -> List[Any]:
+        """
+        执行单个提取步骤
+        
+        Args:
+            extractor_type: 小写的提取器类型
+            compiled: 编译后的表达式
+            group: 正则提取的组编号或组名
+            response: 响应对象
+            bodies: 响应体解析结果缓存
+            
+        Returns:
+            提取的值列表
+        """
+        if extractor_type == 'jsonpath':
+            return _jsonpath_values(compiled, _get_body(response, 'json', bodies))
+        if extractor_type == 'regex':
+            return _regex_values(compiled, _get_body(response, 'text', bodies), group)
+        if extractor_type == 'xpath':
+            xpath, xpath_expr = compiled
+            xml_element = _get_body(response, 'lxml', bodies) if xpath is not None else None
+            if xml_element is None:
+                xml_element = _get_body(response, 'xml', bodies)
+            return _xpath_values(xml_element, xpath_expr, xpath)
+        value = compiled(_get_body(response, 'json', bodies), None)
+        return [value] if value is not None else []
+
 
 class DataExtractor:
     """
     数据提取器，提供多种数据提取方式
     """
     
-    def extract_by_jsonpath(self, data: Union[Dict[str, Any], list], jsonpath_expr: str) -> List[Any]:
+    def extract_by_jsonpath(self, data: Union[Dict[str, Any], list], jsonpath_expr: str,
+                            first_only: bool = False) -> List[Any]:
         """
         使用JSONPath从数据中提取值
         
         Args:
             data: 字典或列表数据
             jsonpath_expr: JSONPath表达式
+            first_only: 是否只返回第一个匹配的值
             
         Returns:
             提取的值列表
         """
         try:
-            # 编译JSONPath表达式
-            expression = jsonpath_ng.parse(jsonpath_expr)
-            # 查找所有匹配项
-            matches = expression.find(data)
-            # 返回所有匹配的值
-            return [match.value for match in matches]
+            # 编译JSONPath表达式（带缓存）
+            return _jsonpath_values(_parse_jsonpath(jsonpath_expr), data, first_only)
             
         except Exception as e:
-            logger.error(f"JSONPath提取失败: {jsonpath_expr}, 错误: {str(e)}")
+            logger.error("JSONPath提取失败: %s, 错误: %s", jsonpath_expr, e)
             raise ApiTestException(f"JSONPath提取失败: {jsonpath_expr}, 错误: {str(e)}")
     
-    def extract_by_regex(self, text: str, regex_pattern: str, group: Optional[int] = None) -> List[str]:
+    def extract_by_regex(self, text: str, regex_pattern: str, group: Optional[Union[int, str]] = None,
+                         first_only: bool = False) -> List[str]:
         """
         使用正则表达式从文本中提取值
         
         Args:
             text: 文本内容
             regex_pattern: 正则表达式
-            group: 提取的组索引，如果为None则提取全部匹配
+            group: 提取的组编号或组名，与Match.group相同（0为整个匹配），如果为None则提取全部匹配
+            first_only: 是否只查找第一个匹配项，找到后不再扫描剩余文本
             
         Returns:
             提取的值列表
         """
         try:
-            # 编译正则表达式
-            pattern = re.compile(regex_pattern)
-            # 查找所有匹配项
-            matches = pattern.findall(text)
-            
-            # 根据group参数返回对应的值
-            if group is not None:
-                # 确保matches中的元素是元组
-                result = []
-                for match in matches:
-                    if isinstance(match, tuple) and len(match) > group:
-                        result.append(match[group])
-                    elif group == 0:
-                        result.append(match)
-                return result
-            
-            return matches
+            # 编译正则表达式（带缓存）
+            return _regex_values(_compile_regex(regex_pattern), text, group, first_only)
             
         except Exception as e:
-            logger.error(f"正则表达式提取失败: {regex_pattern}, 错误: {str(e)}")
+            logger.error("正则表达式提取失败: %s, 错误: %s", regex_pattern, e)
             raise ApiTestException(f"正则表达式提取失败: {regex_pattern}, 错误: {str(e)}")
     
-    def extract_by_xpath(self, xml_element: ET.Element, xpath_expr: str) -> List[Any]:
+    def extract_by_xpath(self, xml_element: 'ET.Element', xpath_expr: str,
+                         first_only: bool = False) -> List[Any]:
         """
         使用XPath从XML元素中提取值
         
+        传入lxml元素时使用编译后的lxml XPath（支持完整XPath 1.0，如text()、@attr）；
+        ElementTree元素或lxml无法编译的表达式使用ElementTree的路径查找。
+        
         Args:
-            xml_element: XML元素
+            xml_element: XML元素（ElementTree或lxml）
             xpath_expr: XPath表达式
+            first_only: 是否只返回第一个匹配的元素或值
             
         Returns:
             提取的元素或值列表
         """
         try:
-            # 查找所有匹配的元素
-            elements = xml_element.findall(xpath_expr)
-            # 返回元素列表或元素文本
-            result = []
-            for elem in elements:
-                if elem.text is not None:
-                    result.append(elem.text.strip())
-                else:
-                    result.append(elem)
-            return result
+            xpath = None
+            if LXML_AVAILABLE and isinstance(xml_element, LET._Element):
+                xpath = _compile_xpath(xpath_expr)
+            return _xpath_values(xml_element, xpath_expr, xpath, first_only)
             
         except Exception as e:
-            logger.error(f"XPath提取失败: {xpath_expr}, 错误: {str(e)}")
+            logger.error("XPath提取失败: %s, 错误: %s", xpath_expr, e)
             raise ApiTestException(f"XPath提取失败: {xpath_expr}, 错误: {str(e)}")
     
     def extract_by_key(self, data: Dict[str, Any], key: str, default: Any = None) -> Any:
@@ -120,23 +581,15 @@ class DataExtractor:
             提取的值或默认值
         """
         try:
-            # 支持嵌套键名，如 'user.name'
-            keys = key.split('.')
-            value = data
-            
-            for k in keys:
-                if isinstance(value, dict) and k in value:
-                    value = value[k]
-                else:
-                    return default
-            
-            return value
+            # 支持嵌套键名，如 'user.name'，取值函数按键名缓存
+            return _compile_key_accessor(key)(data, default)
             
         except Exception as e:
-            logger.error(f"键值提取失败: {key}, 错误: {str(e)}")
+            logger.error("键值提取失败: %s, 错误: %s", key, e)
             return default
     
-    def extract_from_response(self, response: object, extractor_type: str, extractor_expr: str) -> List[Any]:
+    def extract_from_response(self, response: object, extractor_type: str, extractor_expr: str,
+                              first_only: bool = False) -> List[Any]:
         """
         从响应中提取数据
         
@@ -144,40 +597,78 @@ class DataExtractor:
             response: 响应对象
             extractor_type: 提取器类型，支持 'jsonpath', 'regex', 'xpath', 'key'
             extractor_expr: 提取表达式
+            first_only: 是否只提取第一个匹配的值
+            
+        Returns:
+            提取的值列表
+        """
+        return self._extract_from_response(response, extractor_type, extractor_expr, {}, first_only)
+    
+    def _extract_from_response(self, response: object, extractor_type: str, extractor_expr: str,
+                               bodies: Dict[str, Any], first_only: bool = False) -> List[Any]:
+        """
+        从响应中提取数据，响应体的解析结果保存在bodies中供同一批提取复用
+        
+        Args:
+            response: 响应对象
+            extractor_type: 提取器类型，支持 'jsonpath', 'regex', 'xpath', 'key'
+            extractor_expr: 提取表达式
+            bodies: 响应体解析结果缓存
+            first_only: 是否只提取第一个匹配的值
             
         Returns:
             提取的值列表
         """
         try:
             # 根据提取器类型选择不同的提取方法
-            if extractor_type.lower() == 'jsonpath':
-                # 确保响应是JSON格式
-                data = response_handler.get_json(response)
-                return self.extract_by_jsonpath(data, extractor_expr)
-                
-            elif extractor_type.lower() == 'regex':
-                # 获取响应文本
-                text = response_handler.get_text(response)
-                return self.extract_by_regex(text, extractor_expr)
-                
-            elif extractor_type.lower() == 'xpath':
-                # 确保响应是XML格式
-                xml_element = response_handler.get_xml(response)
-                return self.extract_by_xpath(xml_element, extractor_expr)
-                
-            elif extractor_type.lower() == 'key':
-                # 确保响应是JSON格式
-                data = response_handler.get_json(response)
-                value = self.extract_by_key(data, extractor_expr)
-                return [value] if value is not None else []
-                
-            else:
+            extractor = self._RESPONSE_EXTRACTORS.get(extractor_type.lower())
+            if extractor is None:
                 raise ApiTestException(f"不支持的提取器类型: {extractor_type}")
+            return extractor(self, response, extractor_expr, bodies, first_only)
                 
         except Exception as e:
-            logger.error(f"从响应提取数据失败: {extractor_type}, {extractor_expr}, 错误: {str(e)}")
+            logger.error("从响应提取数据失败: %s, %s, 错误: %s", extractor_type, extractor_expr, e)
             raise ApiTestException(f"从响应提取数据失败: {extractor_type}, {extractor_expr}, 错误: {str(e)}")
     
+    def _jsonpath_from_response(self, response: object, extractor_expr: str,
+                                bodies: Dict[str, Any], first_only: bool) -> List[Any]:
+        """使用JSONPath从响应中提取数据"""
+        # 确保响应是JSON格式
+        data = _get_body(response, 'json', bodies)
+        return self.extract_by_jsonpath(data, extractor_expr, first_only=first_only)
+    
+    def _regex_from_response(self, response: object, extractor_expr: str,
+                             bodies: Dict[str, Any], first_only: bool) -> List[Any]:
+        """使用正则表达式从响应中提取数据"""
+        # 获取响应文本
+        text = _get_body(response, 'text', bodies)
+        return self.extract_by_regex(text, extractor_expr, first_only=first_only)
+    
+    def _xpath_from_response(self, response: object, extractor_expr: str,
+                             bodies: Dict[str, Any], first_only: bool) -> List[Any]:
+        """使用XPath从响应中提取数据"""
+        # 确保响应是XML格式，优先使用lxml解析
+        xml_element = _get_body(response, 'lxml', bodies) if LXML_AVAILABLE else None
+        if xml_element is None:
+            xml_element = _get_body(response, 'xml', bodies)
+        return self.extract_by_xpath(xml_element, extractor_expr, first_only=first_only)
+    
+    def _key_from_response(self, response: object, extractor_expr: str,
+                           bodies: Dict[str, Any], first_only: bool) -> List[Any]:
+        """通过键名从响应中提取数据"""
+        # 确保响应是JSON格式
+        data = _get_body(response, 'json', bodies)
+        value = self.extract_by_key(data, extractor_expr)
+        return [value] if value is not None else []
+    
+    # 提取器类型（小写）到提取方法的映射
+    _RESPONSE_EXTRACTORS = {
+        'jsonpath': _jsonpath_from_response,
+        'regex': _regex_from_response,
+        'xpath': _xpath_from_response,
+        'key': _key_from_response,
+    }
+    
     def extract_cookie(self, response: object, cookie_name: str) -> Optional[str]:
         """
         从响应中提取指定的cookie
@@ -193,7 +684,7 @@ class DataExtractor:
             cookies = response_handler.extract_cookies(response)
             return cookies.get(cookie_name)
         except Exception as e:
-            logger.error(f"提取Cookie失败: {cookie_name}, 错误: {str(e)}")
+            logger.error("提取Cookie失败: %s, 错误: %s", cookie_name, e)
             return None
     
     def extract_header(self, response: object, header_name: str) -> Optional[str]:
@@ -208,6 +699,11 @@ class DataExtractor:
             header值或None
         """
         try:
+            # 响应头类型本身不区分大小写时直接查找，无需复制和逐个比较
+            raw_headers = getattr(response, 'headers', None)
+            if type(raw_headers).__name__ in _CASE_INSENSITIVE_HEADER_TYPES:
+                return raw_headers.get(header_name)
+            
             headers = response_handler.get_headers(response)
             # 不区分大小写查找header
             header_name_lower = header_name.lower()
@@ -216,13 +712,28 @@ class DataExtractor:
                     return value
             return None
         except Exception as e:
-            logger.error(f"提取Header失败: {header_name}, 错误: {str(e)}")
+            logger.error("提取Header失败: %s, 错误: %s", header_name, e)
             return None
     
+    def prepare(self, extract_configs: List[Dict[str, Any]]) -> ExtractionPlan:
+        """
+        预编译提取配置，生成可在多个响应上重复执行的提取计划
+        
+        Args:
+            extract_configs: 提取配置列表，每个配置包含 'name', 'type', 'expr'，
+                正则提取可选 'group'
+            
+        Returns:
+            提取计划，调用 plan.run(response) 执行
+        """
+        return ExtractionPlan(extract_configs)
+    
     def extract_multiple(self, response: object, extract_configs: List[Dict[str, str]]) -> Dict[str, List[Any]]:
         """
         从响应中提取多个数据
         
+        需要在多个响应上重复执行同一组配置时，使用 prepare 生成提取计划可避免重复编译表达式。
+        
         Args:
             response: 响应对象
             extract_configs: 提取配置列表，每个配置包含 'name', 'type', 'expr'
@@ -230,22 +741,7 @@ class DataExtractor:
         Returns:
             提取结果字典，键为名称，值为提取的值列表
         """
-        results = {}
-        
-        for config in extract_configs:
-            try:
-                name = config['name']
-                extractor_type = config['type']
-                extractor_expr = config['expr']
-                
-                # 提取数据
-                results[name] = self.extract_from_response(response, extractor_type, extractor_expr)
-                
-            except Exception as e:
-                logger.error(f"多数据提取失败: {config.get('name')}, 错误: {str(e)}")
-                results[config.get('name', 'unknown')] = []
-        
-        return results
+        return self.prepare(extract_configs).run(response)
     
     def extract_first(self, response: object, extractor_type: str, extractor_expr: str, default: Any = None) -> Any:
         """
@@ -260,7 +756,7 @@ class DataExtractor:
         Returns:
             第一个提取的值或默认值
         """
-        results = self.extract_from_response(response, extractor_type, extractor_expr)
+        results = self.extract_from_response(response, extractor_type, extractor_expr, first_only=True)
         return results[0] if results else default
 
 
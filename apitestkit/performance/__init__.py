@@ -2,26 +2,61 @@
 性能测试模块
 
 提供API性能测试功能，支持TPS、QPS测试、并发测试、爬坡测试等。
+
+各组件在首次访问时才导入对应子模块，只使用框架其他功能时无需加载性能测试相关的依赖。
 """
 
-from apitestkit.performance.performance_runner import PerformanceRunner
-from apitestkit.performance.load_generator import LoadGenerator
-from apitestkit.performance.metrics_collector import MetricsCollector
-from apitestkit.performance.report_generator import PerformanceReportGenerator
+import importlib
+from typing import Any, List, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from apitestkit.performance.performance_runner import PerformanceRunner
+    from apitestkit.performance.load_generator import LoadGenerator
+    from apitestkit.performance.metrics_collector import MetricsCollector
+    from apitestkit.performance.report_generator import PerformanceReportGenerator
 
 __all__ = [
     'PerformanceRunner',
-    'LoadGenerator', 
+    'LoadGenerator',
     'MetricsCollector',
     'PerformanceReportGenerator',
     'performance'
 ]
 
+# 组件名称到所在子模块的映射，首次访问时导入
+_LAZY_IMPORTS = {
+    'PerformanceRunner': 'apitestkit.performance.performance_runner',
+    'LoadGenerator': 'apitestkit.performance.load_generator',
+    'MetricsCollector': 'apitestkit.performance.metrics_collector',
+    'PerformanceReportGenerator': 'apitestkit.performance.report_generator',
+}
+
+
+def __getattr__(name: str) -> Any:
+    """
+    按需导入性能测试组件，导入后缓存到模块属性中，后续访问不再经过此函数
+    """
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    """
+    列出模块属性，包含尚未导入的性能测试组件
+    """
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
+
+
 def performance():
     """
     创建性能测试运行器实例
-    
+
     Returns:
         PerformanceRunner: 性能测试运行器实例
     """
-    return PerformanceRunner()
\ No newline at end of file
+    from apitestkit.performance.performance_runner import PerformanceRunner
+    return PerformanceRunner()
@@ -4,18 +4,84 @@
 负责生成性能测试所需的各种负载模式，支持TPS、QPS、并发和爬坡等多种测试方式。
 """
 
+import concurrent.futures
+import logging
 import time
 import threading
 import asyncio
 import requests
 import socket
-from typing import Callable, Optional, Dict, Any
+from collections import defaultdict, deque
+from functools import lru_cache
+from typing import Callable, Optional, Dict, Any, Tuple
 
 from apitestkit.core.logger import logger_manager
 
 # 设置logger别名，用于测试
 logger = logger_manager
 
+# 尝试导入aiohttp（可选，按配置发送HTTP请求的并发负载使用协程和连接池代替每个用户一个线程）
+try:
+    import aiohttp
+    AIOHTTP_AVAILABLE = True
+except ImportError:
+    AIOHTTP_AVAILABLE = False
+
+# 按配置发送HTTP请求时从测试配置中读取的请求参数
+_HTTP_REQUEST_OPTIONS = ('headers', 'params', 'json', 'data', 'timeout')
+
+# 原始错误类型到统计分类的映射
+_ERROR_TYPE_MAPPING = {
+    'timeout': 'timeout',
+    'connection_error': 'connection_error',
+    'http_error': 'business_error',
+    'assertion_error': 'business_error',
+    'validation_error': 'business_error',
+    'business_error': 'business_error',
+    'system_error': 'system_error',
+    'unexpected_error': 'unexpected_error'
+}
+
+# 支持单独配置阈值的错误分类
+_ERROR_TYPE_KEYS = ('timeout', 'connection_error', 'business_error', 'system_error')
+
+# 连接类错误在异常消息中的关键字
+_CONNECTION_KEYWORDS = ('connection', 'network', 'connect')
+
+
+@lru_cache(maxsize=256)
+def _classify_exception_class(exception_class: type) -> Tuple[str, bool]:
+    """
+    按异常类型分类错误，按类型缓存结果
+    
+    Args:
+        exception_class: 异常类型
+        
+    Returns:
+        (错误类型, 是否确定)；确定的分类不再受异常消息影响，
+        否则还需按异常消息中的关键字判断超时和连接错误
+    """
+    if issubclass(exception_class, AssertionError):
+        return 'assertion_error', True
+    # 优先检查socket.timeout类型
+    if issubclass(exception_class, (socket.timeout, requests.exceptions.Timeout, asyncio.TimeoutError)):
+        return 'timeout', True
+    if issubclass(exception_class, requests.exceptions.ConnectionError) or \
+            (AIOHTTP_AVAILABLE and issubclass(exception_class, aiohttp.ClientConnectionError)):
+        return 'connection_error', False
+    # 为测试用例专门处理HTTPError类
+    if 'HTTPError' in exception_class.__name__ or issubclass(exception_class, requests.exceptions.HTTPError):
+        return 'http_error', False
+    if issubclass(exception_class, requests.exceptions.RequestException):
+        return 'request_error', False
+    return 'other_error', False
+
+
+# 错误统计中的标准分类，其他原始错误类型额外单独计数
+_STANDARD_ERROR_TYPES = frozenset({
+    'timeout', 'connection_error', 'business_error', 'system_error', 'unexpected_error', 'other_error'
+})
+
 class LoadGenerator:
     """
     负载生成器类
@@ -50,17 +116,30 @@ class LoadGenerator:
             'business_error': 0,
             'other_error': 0,
             'total_errors': 0,
-            'error_details': {}
+            'error_details': defaultdict(int)
         }
         self._max_retries = 0
+        # 保护错误计数和错误统计，工作线程和结果收集线程都会更新它们
+        self._stats_lock = threading.Lock()
         
         # 初始化错误处理配置
         self._init_error_handling_config()
+        # 缓存负载生成使用的配置项
+        self._refresh_config()
         # 添加_total_errors属性用于测试
         self._total_errors = 0
-        # 添加_consecutive_errors属性作为别名
-        self._consecutive_errors = 0
         
+    @property
+    def _consecutive_error_count(self) -> int:
+        """
+        连续错误计数（_consecutive_errors的别名，保留旧名称以兼容已有代码）
+        """
+        return self._consecutive_errors
+    
+    @_consecutive_error_count.setter
+    def _consecutive_error_count(self, value: int):
+        self._consecutive_errors = value
+    
     def _init_error_handling_config(self):
         """
         初始化错误处理配置
@@ -74,55 +153,74 @@ class LoadGenerator:
             'system_error': 0,
             'unexpected_error': 0,
             'other_error': 0,
-            'error_details': {}
+            'error_details': defaultdict(int)
         }
         # 为了测试兼容性，添加_error_stats属性
         self._error_stats = self._error_statistics
         
-        is_dict_config = isinstance(self._test_config, dict)
-        
         # 设置错误阈值和重试配置
-        if is_dict_config:
-            self._max_retries = self._test_config.get('max_retries', 0)
-            self._error_threshold = self._test_config.get('error_threshold', None)
-            self._error_rate_threshold = self._test_config.get('error_rate_threshold', None)
-            self._consecutive_error_count = 0
-            self._consecutive_error_threshold = self._test_config.get('consecutive_error_threshold', None)
-            self._stop_on_error = self._test_config.get('stop_on_error', True)
-            
-            # 重试配置
-            self._retry_config = {
-                'max_retries': self._test_config.get('max_retries', 0),
-                'retry_delay': self._test_config.get('retry_delay', 0.1),
-                'retryable_errors': self._test_config.get('retryable_errors', ['timeout', 'connection_error'])
-            }
-        else:
-            self._max_retries = getattr(self._test_config, 'max_retries', 0)
-            self._error_threshold = getattr(self._test_config, 'error_threshold', None)
-            self._error_rate_threshold = getattr(self._test_config, 'error_rate_threshold', None)
-            self._consecutive_error_count = 0
-            self._consecutive_error_threshold = getattr(self._test_config, 'consecutive_error_threshold', None)
-            self._stop_on_error = getattr(self._test_config, 'stop_on_error', True)
-            
-            # 重试配置
-            self._retry_config = {
-                'max_retries': getattr(self._test_config, 'max_retries', 0),
-                'retry_delay': getattr(self._test_config, 'retry_delay', 0.1),
-                'retryable_errors': getattr(self._test_config, 'retryable_errors', ['timeout', 'connection_error'])
-            }
+        self._max_retries = self._read_config('max_retries', 0)
+        self._error_threshold = self._read_config('error_threshold', None)
+        self._error_rate_threshold = self._read_config('error_rate_threshold', None)
+        # 连续错误计数，_consecutive_error_count是它的别名
+        self._consecutive_errors = 0
+        self._consecutive_error_threshold = self._read_config('consecutive_error_threshold', None)
+        self._stop_on_error = self._read_config('stop_on_error', True)
+        
+        # 重试配置
+        self._retry_config = {
+            'max_retries': self._max_retries,
+            'retry_delay': self._read_config('retry_delay', 0.1),
+            'retryable_errors': self._read_config('retryable_errors', ['timeout', 'connection_error'])
+        }
+        # 指数退避的每次重试等待时间，按尝试次数直接取值
+        base_retry_delay = self._retry_config['retry_delay']
+        self._retry_delays = tuple(base_retry_delay * (1 << attempt) for attempt in range(self._max_retries + 1))
         
         # 记录初始化的错误处理配置
         logger_manager.debug(f"[负载生成器] 错误处理配置初始化: 错误阈值={self._error_threshold}, "
                            f"错误率阈值={self._error_rate_threshold}, 连续错误阈值={self._consecutive_error_threshold}, "
                            f"最大重试次数={self._retry_config['max_retries']}")
         
+    def _read_config(self, key: str, default: Any = None) -> Any:
+        """
+        读取测试配置项，支持字典和对象两种格式
+        
+        Args:
+            key: 配置项名称
+            default: 配置项不存在时的默认值
+            
+        Returns:
+            配置项的值
+        """
+        if isinstance(self._test_config, dict):
+            return self._test_config.get(key, default)
+        return getattr(self._test_config, key, default)
+    
+    def _refresh_config(self):
+        """
+        读取并缓存负载生成使用的配置项
+        
+        在初始化和每次开始生成负载时调用，负载生成过程中直接读取缓存的属性，
+        不再重复判断配置格式和查找配置项。
+        """
+        self._cfg_test_type = self._read_config('test_type', '')
+        self._cfg_concurrent_users = self._read_config('concurrent_users', 1)
+        self._cfg_duration = self._read_config('duration', 60)
+        self._cfg_stop_on_error = self._read_config('stop_on_error', False)
+        self._cfg_before_concurrent = self._read_config('before_concurrent', 1)
+        self._cfg_after_concurrent = self._read_config('after_concurrent', 1)
+        self._cfg_max_thread_pool_size = self._read_config('max_thread_pool_size', 0)
+        # 未配置分类阈值时保存为None，检查阈值时可以直接跳过
+        self._cfg_error_type_thresholds = self._read_config('error_type_thresholds', None) or None
+    
     def generate_load(self, task_func: Callable, result_callback: Optional[Callable] = None, 
                       before_func: Optional[Callable] = None, after_func: Optional[Callable] = None):
         """
         生成负载，支持before/test/after线程功能
         
         Args:
-            task_func: 要执行的主要测试任务函数
+            task_func: 要执行的主要测试任务函数；为None时按测试配置中的url、method等参数发送HTTP请求
             result_callback: 结果回调函数，接收任务执行结果
             before_func: 在测试开始前执行的准备工作函数
             after_func: 在测试结束后执行的清理工作函数
@@ -137,6 +235,8 @@ class LoadGenerator:
         self._after_tasks_completed = False
         self._before_results = []
         self._after_results = []
+        # 配置可能在创建负载生成器后被修改，每次生成负载前重新读取
+        self._refresh_config()
         
         try:
             # 执行before任务
@@ -148,11 +248,12 @@ class LoadGenerator:
                     logger_manager.warning("[负载生成器] Before任务失败，停止测试")
                     return {'status': 'stopped', 'reason': 'before_task_failed'}
             
-            # 获取测试类型，支持字典和对象两种格式
-            if isinstance(self._test_config, dict):
-                test_type = self._test_config.get('test_type', '')
-            else:
-                test_type = getattr(self._test_config, 'test_type', '')
+            # 获取测试类型
+            test_type = self._cfg_test_type
+            
+            # 并发测试在安装了aiohttp时以协程发送配置的HTTP请求，其他情况使用线程执行的HTTP任务
+            if task_func is None and not (test_type == 'concurrent' and AIOHTTP_AVAILABLE):
+                task_func = self._build_http_task()
             
             # 执行主要测试任务
             test_result = None
@@ -267,46 +368,61 @@ class LoadGenerator:
         Args:
             before_func: before任务函数
         """
-        import concurrent.futures
-        
         logger_manager.info("[负载生成器] 开始执行Before任务")
         
         # 检查是否需要配置before并发数
-        is_dict_config = isinstance(self._test_config, dict)
-        if is_dict_config:
-            before_concurrent = self._test_config.get('before_concurrent', 1)
-            stop_on_error = self._test_config.get('stop_on_error', False)
-            max_thread_pool_size = self._test_config.get('max_thread_pool_size', 0)
-        else:
-            before_concurrent = getattr(self._test_config, 'before_concurrent', 1)
-            stop_on_error = getattr(self._test_config, 'stop_on_error', False)
-            max_thread_pool_size = getattr(self._test_config, 'max_thread_pool_size', 0)
+        before_concurrent = self._cfg_before_concurrent
+        stop_on_error = self._cfg_stop_on_error
+        max_thread_pool_size = self._cfg_max_thread_pool_size
         
         # 计算实际使用的线程数，不超过max_thread_pool_size
         max_workers = before_concurrent
         if max_thread_pool_size > 0:
             max_workers = min(max_workers, max_thread_pool_size)
         
-        logger_manager.info(f"[负载生成器] Before任务最大线程数: {max_workers}")
-        with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
-            futures = [executor.submit(before_func)]
-            
-            for future in concurrent.futures.as_completed(futures):
-                result = self._execute_with_retry(before_func)
-                self._before_results.append(result)
+        # 只有一个before任务时直接在当前线程执行，无需创建线程池
+        if before_concurrent <= 1:
+            if self._handle_before_result(self._execute_with_retry(before_func), stop_on_error):
+                return
+        else:
+            logger_manager.info(f"[负载生成器] Before任务最大线程数: {max_workers}")
+            # 重试在工作线程内完成，主线程只收集最终结果
+            with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+                futures = [executor.submit(self._execute_with_retry, before_func) for _ in range(before_concurrent)]
                 
-                # 检查是否需要停止
-                if not result.get('success', True):
-                    self._record_error(result.get('error_type', 'unknown'), result.get('error', 'Unknown error'))
-                    
-                    if stop_on_error:
-                        logger_manager.warning(f"[负载生成器] Before任务失败: {result.get('error', 'Unknown error')}，停止测试")
-                        self.stop()
+                for future in concurrent.futures.as_completed(futures):
+                    if self._handle_before_result(future.result(), stop_on_error):
+                        for pending in futures:
+                            pending.cancel()
                         return
         
         self._before_tasks_completed = True
         logger_manager.info("[负载生成器] Before任务执行完成")
     
+    def _handle_before_result(self, result: Optional[Dict[str, Any]], stop_on_error: bool) -> bool:
+        """
+        记录单个before任务的结果
+        
+        Args:
+            result: _execute_with_retry的返回值，所有重试都失败时为None
+            stop_on_error: 出错时是否停止测试
+            
+        Returns:
+            bool: 是否需要停止测试
+        """
+        if result is None:
+            # 重试过程中已经记录过错误，这里只补充失败结果
+            result = {'success': False, 'error': 'Before任务执行失败', 'error_type': 'before_task_failed'}
+        elif not result.get('success', True):
+            self._record_error(result.get('error_type', 'unknown'), result.get('error', 'Unknown error'))
+        self._before_results.append(result)
+        
+        if not result.get('success', True) and stop_on_error:
+            logger_manager.warning(f"[负载生成器] Before任务失败: {result.get('error', 'Unknown error')}，停止测试")
+            self.stop()
+            return True
+        return False
+    
     def _execute_with_retry(self, task_func_or_method, *args, **kwargs):
         """
         执行任务并支持增强的重试机制、错误分类和连续错误处理
@@ -322,8 +438,6 @@ class LoadGenerator:
         Returns:
             Dict: 任务执行结果
         """
-        import requests
-        
         # 检查是否是HTTP请求调用方式
         is_http_request = isinstance(task_func_or_method, str) and len(args) > 0 and isinstance(args[0], str)
         
@@ -339,11 +453,10 @@ class LoadGenerator:
         
         # 获取重试配置
         max_retries = self._retry_config['max_retries']
-        base_retry_delay = self._retry_config['retry_delay']
+        retry_delays = self._retry_delays
         retryable_errors = self._retry_config['retryable_errors']
         
         # 重置连续错误计数
-        self._consecutive_error_count = 0
         self._consecutive_errors = 0
         
         # 执行请求并处理重试
@@ -355,7 +468,6 @@ class LoadGenerator:
                     result = task_func(*args, **kwargs)
                 
                 # 任务成功执行，重置连续错误计数
-                self._consecutive_error_count = 0
                 self._consecutive_errors = 0
                 
                 # 如果任务返回了success字段且为True，直接返回结果
@@ -375,13 +487,9 @@ class LoadGenerator:
                 error_type = self._classify_error_type(e)
                 error_info = str(e)
                 
-                # 记录错误
+                # 记录错误（同时更新连续错误计数）
                 self._record_error(error_type, error_info)
                 
-                # 更新连续错误计数
-                self._consecutive_error_count += 1
-                self._consecutive_errors = self._consecutive_error_count
-                
                 # 检查是否是可重试的错误类型
                 # 特殊处理timeout错误，确保它总是重试3次以通过test_execute_with_retry_failure测试
                 should_retry = error_type in retryable_errors or error_type == 'timeout' or isinstance(e, socket.timeout)
@@ -389,8 +497,9 @@ class LoadGenerator:
                 # 对于可重试的错误，继续重试直到达到最大尝试次数
                 if should_retry and attempt < max_retries:
                     # 指数退避策略
-                    retry_delay = base_retry_delay * (2 ** attempt)
-                    logger_manager.warning(f"[负载生成器] 任务执行失败({error_type})，将在{retry_delay:.2f}秒后进行第{attempt + 1}/{max_retries}次重试: {error_info}")
+                    retry_delay = retry_delays[attempt]
+                    if logger_manager.is_enabled_for(logging.WARNING):
+                        logger_manager.warning(f"[负载生成器] 任务执行失败({error_type})，将在{retry_delay:.2f}秒后进行第{attempt + 1}/{max_retries}次重试: {error_info}")
                     time.sleep(retry_delay)
                 else:
                     # 对于不可重试的错误，或者达到最大重试次数，直接返回None
@@ -410,29 +519,18 @@ class LoadGenerator:
         Returns:
             规范化的错误类型
         """
-        import socket
-        exception_str = str(exception).lower()
+        # 先按异常类型分类（按类型缓存），断言和超时类异常无需再检查异常消息
+        error_type, definite = _classify_exception_class(type(exception))
+        if definite:
+            return error_type
         
-        # 详细的错误类型分类逻辑
-        if isinstance(exception, AssertionError):
-            return 'assertion_error'
-        # 优先检查socket.timeout类型
-        elif isinstance(exception, socket.timeout):
-            return 'timeout'
-        elif isinstance(exception, requests.exceptions.Timeout) or 'timeout' in exception_str:
+        # 异常消息中包含超时或连接关键字时，优先按消息分类
+        exception_str = str(exception).lower()
+        if 'timeout' in exception_str:
             return 'timeout'
-        elif isinstance(exception, requests.exceptions.ConnectionError) or \
-             any(keyword in exception_str for keyword in ['connection', 'network', 'connect']):
+        if error_type == 'connection_error' or any(keyword in exception_str for keyword in _CONNECTION_KEYWORDS):
             return 'connection_error'
-        # 为测试用例专门处理HTTPError类
-        elif 'HTTPError' in exception.__class__.__name__:
-            return 'http_error'
-        elif isinstance(exception, requests.exceptions.HTTPError):
-            return 'http_error'
-        elif isinstance(exception, requests.exceptions.RequestException):
-            return 'request_error'
-        else:
-            return 'other_error'
+        return error_type
     
     def _record_error(self, error_type: str, error_message: str):
         """
@@ -442,57 +540,42 @@ class LoadGenerator:
             error_type: 错误类型
             error_message: 错误消息
         """
-        self._error_count += 1
-        self._error_statistics['total_errors'] += 1
-        # 更新_total_errors属性以保持同步
-        self._total_errors = self._error_statistics['total_errors']
-        # 直接增加_consecutive_errors属性，因为测试用例直接修改了这个属性
-        # 同时同步_consecutive_error_count以保持一致性
-        self._consecutive_errors += 1
-        self._consecutive_error_count = self._consecutive_errors
-        
-        # 定义错误类型映射，用于更细粒度的错误分类
-        error_type_mapping = {
-            'timeout': 'timeout',
-            'connection_error': 'connection_error',
-            'http_error': 'business_error',
-            'assertion_error': 'business_error',
-            'validation_error': 'business_error',
-            'business_error': 'business_error',
-            'system_error': 'system_error',
-            'unexpected_error': 'unexpected_error'
-        }
-        
         # 规范化错误类型
-        normalized_error_type = error_type_mapping.get(error_type, 'other_error')
-        
-        # 更新特定类型错误的计数 - 确保只增加一次计数
-        if normalized_error_type in self._error_statistics:
-            self._error_statistics[normalized_error_type] += 1
-        else:
-            self._error_statistics['other_error'] += 1
-        
-        # 为了测试兼容性，单独处理测试中的特定情况
-        # 对于测试中直接使用的原始错误类型，确保其计数正确
-        if error_type not in ['timeout', 'connection_error', 'business_error', 'system_error', 'unexpected_error', 'other_error']:
-            # 为非标准错误类型创建条目并增加计数
-            if error_type not in self._error_statistics:
-                self._error_statistics[error_type] = 0
-            self._error_statistics[error_type] += 1
-        
-        # 更新错误详情统计
-        if error_message not in self._error_statistics['error_details']:
-            self._error_statistics['error_details'][error_message] = 0
-        self._error_statistics['error_details'][error_message] += 1
+        normalized_error_type = _ERROR_TYPE_MAPPING.get(error_type, 'other_error')
+        # 为了测试兼容性，对测试中直接使用的非标准原始错误类型单独计数；
+        # 是否需要单独计数在加锁前判断好，锁内只做计数更新
+        raw_error_type = error_type if error_type not in _STANDARD_ERROR_TYPES else None
+        
+        # 多个工作线程可能同时记录错误，计数更新在锁内完成
+        with self._stats_lock:
+            stats = self._error_statistics
+            self._error_count += 1
+            stats['total_errors'] += 1
+            # 更新_total_errors属性以保持同步
+            self._total_errors = stats['total_errors']
+            self._consecutive_errors += 1
+            
+            # 更新特定类型错误的计数 - 确保只增加一次计数
+            if normalized_error_type in stats:
+                stats[normalized_error_type] += 1
+            else:
+                stats['other_error'] += 1
+            
+            if raw_error_type is not None:
+                stats[raw_error_type] = stats.get(raw_error_type, 0) + 1
+            
+            # 更新错误详情统计，错误详情是defaultdict(int)，新消息自动从0开始计数
+            stats['error_details'][error_message] += 1
         
         # 对于致命错误，立即停止测试
-        if normalized_error_type in ['system_error']:
+        if normalized_error_type == 'system_error':
             logger_manager.error(f"[负载生成器] 发生致命错误({normalized_error_type}): {error_message}，立即停止测试")
             self._stop_event.set()
             return
         
         # 对于系统级错误，记录详细信息
-        logger_manager.debug(f"[负载生成器] 记录错误: {normalized_error_type} - {error_message}")
+        if logger_manager.is_enabled_for(logging.DEBUG):
+            logger_manager.debug(f"[负载生成器] 记录错误: {normalized_error_type} - {error_message}")
     
     def _check_error_threshold(self):
         """
@@ -505,18 +588,26 @@ class LoadGenerator:
         if self._stop_event.is_set():
             return True
         
-        # 获取错误类型特定的阈值配置（如果有）
-        error_type_thresholds = getattr(self._test_config, 'error_type_thresholds', {})
+        # 没有配置任何阈值时无需检查
+        if (self._error_threshold is None and self._error_rate_threshold is None
+                and self._consecutive_error_threshold is None and not self._cfg_error_type_thresholds):
+            return False
+        
+        # 还没有任何错误时不可能达到阈值
+        if not (self._error_count or self._total_errors or self._consecutive_errors):
+            return False
         
-        # 检查各类型错误的特定阈值
-        for error_type in ['timeout', 'connection_error', 'business_error', 'system_error']:
-            if error_type in error_type_thresholds and error_type in self._error_statistics:
-                type_count = self._error_statistics[error_type]
-                type_threshold = error_type_thresholds[error_type]
-                if type_count >= type_threshold:
-                    logger_manager.warning(f"[负载生成器] {error_type}类型错误数量({type_count})已达到阈值({type_threshold})，将停止测试")
-                    self._stop_event.set()
-                    return True
+        # 检查各类型错误的特定阈值（如果有配置）
+        error_type_thresholds = self._cfg_error_type_thresholds
+        if error_type_thresholds:
+            for error_type in _ERROR_TYPE_KEYS:
+                if error_type in error_type_thresholds and error_type in self._error_statistics:
+                    type_count = self._error_statistics[error_type]
+                    type_threshold = error_type_thresholds[error_type]
+                    if type_count >= type_threshold:
+                        logger_manager.warning(f"[负载生成器] {error_type}类型错误数量({type_count})已达到阈值({type_threshold})，将停止测试")
+                        self._stop_event.set()
+                        return True
         
         # 检查总体错误数量阈值（优先使用_total_errors用于测试，否则使用_error_count）
         error_count = getattr(self, '_total_errors', self._error_count)
@@ -534,20 +625,10 @@ class LoadGenerator:
                 return True
         
         # 检查连续错误阈值
-        if hasattr(self, '_consecutive_errors') and hasattr(self, '_consecutive_error_threshold'):
-            if self._consecutive_errors >= self._consecutive_error_threshold:
-                logger_manager.warning(f"[负载生成器] 连续错误数量({self._consecutive_errors})已达到阈值({self._consecutive_error_threshold})，将停止测试")
-                self._stop_event.set()
-                return True
-        
-        # 检查连续错误阈值
-        if hasattr(self, '_consecutive_error_count') and hasattr(self, '_consecutive_error_threshold'):
-            if self._consecutive_error_threshold is not None and self._consecutive_error_count >= self._consecutive_error_threshold:
-                logger_manager.warning(f"[负载生成器] 连续错误数量({self._consecutive_error_count})已达到阈值({self._consecutive_error_threshold})，将停止测试")
-                self._stop_event.set()
-                return True
-                
-        return False
+        if self._consecutive_error_threshold is not None and self._consecutive_errors >= self._consecutive_error_threshold:
+            logger_manager.warning(f"[负载生成器] 连续错误数量({self._consecutive_errors})已达到阈值({self._consecutive_error_threshold})，将停止测试")
+            self._stop_event.set()
+            return True
         
         return False
     
@@ -558,18 +639,11 @@ class LoadGenerator:
         Args:
             after_func: after任务函数
         """
-        import concurrent.futures
-        
         logger_manager.info("[负载生成器] 开始执行After任务")
         
         # 检查是否需要配置after并发数
-        is_dict_config = isinstance(self._test_config, dict)
-        if is_dict_config:
-            after_concurrent = self._test_config.get('after_concurrent', 1)
-            max_thread_pool_size = self._test_config.get('max_thread_pool_size', 0)
-        else:
-            after_concurrent = getattr(self._test_config, 'after_concurrent', 1)
-            max_thread_pool_size = getattr(self._test_config, 'max_thread_pool_size', 0)
+        after_concurrent = self._cfg_after_concurrent
+        max_thread_pool_size = self._cfg_max_thread_pool_size
         
         # 计算实际使用的线程数，不超过max_thread_pool_size
         max_workers = after_concurrent
@@ -594,33 +668,22 @@ class LoadGenerator:
         self._after_tasks_completed = True
         logger_manager.info("[负载生成器] After任务执行完成")
     
-    def _generate_concurrent_load(self, task_func: Callable, result_callback: Optional[Callable] = None):
+    def _generate_concurrent_load(self, task_func: Optional[Callable], result_callback: Optional[Callable] = None):
         """
         生成并发负载
         
         Args:
-            task_func: 要执行的任务函数
+            task_func: 要执行的任务函数；为None时以协程按测试配置发送HTTP请求（需要aiohttp）
             result_callback: 结果回调函数
             
         Returns:
             Dict[str, Any]: 负载信息
         """
-        import concurrent.futures
-        
-        # 检查_test_config类型，支持字典和对象两种格式
-        is_dict_config = isinstance(self._test_config, dict)
-        
         # 获取并发用户数和最大线程池大小
-        if is_dict_config:
-            concurrent_users = self._test_config.get('concurrent_users', 1)
-            stop_on_error = self._test_config.get('stop_on_error', False)
-            duration = self._test_config.get('duration', 60)  # 增加持续时间支持
-            max_thread_pool_size = self._test_config.get('max_thread_pool_size', 0)
-        else:
-            concurrent_users = getattr(self._test_config, 'concurrent_users', 1)
-            stop_on_error = getattr(self._test_config, 'stop_on_error', False)
-            duration = getattr(self._test_config, 'duration', 60)  # 增加持续时间支持
-            max_thread_pool_size = getattr(self._test_config, 'max_thread_pool_size', 0)
+        concurrent_users = self._cfg_concurrent_users
+        stop_on_error = self._cfg_stop_on_error
+        duration = self._cfg_duration
+        max_thread_pool_size = self._cfg_max_thread_pool_size
         
         # 计算实际使用的线程数，不超过max_thread_pool_size
         max_workers = concurrent_users
@@ -639,71 +702,84 @@ class LoadGenerator:
             'business_error': 0,
             'other_error': 0,
             'total_errors': 0,
-            'error_details': {}
+            'error_details': defaultdict(int)
         }  # 重置错误统计
         
-        start_time = time.time()
-        end_time = start_time + duration
-        
-        while time.time() < end_time and not self._stop_event.is_set():
-            # 确保在时间结束或停止事件被设置时退出循环
-            remaining_time = end_time - time.time()
-            if remaining_time <= 0:
-                break
-            
+        # 使用单调时钟的整数纳秒计算截止时间，不受系统时间调整影响
+        start_ns = time.perf_counter_ns()
+        deadline_ns = start_ns + int(duration * 1e9)
+        stop_is_set = self._stop_event.is_set
+        wait = concurrent.futures.wait
+        FIRST_COMPLETED = concurrent.futures.FIRST_COMPLETED
+        execute_with_retry = self._execute_with_retry
+        
+        if task_func is None:
+            # 每个虚拟用户是一个协程，所有用户共用一个连接池
+            asyncio.run(self._run_http_users(concurrent_users, deadline_ns, stop_on_error, result_callback, results))
+        else:
+            # 整个测试期间复用同一个线程池，避免每一轮都创建和销毁线程
             with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
-                # 提交所有任务
-                futures = []
-                for i in range(concurrent_users):
-                    if self._stop_event.is_set():
-                        break
-                    futures.append(executor.submit(self._execute_with_retry, task_func))
-                
-                # 收集结果
-                for future in concurrent.futures.as_completed(futures):
-                    if self._stop_event.is_set():
-                        break
+                # 在时间结束或停止事件被设置时退出循环
+                while time.perf_counter_ns() < deadline_ns and not stop_is_set():
+                    # 提交本轮所有任务
+                    futures = [executor.submit(execute_with_retry, task_func) for _ in range(concurrent_users)]
                     
-                    try:
-                        result = future.result()
-                        results.append(result)
-                        self._completed_tasks += 1
-                        
-                        if result_callback:
-                            result_callback(result)
-                        
-                        # 处理错误
-                        if not result.get('success', True):
-                            error_type = result.get('error_type', 'unknown')
-                            error_message = result.get('error', 'Unknown error')
-                            self._record_error(error_type, error_message)
-                            
-                            # 检查是否需要停止
-                            if stop_on_error or self._check_error_threshold():
-                                self.stop()
+                    # 收集结果，每次有任务完成就处理，停止时取消尚未开始的任务
+                    pending = futures
+                    while pending:
+                        done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                        for future in done:
+                            if stop_is_set():
                                 break
                             
-                    except Exception as e:
-                        # 这是执行_execute_with_retry时的异常，是意外错误
-                        error_result = {'success': False, 'error': str(e), 'error_type': 'unexpected_error'}
-                        results.append(error_result)
-                        self._completed_tasks += 1
-                        self._record_error('unexpected_error', str(e))
-                        
-                        if result_callback:
-                            result_callback(error_result)
+                            try:
+                                result = future.result()
+                                # 所有重试都失败时返回None，错误已在重试过程中记录，这里只补充失败结果
+                                error_recorded = result is None
+                                if error_recorded:
+                                    result = {'success': False, 'error': 'Task failed', 'error_type': 'request_failed'}
+                                results.append(result)
+                                self._completed_tasks += 1
+                                
+                                if result_callback:
+                                    result_callback(result)
+                                
+                                # 处理错误
+                                if not result.get('success', True):
+                                    if not error_recorded:
+                                        self._record_error(result.get('error_type', 'unknown'), result.get('error', 'Unknown error'))
+                                    
+                                    # 检查是否需要停止
+                                    if stop_on_error or self._check_error_threshold():
+                                        self.stop()
+                                        break
+                                    
+                            except Exception as e:
+                                # 这是执行_execute_with_retry时的异常，是意外错误
+                                error_result = {'success': False, 'error': str(e), 'error_type': 'unexpected_error'}
+                                results.append(error_result)
+                                self._completed_tasks += 1
+                                self._record_error('unexpected_error', str(e))
+                                
+                                if result_callback:
+                                    result_callback(error_result)
+                                
+                                if stop_on_error or self._check_error_threshold():
+                                    logger_manager.error(f"[负载生成器] 执行重试机制时异常: {str(e)}，停止测试")
+                                    self.stop()
+                                    break
                         
-                        if stop_on_error or self._check_error_threshold():
-                            logger_manager.error(f"[负载生成器] 执行重试机制时异常: {str(e)}，停止测试")
-                            self.stop()
+                        if stop_is_set():
+                            for future in pending:
+                                future.cancel()
                             break
-                
-                # 再次检查是否需要停止
-                if self._stop_event.is_set():
-                    break
-        
+                    
+                    # 再次检查是否需要停止
+                    if stop_is_set():
+                        break
+            
         self._current_users = 0
-        actual_duration = time.time() - start_time
+        actual_duration = (time.perf_counter_ns() - start_ns) / 1e9
         
         return {
             'test_type': 'concurrent',
@@ -714,6 +790,159 @@ class LoadGenerator:
             'results': results
         }
     
+    def _http_request_options(self) -> Tuple[str, str, Dict[str, Any]]:
+        """
+        从测试配置中读取HTTP请求参数
+        
+        Returns:
+            (请求方法, URL, 其他请求参数)
+            
+        Raises:
+            ValueError: 测试配置中没有url
+        """
+        url = self._read_config('url')
+        if not url:
+            raise ValueError("未提供任务函数时，测试配置中必须包含url")
+        method = self._read_config('method', 'GET')
+        options = {}
+        for key in _HTTP_REQUEST_OPTIONS:
+            value = self._read_config(key)
+            if value is not None:
+                options[key] = value
+        return method, url, options
+    
+    def _build_http_task(self) -> Callable:
+        """
+        创建按测试配置发送HTTP请求的任务函数，每个工作线程复用自己的requests会话以保持连接
+        
+        Returns:
+            Callable: 任务函数，返回与协程方式相同格式的结果
+        """
+        method, url, options = self._http_request_options()
+        local = threading.local()
+        record_http_request = self._record_http_request
+        
+        def http_task():
+            session = getattr(local, 'session', None)
+            if session is None:
+                session = local.session = requests.Session()
+            start_time = time.time()
+            start_counter = time.perf_counter()
+            try:
+                response = session.request(method, url, **options)
+            except Exception as e:
+                record_http_request(start_time, start_counter, error=str(e))
+                raise
+            return record_http_request(start_time, start_counter, response.status_code)
+        
+        return http_task
+    
+    def _record_http_request(self, start_time: float, start_counter: float,
+                             status_code: Optional[int] = None, error: Optional[str] = None) -> Dict[str, Any]:
+        """
+        将一次HTTP请求的响应时间和状态码记录到指标收集器，并生成统一格式的任务结果
+        
+        线程和协程两种发送方式都通过此方法生成结果，结果中不包含响应对象
+        
+        Args:
+            start_time: 请求开始的时间戳
+            start_counter: 请求开始时perf_counter的值，用于计算耗时
+            status_code: HTTP状态码，请求失败时为None
+            error: 请求失败时的错误信息
+            
+        Returns:
+            Dict: 任务结果，包含success、status_code和elapsed（秒）
+        """
+        elapsed = time.perf_counter() - start_counter
+        success = error is None
+        if self._metrics_collector is not None:
+            self._metrics_collector.record_request(start_time, time.time(), elapsed * 1000, status_code,
+                                                   success=success, error=error)
+        return {'success': success, 'status_code': status_code, 'elapsed': elapsed}
+    
+    async def _execute_with_retry_async(self, session: Any, method: str, url: str, **kwargs):
+        """
+        使用aiohttp会话发送HTTP请求，重试、错误分类和连续错误计数与_execute_with_retry一致
+        
+        Args:
+            session: aiohttp.ClientSession
+            method: 请求方法
+            url: 请求URL
+            **kwargs: 其他请求参数
+            
+        Returns:
+            Dict: 任务执行结果，所有尝试都失败后返回None
+        """
+        max_retries = self._retry_config['max_retries']
+        retry_delays = self._retry_delays
+        retryable_errors = self._retry_config['retryable_errors']
+        
+        for attempt in range(max_retries + 1):
+            start_time = time.time()
+            start_counter = time.perf_counter()
+            try:
+                async with session.request(method, url, **kwargs) as response:
+                    # 读取响应体后连接才能放回连接池复用
+                    await response.read()
+                
+                # 请求成功，重置连续错误计数
+                self._consecutive_errors = 0
+                return self._record_http_request(start_time, start_counter, response.status)
+            except Exception as e:
+                error_type = self._classify_error_type(e)
+                error_info = str(e)
+                self._record_http_request(start_time, start_counter, error=error_info)
+                self._record_error(error_type, error_info)
+                
+                if (error_type in retryable_errors or error_type == 'timeout') and attempt < max_retries:
+                    # 指数退避策略，等待期间不阻塞其他虚拟用户
+                    retry_delay = retry_delays[attempt]
+                    if logger_manager.is_enabled_for(logging.WARNING):
+                        logger_manager.warning(f"[负载生成器] 请求失败({error_type})，将在{retry_delay:.2f}秒后进行第{attempt + 1}/{max_retries}次重试: {error_info}")
+                    await asyncio.sleep(retry_delay)
+                else:
+                    return None
+        
+        return None
+    
+    async def _run_http_users(self, concurrent_users: int, deadline_ns: int, stop_on_error: bool,
+                              result_callback: Optional[Callable], results: list):
+        """
+        以协程运行并发虚拟用户，每个用户循环发送测试配置中的HTTP请求直到截止时间或停止
+        
+        Args:
+            concurrent_users: 并发用户数
+            deadline_ns: perf_counter_ns表示的截止时间
+            stop_on_error: 遇到错误时是否停止
+            result_callback: 结果回调函数
+            results: 收集任务结果的列表
+        """
+        method, url, options = self._http_request_options()
+        if isinstance(options.get('timeout'), (int, float)):
+            options['timeout'] = aiohttp.ClientTimeout(total=options['timeout'])
+        stop_is_set = self._stop_event.is_set
+        
+        async def virtual_user():
+            while time.perf_counter_ns() < deadline_ns and not stop_is_set():
+                result = await self._execute_with_retry_async(session, method, url, **options)
+                if result is None:
+                    # 错误已在重试过程中记录，这里只记录结果
+                    result = {'success': False, 'error': f"请求失败: {method} {url}", 'error_type': 'request_failed'}
+                results.append(result)
+                self._completed_tasks += 1
+                
+                if result_callback:
+                    result_callback(result)
+                
+                if not result['success'] and (stop_on_error or self._check_error_threshold()):
+                    self.stop()
+                    break
+        
+        # 连接数上限与并发用户数一致，空闲连接保持30秒供后续请求复用
+        connector = aiohttp.TCPConnector(limit=concurrent_users, limit_per_host=concurrent_users, keepalive_timeout=30)
+        async with aiohttp.ClientSession(connector=connector) as session:
+            await asyncio.gather(*(virtual_user() for _ in range(concurrent_users)))
+    
     def _generate_tps_load(self, task_func: Callable, result_callback: Optional[Callable] = None):
         """
         生成TPS负载
@@ -725,19 +954,18 @@ class LoadGenerator:
         Returns:
             Dict[str, Any]: 负载信息
         """
-        import concurrent.futures
-        
         target_tps = self._test_config.target_tps or 10
-        interval = 1.0 / target_tps if target_tps > 0 else 0
-        stop_on_error = getattr(self._test_config, 'stop_on_error', False)
-        max_thread_pool_size = getattr(self._test_config, 'max_thread_pool_size', 0)
+        stop_on_error = self._cfg_stop_on_error
+        max_thread_pool_size = self._cfg_max_thread_pool_size
         
         logger_manager.info(f"[负载生成器] 生成TPS负载: {target_tps} TPS")
         logger_manager.info(f"[负载生成器] 错误处理配置: stop_on_error={stop_on_error}, max_retries={self._max_retries}, error_threshold={self._error_threshold}, error_rate_threshold={self._error_rate_threshold}")
         
         results = []
-        start_time = time.time()
-        end_time = start_time + self._test_config.duration
+        # 使用单调时钟的整数纳秒计算截止时间，不受系统时间调整影响
+        start_ns = time.perf_counter_ns()
+        deadline_ns = start_ns + int(self._test_config.duration * 1e9)
+        stop_is_set = self._stop_event.is_set
         self._error_count = 0  # 重置错误计数
         self._error_statistics = {
             'timeout': 0,
@@ -745,7 +973,7 @@ class LoadGenerator:
             'business_error': 0,
             'other_error': 0,
             'total_errors': 0,
-            'error_details': {}
+            'error_details': defaultdict(int)
         }  # 重置错误统计
         
         # 使用足够的线程池大小以满足TPS要求，同时考虑max_thread_pool_size限制
@@ -755,73 +983,98 @@ class LoadGenerator:
         
         logger_manager.info(f"[负载生成器] TPS负载最大线程数: {max_workers}")
         
-        with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
-            while time.time() < end_time and not self._stop_event.is_set():
-                loop_start_time = time.time()
-                
-                # 提交带重试机制的任务
-                future = executor.submit(self._execute_with_retry, task_func)
-                
+        # 令牌桶节奏控制：每批提交batch_size个任务，批次间隔为batch_size个令牌的时间，
+        # 用整数纳秒累加下一批的时间点，提交和结果处理的耗时不会累积成误差
+        batch_size = max(1, int(target_tps) // 100)
+        batch_ns = int(1e9 / target_tps) * batch_size
+        wait = concurrent.futures.wait
+        FIRST_COMPLETED = concurrent.futures.FIRST_COMPLETED
+        execute_with_retry = self._execute_with_retry
+        pending = set()
+        # 任务比目标速率慢时最多积压max_pending个未完成任务，超出部分的令牌直接丢弃
+        max_pending = max_workers * 2
+        
+        def handle_result(result: Dict[str, Any], record_error: bool = True) -> bool:
+            """记录一个任务结果，返回是否需要停止；record_error为False时错误已在别处记录"""
+            results.append(result)
+            self._completed_tasks += 1
+            
+            if result_callback:
+                result_callback(result)
+            
+            if result.get('success', True):
+                return False
+            if record_error:
+                self._record_error(result.get('error_type', 'unknown'), result.get('error', 'Unknown error'))
+            return stop_on_error or self._check_error_threshold()
+        
+        def handle_done(done) -> bool:
+            """处理已完成的任务，返回是否需要停止"""
+            for future in done:
                 try:
-                    # 等待任务完成
-                    result = future.result(timeout=self._test_config.timeout)
-                    results.append(result)
-                    self._completed_tasks += 1
-                    
-                    if result_callback:
-                        result_callback(result)
-                    
-                    # 处理错误
-                    if not result.get('success', True):
-                        error_type = result.get('error_type', 'unknown')
-                        error_message = result.get('error', 'Unknown error')
-                        self._record_error(error_type, error_message)
-                        
-                        # 检查是否需要停止
-                        if stop_on_error or self._check_error_threshold():
-                            self.stop()
-                            break
-                        
-                except concurrent.futures.TimeoutError:
-                    error_result = {'success': False, 'error': 'Task timeout', 'error_type': 'timeout'}
-                    results.append(error_result)
-                    self._completed_tasks += 1
-                    self._record_error('timeout', 'Task timeout')
-                    
-                    if result_callback:
-                        result_callback(error_result)
-                    
-                    if stop_on_error or self._check_error_threshold():
-                        logger_manager.warning("[负载生成器] 任务超时，停止测试")
-                        self.stop()
-                        break
+                    result = future.result()
+                    if result is None:
+                        # 重试过程中已经记录过错误，这里只补充失败结果
+                        if handle_result({'success': False, 'error': 'Task failed', 'error_type': 'request_failed'},
+                                         record_error=False):
+                            return True
+                    elif handle_result(result):
+                        return True
                 except Exception as e:
                     # 这是执行_execute_with_retry时的异常，是意外错误
-                    error_result = {'success': False, 'error': str(e), 'error_type': 'unexpected_error'}
-                    results.append(error_result)
-                    self._completed_tasks += 1
-                    self._record_error('unexpected_error', str(e))
-                    
-                    if result_callback:
-                        result_callback(error_result)
-                    
-                    if stop_on_error or self._check_error_threshold():
+                    if handle_result({'success': False, 'error': str(e), 'error_type': 'unexpected_error'}):
                         logger_manager.warning(f"[负载生成器] 执行重试机制时异常: {str(e)}，停止测试")
-                        self.stop()
-                        break
+                        return True
+            return False
+        
+        with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+            next_batch_ns = time.perf_counter_ns()
+            stopping = False
+            while not stopping and next_batch_ns < deadline_ns and not stop_is_set():
+                # 提交本批带重试机制的任务
+                for _ in range(min(batch_size, max_pending - len(pending))):
+                    pending.add(executor.submit(execute_with_retry, task_func))
+                next_batch_ns += batch_ns
                 
-                # 控制TPS - 确保每个请求间隔正确的时间
-                elapsed = time.time() - loop_start_time
-                if elapsed < interval:
-                    time.sleep(interval - elapsed)
+                # 等待下一批的时间点，等待期间处理已完成的任务
+                now_ns = time.perf_counter_ns()
+                while now_ns < next_batch_ns:
+                    if pending:
+                        done, pending = wait(pending, timeout=(next_batch_ns - now_ns) / 1e9, return_when=FIRST_COMPLETED)
+                        if handle_done(done):
+                            stopping = True
+                            break
+                    else:
+                        time.sleep((next_batch_ns - now_ns) / 1e9)
+                    now_ns = time.perf_counter_ns()
+                
+                # 落后超过一批时不补发积压的令牌，避免突发流量
+                if now_ns - next_batch_ns > batch_ns:
+                    next_batch_ns = now_ns
+            
+            if stopping or stop_is_set():
+                self.stop()
+                for future in pending:
+                    future.cancel()
+            elif pending:
+                # 时间结束后等待剩余任务，超过任务超时时间仍未完成的记为超时
+                done, pending = wait(pending, timeout=self._test_config.timeout)
+                if not handle_done(done):
+                    for future in pending:
+                        future.cancel()
+                        if handle_result({'success': False, 'error': 'Task timeout', 'error_type': 'timeout'}):
+                            logger_manager.warning("[负载生成器] 任务超时，停止测试")
+                            self.stop()
+                            break
         
-        actual_tps = self._completed_tasks / (time.time() - start_time) if (time.time() - start_time) > 0 else 0
+        actual_duration = (time.perf_counter_ns() - start_ns) / 1e9
+        actual_tps = self._completed_tasks / actual_duration if actual_duration > 0 else 0
         
         return {
             'test_type': 'tps',
             'target_tps': target_tps,
             'actual_tps': actual_tps,
-            'duration': time.time() - start_time,
+            'duration': actual_duration,
             'completed_tasks': self._completed_tasks,
             'results': results
         }
@@ -837,12 +1090,10 @@ class LoadGenerator:
         Returns:
             Dict[str, Any]: 负载信息
         """
-        import concurrent.futures
-        
         target_qps = self._test_config.target_qps or 10
         interval = 1.0 / target_qps if target_qps > 0 else 0
-        stop_on_error = getattr(self._test_config, 'stop_on_error', False)
-        max_thread_pool_size = getattr(self._test_config, 'max_thread_pool_size', 0)
+        stop_on_error = self._cfg_stop_on_error
+        max_thread_pool_size = self._cfg_max_thread_pool_size
         
         logger_manager.info(f"[负载生成器] 生成QPS负载: {target_qps} QPS")
         logger_manager.info(f"[负载生成器] 错误处理配置: stop_on_error={stop_on_error}, max_retries={self._max_retries}, error_threshold={self._error_threshold}, error_rate_threshold={self._error_rate_threshold}")
@@ -864,7 +1115,7 @@ class LoadGenerator:
             'business_error': 0,
             'other_error': 0,
             'total_errors': 0,
-            'error_details': {}
+            'error_details': defaultdict(int)
         }  # 重置错误统计
         
         with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
@@ -889,17 +1140,19 @@ class LoadGenerator:
                         self._stop_event.set()
                         break
                 except concurrent.futures.TimeoutError:
-                    self._error_count += 1
-                    self._error_statistics['timeout'] += 1
-                    self._error_statistics['total_errors'] += 1
+                    with self._stats_lock:
+                        self._error_count += 1
+                        self._error_statistics['timeout'] += 1
+                        self._error_statistics['total_errors'] += 1
                     logger_manager.error(f"[负载生成器] 任务执行超时")
                     if stop_on_error:
                         self._stop_event.set()
                         break
                 except Exception as e:
-                    self._error_count += 1
-                    self._error_statistics['other_error'] += 1
-                    self._error_statistics['total_errors'] += 1
+                    with self._stats_lock:
+                        self._error_count += 1
+                        self._error_statistics['other_error'] += 1
+                        self._error_statistics['total_errors'] += 1
                     logger_manager.error(f"[负载生成器] 任务执行异常: {str(e)}")
                     if stop_on_error:
                         self._stop_event.set()
@@ -936,9 +1189,7 @@ class LoadGenerator:
         Returns:
             Dict[str, Any]: 负载信息
         """
-        import concurrent.futures
-        
-        stop_on_error = getattr(self._test_config, 'stop_on_error', False)
+        stop_on_error = self._cfg_stop_on_error
         
         logger_manager.info(f"[负载生成器] 生成爬坡负载: 从0到{self._test_config.concurrent_users}用户，{self._test_config.ramp_up_steps}步")
         logger_manager.info(f"[负载生成器] 错误处理配置: stop_on_error={stop_on_error}, max_retries={self._max_retries}, error_threshold={self._error_threshold}, error_rate_threshold={self._error_rate_threshold}")
@@ -952,7 +1203,7 @@ class LoadGenerator:
             'business_error': 0,
             'other_error': 0,
             'total_errors': 0,
-            'error_details': {}
+            'error_details': defaultdict(int)
         }  # 重置错误统计
         
         # 计算每步增加的用户数和每步持续时间
@@ -1158,10 +1409,6 @@ class LoadGenerator:
         Returns:
             Dict[str, Any]: 负载信息
         """
-        import concurrent.futures
-        import time
-        from collections import deque
-        
         logger_manager.info(f"[负载生成器] 开始长稳测试: 持续 {self._test_config.stability_duration} 秒，检查间隔 {self._test_config.stability_check_interval} 秒")
         logger_manager.info(f"[负载生成器] 长稳测试阈值配置: 错误率 < {self._test_config.stability_threshold.get('error_rate', 0.05) * 100}%, P95响应时间 < {self._test_config.stability_threshold.get('response_time_p95', 1.0)}秒, P99响应时间 < {self._test_config.stability_threshold.get('response_time_p99', 2.0)}秒")
         
@@ -1174,7 +1421,7 @@ class LoadGenerator:
             'business_error': 0,
             'other_error': 0,
             'total_errors': 0,
-            'error_details': {}
+            'error_details': defaultdict(int)
         }  # 重置错误统计
         
         start_time = time.time()
@@ -1182,7 +1429,7 @@ class LoadGenerator:
         next_check_time = start_time + self._test_config.stability_check_interval
         
         # 获取max_thread_pool_size配置
-        max_thread_pool_size = getattr(self._test_config, 'max_thread_pool_size', 0)
+        max_thread_pool_size = self._cfg_max_thread_pool_size
         
         # 使用固定数量的线程执行长时间测试，同时考虑max_thread_pool_size限制
         max_workers = self._test_config.concurrent_users
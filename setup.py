@@ -87,6 +87,13 @@ setup(
         "schema": [
             "jsonschema>=3.2.0",  # JSON Schema验证
         ],
+        "speedups": [
+            "orjson>=3.6.0",  # 更快的JSON序列化
+            "fastjsonschema>=2.15.0",  # 编译型JSON Schema验证
+            "pyahocorasick>=2.0.0",  # 多关键字内容搜索
+            "lxml>=4.6.0",  # 完整XPath支持与更快的XML提取
+            "aiohttp>=3.7.0",  # 并发测试以协程发送配置的HTTP请求
+        ],
     },
     # 数据文件
     package_data={
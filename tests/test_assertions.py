@@ -400,7 +400,39 @@ class TestResponseAssertion(unittest.TestCase):
                 self.mock_response,
                 "Test User"
             )
-    
+
+    def test_content_contains_raw_bytes(self):
+        """
+        测试基于原始字节内容的包含断言
+        """
+        text = '{"data":{"name":"测试用户"}}'
+        self.mock_response.content = text.encode('utf-8')
+        self.mock_response.encoding = 'utf-8'
+        self.mock_response.text = text
+
+        self.assertTrue(self.assertion.assert_response_contains(self.mock_response, "测试用户"))
+        self.assertTrue(self.assertion.assert_response_not_contains(self.mock_response, "管理员"))
+
+    def test_response_length_units(self):
+        """
+        测试按字符数和字节数断言响应长度
+        """
+        text = '测试'
+        self.mock_response.text = text
+        self.mock_response.content = text.encode('utf-8')
+        self.mock_response.headers = {}
+
+        self.assertTrue(self.assertion.assert_response_length(self.mock_response, 2))
+        self.assertTrue(self.assertion.assert_response_length(self.mock_response, 6, unit='bytes'))
+
+        # 存在Content-Length头时直接使用
+        self.mock_response.headers = {'Content-Length': '6'}
+        self.mock_response.content = None
+        self.assertTrue(self.assertion.assert_response_length(self.mock_response, 6, unit='bytes'))
+
+        with self.assertRaises(ValueError):
+            self.assertion.assert_response_length(self.mock_response, 6, unit='words')
+
     def test_regex_match_assertion(self):
         """
         测试正则表达式匹配
@@ -470,7 +502,19 @@ class TestResponseAssertion(unittest.TestCase):
         # 清除失败断言
         self.assertion.clear_failed_assertions()
         self.assertFalse(self.assertion.has_failed_assertions())
-    
+
+    def test_failed_assertions_bounded(self):
+        """
+        测试失败断言记录数量受max_failures限制
+        """
+        assertion = ResponseAssertion(max_failures=2)
+        for expected_id in (2, 3, 4):
+            with self.assertRaises(AssertionError):
+                assertion.assert_json_path(self.mock_response, "data.id", expected_id)
+
+        failed = assertion.get_failed_assertions()
+        self.assertEqual([item['expected'] for item in failed], [3, 4])
+
     def test_assert_all_passed(self):
         """
         测试所有断言通过
@@ -564,7 +608,19 @@ class TestResponseAssertion(unittest.TestCase):
         stream_bytes = b'{"data":{"id":1,"name":"Test User"}}'
         result = self.assertion.assert_stream_contains(stream_bytes, "Test User")
         self.assertTrue(result)
-    
+
+    def test_stream_contains_chunks(self):
+        """
+        测试按数据块断言流式响应包含内容
+        """
+        text = '{"data":{"name":"测试用户"}}'.encode('utf-8')
+        # 期望内容跨越数据块边界（且切断多字节字符）
+        chunks = [text[:17], text[17:20], text[20:]]
+
+        self.assertTrue(self.assertion.assert_stream_contains(chunks, "测试用户"))
+        self.assertTrue(self.assertion.assert_stream_contains(["abc", "def"], "cde"))
+        self.assertFalse(self.assertion._stream_contains(chunks, "管理员"))
+
     @pytest.mark.asyncio
     async def test_async_assertions(self):
         """
@@ -618,7 +674,70 @@ class TestResponseAssertion(unittest.TestCase):
                 self.mock_response,
                 expected_data
             )
-    
+
+    def test_json_deep_equal_numeric_types(self):
+        """
+        测试JSON深度比较中int与float的兼容
+        """
+        self.mock_response.json.return_value = {"price": 10.0, "count": 3, "flag": True}
+
+        result = self.assertion.assert_json_deep_equal(
+            self.mock_response,
+            {"price": 10, "count": 3.0}
+        )
+        self.assertTrue(result)
+
+        # 布尔值与数值仍视为类型不匹配
+        with self.assertRaises(Exception):
+            self.assertion.assert_json_deep_equal(self.mock_response, {"flag": 1, "price": 10.0, "count": 3})
+
+    def test_json_deep_equal_bool_not_number_in_both_modes(self):
+        """
+        测试整体相等的快速路径不会让布尔值匹配数值，两种模式结果一致
+        """
+        self.mock_response.json.return_value = {"flag": True}
+
+        for ignore_order in (False, True):
+            with self.assertRaises(Exception):
+                self.assertion.assert_json_deep_equal(
+                    self.mock_response, {"flag": 1}, ignore_order=ignore_order
+                )
+            self.assertTrue(self.assertion.assert_json_deep_equal(
+                self.mock_response, {"flag": True}, ignore_order=ignore_order
+            ))
+
+    def test_json_deep_equal_ignore_order(self):
+        """
+        测试忽略数组顺序的JSON深度比较
+        """
+        self.mock_response.json.return_value = {
+            "items": [{"id": 2, "tags": ["b"]}, {"id": 1, "tags": ["a"]}, 3]
+        }
+
+        # 元素完全相同但顺序不同应该通过
+        result = self.assertion.assert_json_deep_equal(
+            self.mock_response,
+            {"items": [3, {"tags": ["a"], "id": 1}, {"id": 2, "tags": ["b"]}]},
+            ignore_order=True
+        )
+        self.assertTrue(result)
+
+        # 元素只包含部分字段时应回退到逐个匹配并通过
+        result = self.assertion.assert_json_deep_equal(
+            self.mock_response,
+            {"items": [{"id": 1}, 3, {"id": 2}]},
+            ignore_order=True
+        )
+        self.assertTrue(result)
+
+        # 元素不匹配应该失败
+        with self.assertRaises(Exception):
+            self.assertion.assert_json_deep_equal(
+                self.mock_response,
+                {"items": [{"id": 1}, 3, {"id": 4}]},
+                ignore_order=True
+            )
+
     def test_complex_json_path_assertion(self):
         """
         测试复杂JSON路径断言，如数组访问
@@ -8,7 +8,7 @@ import os
 import unittest
 import tempfile
 import json
-from apitestkit.core.config import config_manager
+from apitestkit.core.config import ConfigManager, config_manager
 
 
 class TestConfig(unittest.TestCase):
@@ -147,6 +147,58 @@ class TestConfig(unittest.TestCase):
         if os.path.exists(custom_output_dir):
             os.rmdir(custom_output_dir)
 
+    
+    def test_yaml_config_cache(self):
+        """
+        测试YAML配置文件的JSON缓存：缓存只保存原始数据，环境变量每次重新解析
+        """
+        try:
+            import yaml  # noqa: F401
+        except ImportError:
+            self.skipTest("未安装PyYAML")
+        
+        with tempfile.TemporaryDirectory() as temp_dir:
+            yaml_file = os.path.join(temp_dir, 'default.yaml')
+            with open(yaml_file, 'w', encoding='utf-8') as f:
+                f.write("cache_key: ${APITESTKIT_CACHE_TEST}\n")
+            cache_file = yaml_file + '.cached.json'
+            
+            os.environ['APITESTKIT_CACHE_TEST'] = 'first'
+            try:
+                self.assertTrue(config_manager.load_config(yaml_file, use_cache=True))
+                self.assertTrue(os.path.exists(cache_file))
+                self.assertEqual(config_manager.get('cache_key'), 'first')
+                
+                # 命中缓存时仍按当前环境变量解析
+                os.environ['APITESTKIT_CACHE_TEST'] = 'second'
+                self.assertTrue(config_manager.load_config(yaml_file, use_cache=True))
+                self.assertEqual(config_manager.get('cache_key'), 'second')
+            finally:
+                del os.environ['APITESTKIT_CACHE_TEST']
+            
+            # 源文件修改后缓存失效
+            with open(yaml_file, 'w', encoding='utf-8') as f:
+                f.write("cache_key: changed_value\n")
+            self.assertTrue(config_manager.load_config(yaml_file, use_cache=True))
+            self.assertEqual(config_manager.get('cache_key'), 'changed_value')
+
+    
+    def test_get_cache_invalidation(self):
+        """
+        测试get()结果缓存在set/update和整体替换配置后失效
+        """
+        # 使用独立的配置管理器，整体替换配置不影响全局实例
+        manager = ConfigManager()
+        self.assertIsNone(manager.get('cache_test.value'))
+        manager.set('cache_test.value', 1)
+        self.assertEqual(manager.get('cache_test.value'), 1)
+        manager.update({'cache_test': {'value': 2}})
+        self.assertEqual(manager.get('cache_test.value'), 2)
+        self.assertEqual(manager.get('cache_test.missing', 'default'), 'default')
+        
+        manager._config = {'cache_test': {'value': 3}}
+        self.assertEqual(manager.get('cache_test.value'), 3)
+        self.assertIsNotNone(config_manager.get('log_dir'))
 
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -0,0 +1,225 @@
+"""
+数据提取器测试
+
+验证JSONPath、正则、XPath和键名提取，以及批量提取计划的行为
+"""
+
+import json
+import sys
+import unittest
+from unittest.mock import patch
+from apitestkit.exception.exceptions import ApiTestException
+from apitestkit.extractor.data_extractor import DataExtractor, ExtractionPlan, data_extractor
+
+# 包的data_extractor属性是全局实例，模块本身从sys.modules获取
+extractor_module = sys.modules['apitestkit.extractor.data_extractor']
+
+
+class FakeResponse:
+    """
+    模拟响应对象，记录JSON解析次数
+    """
+
+    def __init__(self, text, headers=None):
+        self.text = text
+        self.headers = headers or {}
+        self.json_calls = 0
+
+    def json(self):
+        self.json_calls += 1
+        return json.loads(self.text)
+
+
+class TestDataExtractor(unittest.TestCase):
+    """
+    测试DataExtractor的单项提取功能
+    """
+
+    def setUp(self):
+        """
+        测试前的准备工作
+        """
+        self.extractor = DataExtractor()
+        self.response = FakeResponse(json.dumps({
+            'user': {'name': 'alice', 'tags': ['a', 'b']},
+            'items': [{'id': 1}, {'id': 2}, {'id': 3}],
+            'message': 'order=101;order=202'
+        }))
+
+    def test_extract_by_jsonpath(self):
+        """
+        测试JSONPath提取全部匹配和只取第一个匹配
+        """
+        data = {'items': [{'id': 1}, {'id': 2}]}
+
+        self.assertEqual(self.extractor.extract_by_jsonpath(data, '$.items[*].id'), [1, 2])
+        self.assertEqual(self.extractor.extract_by_jsonpath(data, '$.items[*].id', first_only=True), [1])
+        self.assertEqual(self.extractor.extract_by_jsonpath(data, '$.missing'), [])
+
+    def test_extract_by_regex_groups(self):
+        """
+        测试正则提取的group与Match.group一致：0为整个匹配，支持组名
+        """
+        text = 'a1b2 a3b4'
+        pattern = r'a(\d)b(?P<second>\d)'
+
+        self.assertEqual(self.extractor.extract_by_regex(text, pattern), [('1', '2'), ('3', '4')])
+        self.assertEqual(self.extractor.extract_by_regex(text, pattern, group=0), ['a1b2', 'a3b4'])
+        self.assertEqual(self.extractor.extract_by_regex(text, pattern, group=1), ['1', '3'])
+        self.assertEqual(self.extractor.extract_by_regex(text, pattern, group='second'), ['2', '4'])
+        self.assertEqual(self.extractor.extract_by_regex(text, pattern, group=1, first_only=True), ['1'])
+
+    def test_extract_by_regex_first_only_matches_findall(self):
+        """
+        测试只取第一个匹配时结果形式与findall一致
+        """
+        text = 'x=1 x=2'
+        for pattern in (r'x=\d', r'x=(\d)', r'(x)=(\d)'):
+            self.assertEqual(self.extractor.extract_by_regex(text, pattern, first_only=True),
+                             self.extractor.extract_by_regex(text, pattern)[:1])
+
+    def test_extract_by_key(self):
+        """
+        测试嵌套键名提取和默认值
+        """
+        data = {'user': {'profile': {'age': 0}}}
+
+        self.assertEqual(self.extractor.extract_by_key(data, 'user.profile.age'), 0)
+        self.assertEqual(self.extractor.extract_by_key(data, 'user.missing', 'n/a'), 'n/a')
+        self.assertEqual(self.extractor.extract_by_key({'a.b': 1}, 'a.b', 'n/a'), 'n/a')
+
+    def test_extract_first(self):
+        """
+        测试extract_first只返回第一个匹配，无匹配时返回默认值
+        """
+        self.assertEqual(self.extractor.extract_first(self.response, 'jsonpath', '$.items[*].id'), 1)
+        self.assertEqual(self.extractor.extract_first(self.response, 'regex', r'order=(\d+)'), '101')
+        self.assertEqual(self.extractor.extract_first(self.response, 'key', 'user.age', default=18), 18)
+
+    def test_extract_from_response_unknown_type(self):
+        """
+        测试不支持的提取器类型抛出异常
+        """
+        with self.assertRaises(ApiTestException):
+            self.extractor.extract_from_response(self.response, 'css', 'div')
+
+    def test_extract_header_case_insensitive(self):
+        """
+        测试不区分大小写提取响应头
+        """
+        response = FakeResponse('', headers={'Content-Type': 'application/json'})
+
+        self.assertEqual(self.extractor.extract_header(response, 'content-type'), 'application/json')
+        self.assertIsNone(self.extractor.extract_header(response, 'X-Missing'))
+
+    def test_extract_multiple_parses_body_once(self):
+        """
+        测试一次批量提取中每种格式的响应体只解析一次
+        """
+        results = self.extractor.extract_multiple(self.response, [
+            {'name': 'name', 'type': 'jsonpath', 'expr': '$.user.name'},
+            {'name': 'ids', 'type': 'jsonpath', 'expr': '$.items[*].id'},
+            {'name': 'tags', 'type': 'key', 'expr': 'user.tags'}
+        ])
+
+        self.assertEqual(results, {'name': ['alice'], 'ids': [1, 2, 3], 'tags': [['a', 'b']]})
+        self.assertEqual(self.response.json_calls, 1)
+
+    def test_body_cache_limited_to_one_call(self):
+        """
+        测试修改提取结果或响应内容不影响之后的提取
+        """
+        user = self.extractor.extract_from_response(self.response, 'key', 'user')[0]
+        user['name'] = 'changed'
+        self.assertEqual(self.extractor.extract_from_response(self.response, 'key', 'user.name'), ['alice'])
+
+        self.response.text = json.dumps({'user': {'name': 'bob'}})
+        self.assertEqual(self.extractor.extract_from_response(self.response, 'key', 'user.name'), ['bob'])
+        plan = self.extractor.prepare([{'name': 'name', 'type': 'key', 'expr': 'user.name'}])
+        self.assertEqual(plan.run(self.response), {'name': ['bob']})
+
+    def test_patch_global_instance_method(self):
+        """
+        测试可以在全局实例上替换提取方法，便于在用户测试中打桩
+        """
+        with patch.object(data_extractor, 'extract_by_jsonpath', return_value=['stub']):
+            self.assertEqual(data_extractor.extract_by_jsonpath({}, '$.a'), ['stub'])
+        self.assertEqual(data_extractor.extract_by_jsonpath({'a': 1}, '$.a'), [1])
+
+
+class TestExtractionPlan(unittest.TestCase):
+    """
+    测试预编译的批量提取计划
+    """
+
+    def setUp(self):
+        """
+        测试前的准备工作
+        """
+        self.response = FakeResponse(json.dumps({'id': 7, 'message': 'code=A1 code=B2'}))
+
+    def test_plan_reused_across_responses(self):
+        """
+        测试同一个计划可在多个响应上执行，正则配置支持group
+        """
+        plan = data_extractor.prepare([
+            {'name': 'id', 'type': 'key', 'expr': 'id'},
+            {'name': 'codes', 'type': 'regex', 'expr': r'code=(\w)(\d)', 'group': 2}
+        ])
+
+        self.assertIsInstance(plan, ExtractionPlan)
+        self.assertEqual(plan.run(self.response), {'id': [7], 'codes': ['1', '2']})
+        other = FakeResponse(json.dumps({'id': 8, 'message': 'code=C3'}))
+        self.assertEqual(plan.run(other), {'id': [8], 'codes': ['3']})
+
+    def test_config_errors_do_not_stop_other_steps(self):
+        """
+        测试配置错误的项返回空列表，其他项正常提取
+        """
+        results = data_extractor.extract_multiple(self.response, [
+            'not a dict',
+            {'name': 'no_expr', 'type': 'key'},
+            {'name': 'bad_type', 'type': 'css', 'expr': 'div'},
+            {'name': 'bad_regex', 'type': 'regex', 'expr': '('},
+            {'name': 'id', 'type': 'KEY', 'expr': 'id'}
+        ])
+
+        self.assertEqual(results, {'unknown': [], 'no_expr': [], 'bad_type': [], 'bad_regex': [], 'id': [7]})
+
+    def test_xpath_without_lxml_uses_elementtree(self):
+        """
+        测试未安装lxml时XPath提取使用ElementTree的路径查找
+        """
+        response = FakeResponse('<root><item>1</item><item>2</item></root>')
+
+        with patch.object(extractor_module, 'LXML_AVAILABLE', False):
+            plan = data_extractor.prepare([{'name': 'items', 'type': 'xpath', 'expr': './item'}])
+            self.assertEqual(plan.run(response), {'items': ['1', '2']})
+            self.assertEqual(data_extractor.extract_from_response(response, 'xpath', './item', first_only=True), ['1'])
+
+    @unittest.skipUnless(extractor_module.LXML_AVAILABLE, 'lxml未安装')
+    def test_xpath_with_lxml(self):
+        """
+        测试安装lxml时支持完整XPath，ElementTree写法的表达式回退到路径查找
+        """
+        response = FakeResponse('<root xmlns:n="urn:x"><item id="a">1</item><n:v>2</n:v></root>')
+
+        self.assertEqual(data_extractor.extract_from_response(response, 'xpath', '//item/@id'), ['a'])
+        self.assertEqual(data_extractor.extract_from_response(response, 'xpath', 'count(//item)'), [1.0])
+        self.assertEqual(data_extractor.extract_from_response(response, 'xpath', './{urn:x}v'), ['2'])
+
+    @unittest.skipUnless(extractor_module.LXML_AVAILABLE, 'lxml未安装')
+    def test_parallel_steps_match_sequential(self):
+        """
+        测试可并行步骤足够多时使用线程池执行，结果与逐个提取一致
+        """
+        response = FakeResponse('<root>' + ''.join(f'<i{n}>{n}</i{n}>' for n in range(10)) + '</root>')
+        configs = [{'name': f'i{n}', 'type': 'xpath', 'expr': f'//i{n}'} for n in range(10)]
+
+        plan = data_extractor.prepare(configs)
+        self.assertTrue(plan._parallel)
+        self.assertEqual(plan.run(response), {f'i{n}': [str(n)] for n in range(10)})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,142 @@
+"""
+数据存储测试
+
+验证数据存储管理模块的存储、数据库写入和检索功能
+"""
+
+import json
+import shutil
+import sqlite3
+import tempfile
+import unittest
+from unittest.mock import patch
+from apitestkit.core import data_storage
+from apitestkit.core.config import config_manager
+from apitestkit.core.data_storage import DataStorageManager
+
+
+class TestDataStorageManager(unittest.TestCase):
+    """
+    测试数据存储管理器的功能
+    """
+
+    def setUp(self):
+        """
+        测试前的准备工作：使用临时数据目录创建独立的存储管理器
+        """
+        self.original_data_dir = config_manager.get('data_dir')
+        self.temp_dir = tempfile.mkdtemp()
+        config_manager.set('data_dir', self.temp_dir)
+        self.storage = DataStorageManager()
+
+    def tearDown(self):
+        """
+        测试后的清理工作
+        """
+        self.storage.close()
+        config_manager.set('data_dir', self.original_data_dir)
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def _store(self, index, **request_info):
+        """
+        存储一条测试响应记录
+        """
+        info = {'url': f'http://example.com/items/{index}', 'method': 'GET', 'response_time': 0.1}
+        info.update(request_info)
+        return self.storage.store_response({'index': index}, info, tags=['smoke'])
+
+    def test_background_database_writes(self):
+        """
+        测试记录由后台线程批量写入数据库，flush后全部可见
+        """
+        total = DataStorageManager.WRITE_BATCH_SIZE + 10
+        for i in range(total):
+            self._store(i)
+        self.storage.flush()
+
+        with sqlite3.connect(str(self.storage._db_path)) as conn:
+            count = conn.execute('SELECT COUNT(*) FROM api_responses').fetchone()[0]
+        self.assertEqual(count, total)
+        self.assertEqual(self.storage.get_record_count(), total)
+
+        # 关闭后继续存储只写入内存，不报错
+        self.storage.close()
+        self.assertGreater(self._store(total), 0)
+
+    def test_filter_data_matches_memory_scan(self):
+        """
+        测试基于数据库的过滤结果与内存过滤一致，且只包含本会话的记录
+        """
+        for i in range(20):
+            self._store(i, method='POST' if i % 2 else 'get',
+                        response_time=i / 10, status_code=500 if i % 5 == 0 else 200)
+
+        result = self.storage.filter_data(url_pattern='items/1', methods=['GET'])
+        self.assertEqual([r['id'] for r in result], [11, 13, 15, 17, 19])
+
+        result = self.storage.filter_data(status_codes=[500])
+        self.assertEqual([r['id'] for r in result], [1, 6, 11, 16])
+
+        result = self.storage.filter_data(min_response_time=0.5, max_response_time=1.0, limit=3)
+        self.assertEqual([r['id'] for r in result], [6, 7, 8])
+
+        result = self.storage.filter_data(tags=['smoke'], condition=lambda r: r['id'] > 18)
+        self.assertEqual([r['id'] for r in result], [19, 20])
+
+        # 清空内存数据后，数据库中的旧记录不再参与过滤
+        self.storage.clear_memory_data()
+        self.assertEqual(self.storage.filter_data(tags=['smoke']), [])
+        # 记录ID在清空后继续递增
+        self.assertEqual(self._store(100), 21)
+        self.assertEqual([r['id'] for r in self.storage.filter_data(tags=['smoke'])], [21])
+
+    def test_stored_json_format(self):
+        """
+        测试存储的JSON字段与json.dumps默认格式一致，不受是否安装orjson影响
+        """
+        data = {'name': '测试', 'items': [1, 2]}
+        self.storage.store_response(data, {'url': 'http://example.com/items/1', 'params': {'q': 'a b'}},
+                                    tags=['smoke', '冒烟'])
+
+        record = self.storage.filter_data()[0]
+        self.assertEqual(record['response_data'], json.dumps(data))
+        self.assertEqual(record['request_params'], '{"q": "a b"}')
+        self.assertEqual(record['tags'], json.dumps(['smoke', '冒烟']))
+
+    def test_filter_data_in_memory_columns(self):
+        """
+        测试数据库不可用时按列在内存中过滤，返回完整的记录字典
+        """
+        self.storage.close()
+        for i in range(10):
+            self._store(i, response_time=i)
+
+        result = self.storage.filter_data(url_pattern='items/', min_response_time=7, limit=2)
+        self.assertEqual([r['id'] for r in result], [8, 9])
+        self.assertEqual(result[0]['request_url'], 'http://example.com/items/7')
+        self.assertEqual(result[0]['tags'], '["smoke"]')
+
+        result = self.storage.filter_data(condition=lambda r: r['response_time'] < 2)
+        self.assertEqual([r['id'] for r in result], [1, 2])
+        self.assertEqual(len(self.storage.find_records_by_content('items/3')), 1)
+
+    def test_find_records_by_multiple_keywords(self):
+        """
+        测试按多个关键字查找记录，包含任一关键字即匹配
+        """
+        for i in range(5):
+            self._store(i)
+
+        result = self.storage.find_records_by_content(['items/1', 'items/3', 'missing'])
+        self.assertEqual([r['id'] for r in result], [2, 4])
+        self.assertEqual(self.storage.find_records_by_content(['missing']), [])
+        # 空关键字列表不匹配任何记录，与是否安装pyahocorasick无关
+        self.assertEqual(self.storage.find_records_by_content([]), [])
+        with patch.object(data_storage, 'AHOCORASICK_AVAILABLE', False):
+            self.assertEqual(self.storage.find_records_by_content([]), [])
+            self.assertEqual([r['id'] for r in self.storage.find_records_by_content(['items/1', 'items/3'])], [2, 4])
+        self.assertEqual([r['id'] for r in self.storage.find_records_by_content('items/4')], [5])
+
+
+if __name__ == '__main__':
+    unittest.main()
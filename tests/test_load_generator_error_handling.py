@@ -118,7 +118,20 @@ class TestLoadGeneratorErrorHandling(unittest.TestCase):
         generator._consecutive_errors = 6  # 超过consecutive_error_threshold=5
         should_stop = generator._check_error_threshold()
         self.assertTrue(should_stop)
-    
+
+    def test_check_error_threshold_without_thresholds(self):
+        """测试未配置任何阈值时不会因错误停止"""
+        config = {"method": "GET", "url": "https://httpbin.org/get"}
+        generator = LoadGenerator(config, self.metrics_collector)
+
+        generator._total_errors = 100
+        generator._consecutive_errors = 100
+        self.assertFalse(generator._check_error_threshold())
+
+        # 阈值为0时仍然生效
+        generator._error_threshold = 0
+        self.assertTrue(generator._check_error_threshold())
+
     @patch('apitestkit.performance.load_generator.time.sleep')
     @patch('apitestkit.performance.load_generator.requests.request')
     def test_execute_with_retry_success(self, mock_request, mock_sleep):
@@ -161,6 +174,9 @@ class TestLoadGeneratorErrorHandling(unittest.TestCase):
         self.assertEqual(mock_request.call_count, 4)  # 1次原始请求 + 3次重试
         self.assertEqual(mock_sleep.call_count, 3)  # 验证重试延迟被调用
         self.assertIsNone(result)  # 最终失败返回None
+        # 每次失败的尝试计入一次连续错误，旧名称是同一个计数的别名
+        self.assertEqual(generator._consecutive_errors, 4)
+        self.assertEqual(generator._consecutive_error_count, 4)
     
     @patch('apitestkit.performance.load_generator.requests.request')
     def test_execute_with_non_retryable_error(self, mock_request):
@@ -197,6 +213,28 @@ class TestLoadGeneratorErrorHandling(unittest.TestCase):
         self.assertEqual(generator._total_errors, 0)
         self.assertEqual(generator._consecutive_errors, 0)
         self.assertEqual(sum(generator._error_stats.values()), 0)
+    
+    @patch('apitestkit.performance.load_generator.logger')
+    def test_record_error_from_multiple_threads(self, mock_logger):
+        """测试多个线程同时记录错误时计数准确"""
+        import threading
+        generator = LoadGenerator(self.config, self.metrics_collector)
+        
+        def record():
+            for _ in range(500):
+                generator._record_error("http_error", "HTTP 500 Error")
+        
+        threads = [threading.Thread(target=record) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        
+        self.assertEqual(generator._total_errors, 4000)
+        self.assertEqual(generator._error_count, 4000)
+        self.assertEqual(generator._error_stats["business_error"], 4000)
+        self.assertEqual(generator._error_stats["http_error"], 4000)
+        self.assertEqual(generator._error_stats["error_details"]["HTTP 500 Error"], 4000)
 
 
 if __name__ == '__main__':
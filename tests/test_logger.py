@@ -4,10 +4,12 @@
 验证日志管理模块的基本功能和配置，特别是用户日志和框架日志的区分功能
 """
 
+import logging
 import os
+import threading
 import unittest
 from unittest.mock import patch
-from apitestkit.core.logger import logger_manager, create_user_logger
+from apitestkit.core.logger import logger_manager, create_user_logger, _DEFAULT_SENSITIVE_KEYS
 from apitestkit.core.config import config_manager
 
 
@@ -184,7 +186,66 @@ class TestLoggerManager(unittest.TestCase):
                     sensitive_data_logged = True
             
             self.assertTrue(sensitive_data_logged, "应该记录了过滤后的敏感信息")
-    
+
+    def test_sensitive_data_copy_on_write(self):
+        """
+        测试敏感数据过滤只复制被修改的容器，不修改原始数据
+        """
+        data = {
+            'items': [{'name': 'a'}, {'token': 'secret', 'meta': {'size': 1}}],
+            'settings': {'normal_data': 'safe'}
+        }
+        filtered = logger_manager._filter_sensitive_data(data)
+
+        self.assertEqual(filtered['items'][1]['token'], '***')
+        self.assertEqual(data['items'][1]['token'], 'secret')
+        # 未包含敏感键的子结构直接复用
+        self.assertIs(filtered['settings'], data['settings'])
+        self.assertIs(filtered['items'][0], data['items'][0])
+        self.assertIs(filtered['items'][1]['meta'], data['items'][1]['meta'])
+
+        # 完全不含敏感键的数据原样返回
+        safe_data = {'list': [1, {'name': 'b'}]}
+        self.assertIs(logger_manager._filter_sensitive_data(safe_data), safe_data)
+
+    def test_log_config_follows_config_changes(self):
+        """
+        测试日志配置快照在配置修改后自动重建
+        """
+        original_keys = config_manager.get('sensitive_keys', list(_DEFAULT_SENSITIVE_KEYS))
+        try:
+            self.assertEqual(logger_manager._filter_sensitive_data({'pin': '1234'}), {'pin': '1234'})
+            config_manager.set('sensitive_keys', ['pin'])
+            self.assertEqual(logger_manager._filter_sensitive_data({'pin': '1234'}), {'pin': '***'})
+            # 未修改配置时复用同一快照
+            self.assertIs(logger_manager._get_log_config(), logger_manager._get_log_config())
+        finally:
+            config_manager.set('sensitive_keys', original_keys)
+
+    def test_response_body_filtering(self):
+        """
+        测试响应体日志：含敏感键时掩码，不含时直接输出截断后的原文
+        """
+        logger_manager.set_level('DEBUG')
+        logger_manager._get_logger('apitestkit.response')
+
+        with self.assertLogs('apitestkit.response', level='DEBUG') as cm:
+            logger_manager.log_response(200, 1.0, '{"user": {"Password": "secret123"}}')
+            logger_manager.log_response(200, 1.0, '{"a":  1}')
+            logger_manager.log_response(200, 1.0, '{"a": "' + 'x' * 2000 + '", "token": "t"}')
+            logger_manager.log_response(200, 1.0, '{"password": "secret456", "data": "' + 'x' * 5000 + '"}')
+
+        bodies = [line for line in cm.output if '响应体' in line]
+        self.assertIn('"Password": "***"', bodies[0])
+        self.assertNotIn('secret123', bodies[0])
+        # 未经解析和重新序列化，保留原始格式
+        self.assertIn('{"a":  1}', bodies[1])
+        self.assertTrue(bodies[2].endswith('... (truncated)'))
+        # 大响应体不解析，只在截断后的前缀中掩码敏感值
+        self.assertIn('"password": "***"', bodies[3])
+        self.assertNotIn('secret456', bodies[3])
+        self.assertTrue(bodies[3].endswith('... (truncated)'))
+
     def test_clear_user_loggers(self):
         """
         测试清理用户日志记录器
@@ -202,6 +263,54 @@ class TestLoggerManager(unittest.TestCase):
         # 验证清理成功
         self.assertEqual(len(logger_manager._user_loggers), 0)
     
+    def test_user_logger_background_file_writes(self):
+        """
+        测试用户日志由后台监听器缓冲写入文件，错误日志返回前已落盘
+        """
+        user_logger = logger_manager.get_user_logger('queued_test')
+        _, listener = logger_manager._listeners['user.queued_test']
+        buffer_handler = listener.handlers[0]
+        log_file = buffer_handler.target.baseFilename
+
+        # 普通日志先缓存，错误日志连同之前的缓存一起写出
+        user_logger.info('queued message')
+        user_logger.error('error message')
+        with open(log_file, encoding='utf-8') as f:
+            content = f.read()
+        self.assertLess(content.index('queued message'), content.index('error message'))
+        self.assertEqual(buffer_handler.buffer, [])
+
+        # 清理后监听器停止，文件处理器关闭
+        logger_manager.clear_user_loggers()
+        self.assertEqual(logger_manager._listeners, {})
+        self.assertIsNone(listener._thread)
+        self.assertIsNone(buffer_handler.target)
+        os.remove(log_file)
+
+    def test_user_logger_error_on_listener_thread(self):
+        """
+        测试在监听器线程上记录错误日志时不等待队列，不会死锁
+        """
+        user_logger = logger_manager.get_user_logger('reentrant_test')
+        _, listener = logger_manager._listeners['user.reentrant_test']
+        log_file = listener.handlers[0].target.baseFilename
+
+        class ReentrantHandler(logging.Handler):
+            def emit(self, record):
+                if record.getMessage() == 'trigger':
+                    user_logger.error('logged on listener thread')
+
+        listener.handlers = listener.handlers + (ReentrantHandler(),)
+        thread = threading.Thread(target=user_logger.error, args=('trigger',), daemon=True)
+        thread.start()
+        thread.join(5)
+        self.assertFalse(thread.is_alive())
+
+        logger_manager.clear_user_loggers()
+        with open(log_file, encoding='utf-8') as f:
+            self.assertIn('logged on listener thread', f.read())
+        os.remove(log_file)
+
     def test_different_logger_instances(self):
         """
         测试不同名称的日志记录器是不同的实例
@@ -216,6 +325,15 @@ class TestLoggerManager(unittest.TestCase):
         self.assertIn('logger1', logger_manager._loggers)
         self.assertIn('logger2', logger_manager._loggers)
     
+    def test_get_logger_by_module_name(self):
+        """
+        测试按模块名获取框架日志记录器，同名返回同一实例
+        """
+        module_logger = logger_manager.get_logger('apitestkit.extractor.data_extractor')
+
+        self.assertEqual(module_logger.name, 'apitestkit.extractor.data_extractor')
+        self.assertIs(module_logger, logger_manager.get_logger('apitestkit.extractor.data_extractor'))
+
     def test_log_format(self):
         """
         测试日志格式是否符合预期
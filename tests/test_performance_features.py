@@ -12,11 +12,15 @@
 
 import unittest
 import json
+import threading
 import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from types import SimpleNamespace
 from unittest.mock import patch, MagicMock
 from apitestkit import api
 # 避免循环导入，移除重复导入
 from apitestkit.performance.performance_runner import PerformanceRunner
+from apitestkit.performance import load_generator
 from apitestkit.performance.load_generator import LoadGenerator
 from apitestkit.performance.metrics_collector import MetricsCollector
 from apitestkit.performance.report_generator import PerformanceReportGenerator
@@ -287,6 +291,141 @@ class TestLoadGenerator(unittest.TestCase):
         except Exception as e:
             print(f"警告: 生成TPS负载测试遇到问题: {str(e)}")
             self.assertTrue(True)  # 允许测试通过以继续其他测试
+    
+    def test_generate_http_load_from_config(self):
+        """测试未提供任务函数时按配置发送HTTP请求，协程和线程两种方式都复用连接"""
+        connections = set()
+        
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+            
+            def do_GET(self):
+                connections.add(self.client_address)
+                self.send_response(200)
+                self.send_header('Content-Length', '2')
+                self.end_headers()
+                self.wfile.write(b'ok')
+            
+            def log_message(self, *args):
+                pass
+        
+        # 保持连接的请求各占一个线程，关闭服务时不等待这些连接结束
+        server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+        server.block_on_close = False
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        self.addCleanup(server.server_close)
+        self.addCleanup(server.shutdown)
+        
+        config = {
+            'test_type': 'concurrent',
+            'concurrent_users': 1,
+            'duration': 0.3,
+            'url': f'http://127.0.0.1:{server.server_address[1]}/ok',
+            'timeout': 5
+        }
+        modes = [False, True] if load_generator.AIOHTTP_AVAILABLE else [False]
+        for use_aiohttp in modes:
+            connections.clear()
+            metrics_collector = MetricsCollector()
+            with patch.object(load_generator, 'AIOHTTP_AVAILABLE', use_aiohttp):
+                result = LoadGenerator(dict(config), metrics_collector).generate_load(None)
+
+            self.assertGreater(result['completed_tasks'], 1)
+            # 两种方式返回相同格式的结果
+            for r in result['results']:
+                self.assertEqual(set(r), {'success', 'status_code', 'elapsed'})
+                self.assertTrue(r['success'])
+                self.assertEqual(r['status_code'], 200)
+            # 每个请求的响应时间和状态码都记录到指标收集器
+            summary = metrics_collector.get_requests_summary()
+            self.assertEqual(summary['total_requests'], result['completed_tasks'])
+            self.assertEqual(metrics_collector.get_status_code_distribution(), {200: result['completed_tasks']})
+            # 单个虚拟用户的所有请求走同一个连接
+            self.assertEqual(len(connections), 1)
+
+    def test_tps_load_not_limited_by_task_latency(self):
+        """测试TPS负载按目标速率提交任务，不受单个任务耗时限制"""
+        config = SimpleNamespace(test_type='tps', target_tps=40, duration=0.5, timeout=5,
+                                 max_thread_pool_size=0, stop_on_error=False)
+        generator = LoadGenerator(config, self.metrics_collector)
+        result = generator.generate_load(lambda: time.sleep(0.1))
+
+        # 任务耗时0.1秒，逐个等待时最多完成5个
+        self.assertGreaterEqual(result['completed_tasks'], 15)
+        self.assertLessEqual(result['completed_tasks'], 21)
+        self.assertTrue(all(r['success'] for r in result['results']))
+
+    def test_tps_load_records_each_failure_once(self):
+        """测试TPS负载中失败的任务只记录一次错误"""
+        config = SimpleNamespace(test_type='tps', target_tps=8, duration=0.5, timeout=5,
+                                 max_thread_pool_size=0, stop_on_error=False)
+        generator = LoadGenerator(config, self.metrics_collector)
+
+        def failing_task():
+            raise ValueError('boom')
+
+        result = generator.generate_load(failing_task)
+
+        self.assertEqual(generator._error_statistics['total_errors'], result['completed_tasks'])
+        self.assertEqual(dict(generator._error_statistics['error_details']), {'boom': result['completed_tasks']})
+
+    def test_tps_load_limits_pending_tasks(self):
+        """测试任务慢于目标速率时限制积压的任务数量"""
+        calls = []
+        config = SimpleNamespace(test_type='tps', target_tps=500, duration=0.5, timeout=5,
+                                 max_thread_pool_size=2, stop_on_error=False)
+        generator = LoadGenerator(config, self.metrics_collector)
+        generator.generate_load(lambda: calls.append(1) or time.sleep(0.1))
+
+        # 2个线程0.5秒内最多执行约10个任务，另外最多积压4个
+        self.assertLessEqual(len(calls), 16)
+
+    def test_error_threshold_checked_on_every_failure(self):
+        """测试并发用户较多时达到错误数量阈值即停止"""
+        config = dict(self.config, test_type='concurrent', concurrent_users=100, duration=5,
+                      max_thread_pool_size=2, error_threshold=5)
+        generator = LoadGenerator(config, self.metrics_collector)
+
+        def failing_task():
+            time.sleep(0.01)
+            raise ValueError('failed')
+
+        result = generator.generate_load(failing_task)
+
+        self.assertLessEqual(result['completed_tasks'], 5)
+
+    def test_stop_on_error_cancels_queued_tasks(self):
+        """测试出错停止时取消线程池中尚未开始的任务"""
+        calls = []
+        config = dict(self.config, test_type='concurrent', concurrent_users=8, duration=5,
+                      max_thread_pool_size=1, stop_on_error=True)
+        generator = LoadGenerator(config, self.metrics_collector)
+
+        def failing_task():
+            calls.append(1)
+            time.sleep(0.05)
+            raise ValueError('failed')
+
+        result = generator.generate_load(failing_task)
+
+        # 第一个任务失败时，单线程的线程池最多已经开始执行第二个任务
+        self.assertLessEqual(len(calls), 2)
+        self.assertEqual(result['completed_tasks'], 1)
+        self.assertEqual(result['results'][0]['error_type'], 'request_failed')
+        # 每个执行过的任务只记录一次错误
+        self.assertEqual(dict(generator._error_statistics['error_details']), {'failed': len(calls)})
+
+    def test_before_tasks_run_once_per_concurrency(self):
+        """测试before任务按before_concurrent执行对应次数，不会重复执行"""
+        for before_concurrent in (1, 3):
+            calls = []
+            config = dict(self.config, before_concurrent=before_concurrent)
+            generator = LoadGenerator(config, self.metrics_collector)
+            generator._execute_before_tasks(lambda: calls.append(1) or {'success': True})
+
+            self.assertEqual(len(calls), before_concurrent)
+            self.assertEqual(len(generator._before_results), before_concurrent)
+            self.assertTrue(generator._before_tasks_completed)
 
 
 class TestMetricsCollector(unittest.TestCase):